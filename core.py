@@ -2,12 +2,31 @@
 Dungeon & Wallets - Core Module
 BIP39 mnemonic generation from various entropy sources.
 """
+import asyncio
+import base64
+import bisect
 import hashlib
 import secrets
 import hmac
+import math
+import mmap
 import struct
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+import os
+import stat
+import time
+import queue
+import multiprocessing
+import threading
+import unicodedata
+import csv
+import json
+import functools
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Optional, Callable, Iterator, Iterable, AsyncIterator, TextIO
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
 # ============================================================================
 # DATA CLASSES
@@ -75,6 +94,109 @@ def load_wordlist(path: str) -> List[str]:
     return words
 
 
+# Official BIP39 wordlists, stored next to this module as <language>.txt (NFKD)
+WORDLIST_DIR = os.path.dirname(os.path.abspath(__file__))
+BIP39_LANGUAGES = (
+    "english", "chinese_simplified", "chinese_traditional", "czech", "french",
+    "italian", "japanese", "korean", "portuguese", "spanish",
+)
+
+# Wordlists loaded so far, by language; the others cost no memory
+_WORDLISTS: Dict[str, List[str]] = {}
+_wordlist_lock = threading.Lock()
+
+
+def get_wordlist(language: str = "english") -> List[str]:
+    """
+    BIP39 wordlist of a language, loaded on first use and cached.
+    
+    Raises:
+        ValueError: If the language is not an official BIP39 language
+    """
+    wordlist = _WORDLISTS.get(language)
+    if wordlist is None:
+        if language not in BIP39_LANGUAGES:
+            raise ValueError(f"Unknown wordlist language {language!r}, expected one of {', '.join(BIP39_LANGUAGES)}")
+        with _wordlist_lock:
+            wordlist = _WORDLISTS.get(language)
+            if wordlist is None:
+                wordlist = _WORDLISTS[language] = load_wordlist(os.path.join(WORDLIST_DIR, f"{language}.txt"))
+    return wordlist
+
+
+# Word -> index maps by id() of the wordlist they index (the list is kept to pin its id)
+_WORDLIST_INDEXES: Dict[int, Tuple[List[str], Dict[str, int]]] = {}
+
+
+def wordlist_index(wordlist: List[str]) -> Dict[str, int]:
+    """Word -> index map of a wordlist (built once per list)"""
+    cached = _WORDLIST_INDEXES.get(id(wordlist))
+    if cached is None or cached[0] is not wordlist:
+        if len(_WORDLIST_INDEXES) >= 16:
+            _WORDLIST_INDEXES.clear()
+        cached = _WORDLIST_INDEXES[id(wordlist)] = (wordlist, {word: i for i, word in enumerate(wordlist)})
+    return cached[1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _nfkd_word(word: str) -> str:
+    return unicodedata.normalize("NFKD", word)
+
+
+def _nfkd(text: str) -> str:
+    """NFKD form of a phrase, normalizing each space-separated word once"""
+    if text.isascii():
+        return text
+    return " ".join(_nfkd_word(word) for word in text.split(" "))
+
+
+# Combined word -> {language: index} map over every language, built on first
+# non-English lookup
+_LANGUAGE_INDEX: Optional[Dict[str, Dict[str, int]]] = None
+
+
+def _language_index() -> Dict[str, Dict[str, int]]:
+    global _LANGUAGE_INDEX
+    if _LANGUAGE_INDEX is None:
+        index: Dict[str, Dict[str, int]] = {}
+        for language in BIP39_LANGUAGES:
+            for i, word in enumerate(get_wordlist(language)):
+                index.setdefault(word, {})[language] = i
+        _LANGUAGE_INDEX = index
+    return _LANGUAGE_INDEX
+
+
+def detect_language(mnemonic: str) -> str:
+    """
+    Wordlist language of a mnemonic, in one pass over its words.
+    
+    English phrases are recognized from the English index alone, so the
+    other wordlists are only loaded for non-English phrases. Words shared
+    by several lists (e.g. English and French) resolve to the first
+    language of BIP39_LANGUAGES containing every word.
+    
+    Raises:
+        ValueError: If a word is in no wordlist, or the words share no language
+    """
+    words = _nfkd(mnemonic.strip()).split()
+    if not words:
+        raise ValueError("Empty mnemonic")
+    english = wordlist_index(get_wordlist("english"))
+    if all(word in english for word in words):
+        return "english"
+    
+    index = _language_index()
+    candidates = None
+    for word in words:
+        languages = index.get(word)
+        if languages is None:
+            raise ValueError(f"Unknown word {word!r}")
+        candidates = set(languages) if candidates is None else candidates.intersection(languages)
+        if not candidates:
+            raise ValueError("Mnemonic mixes words from several languages")
+    return next(language for language in BIP39_LANGUAGES if language in candidates)
+
+
 # ============================================================================
 # ENTROPY CONVERSION
 # ============================================================================
@@ -113,47 +235,226 @@ def entropy_to_mnemonic(entropy: bytes, wordlist: List[str]) -> str:
     chunks = [bits[i:i+11] for i in range(0, len(bits), 11)]
     indices = [int(c, 2) for c in chunks]
     
-    return " ".join(wordlist[i] for i in indices)
+    return _separator(wordlist).join(wordlist[i] for i in indices)
+
+
+def _separator(wordlist: List[str]) -> str:
+    """Word separator of a wordlist: BIP39 joins Japanese words with an ideographic space"""
+    return "\u3000" if wordlist[0] == "あいこくしん" else " "
+
+
+def _word_indices(words: List[str], wordlist: List[str]) -> List[int]:
+    """Wordlist indices of words (any Unicode form), raising ValueError on the first unknown word"""
+    index = wordlist_index(wordlist)
+    try:
+        return [index[w] if w in index else index[_nfkd_word(w)] for w in words]
+    except KeyError as e:
+        raise ValueError(f"Unknown word {e.args[0]!r}") from None
+
+
+def mnemonic_to_entropy(mnemonic: str, wordlist: Optional[List[str]] = None) -> bytes:
+    """
+    Recover the entropy bytes of a BIP39 mnemonic phrase.
+    
+    Args:
+        mnemonic: Space-separated mnemonic phrase
+        wordlist: BIP39 wordlist (default: detected with detect_language)
+        
+    Returns:
+        Entropy bytes (16, 20, 24, 28, or 32 bytes)
+        
+    Raises:
+        ValueError: If the word count, a word or the checksum is invalid
+    """
+    words = mnemonic.strip().split()
+    if len(words) not in (12, 15, 18, 21, 24):
+        raise ValueError(f"Mnemonic must have 12/15/18/21/24 words, got {len(words)}")
+    if wordlist is None:
+        wordlist = get_wordlist(detect_language(mnemonic))
+    
+    # Words -> one integer of 11 bits per word, then entropy || checksum
+    value = 0
+    for i in _word_indices(words, wordlist):
+        value = (value << 11) | i
+    entropy, valid = _unpack_mnemonic(value, len(words))
+    if not valid:
+        raise ValueError("Invalid mnemonic checksum")
+    return entropy
+
 
+def _unpack_mnemonic(value: int, count: int) -> Tuple[bytes, bool]:
+    """Entropy of count packed 11-bit word indices, and whether its checksum matches"""
+    cs_len = count * 11 // 33
+    entropy = (value >> cs_len).to_bytes((count * 11 - cs_len) // 8, 'big')
+    valid = hashlib.sha256(entropy).digest()[0] >> (8 - cs_len) == value & ((1 << cs_len) - 1)
+    return entropy, valid
 
-def validate_mnemonic(mnemonic: str, wordlist: List[str]) -> bool:
+
+def validate_mnemonic(mnemonic: str, wordlist: Optional[List[str]] = None) -> bool:
     """
     Validate a BIP39 mnemonic phrase.
     
     Args:
         mnemonic: Space-separated mnemonic phrase
-        wordlist: BIP39 wordlist
+        wordlist: BIP39 wordlist (default: detected with detect_language)
         
     Returns:
         True if valid, False otherwise
     """
-    words = mnemonic.strip().split()
-    
-    # Check word count
-    if len(words) not in (12, 15, 18, 21, 24):
+    try:
+        mnemonic_to_entropy(mnemonic, wordlist)
+    except ValueError:
         return False
+    return True
+
+
+# Every possible last entropy byte, so candidates need no bytes() call
+_SINGLE_BYTES = [bytes([i]) for i in range(256)]
+
+
+def valid_final_words(partial_words, wordlist: List[str]) -> List[str]:
+    """
+    Every last word that completes a phrase into a valid BIP39 mnemonic.
     
-    # Check all words are in wordlist
-    word_set = set(wordlist)
-    if not all(w in word_set for w in words):
-        return False
+    The last word holds 11 - CS free entropy bits followed by the CS-bit
+    checksum, so there are 2**(11 - CS) answers: 128 for 12 words, 8 for 24.
+    The free bits always fall in the last entropy byte, so the SHA-256 state
+    of the other bytes is computed once and each candidate costs one copy
+    and a one-byte update.
+    
+    Args:
+        partial_words: The first 11/14/17/20/23 words (list or space-separated string)
+        wordlist: BIP39 wordlist
+        
+    Returns:
+        Valid final words, in wordlist order
+        
+    Raises:
+        ValueError: If the word count or a word is invalid
+    """
+    words = partial_words.split() if isinstance(partial_words, str) else list(partial_words)
+    if len(words) + 1 not in (12, 15, 18, 21, 24):
+        raise ValueError(f"Expected 11/14/17/20/23 words, got {len(words)}")
+    
+    known = 0
+    for i in _word_indices(words, wordlist):
+        known = (known << 11) | i
+    cs_len = (len(words) + 1) * 11 // 33
+    free_bits = 11 - cs_len
+    ent_bytes = ((len(words) + 1) * 11 - cs_len) // 8
+    
+    # entropy = known << free_bits | v: everything but the last byte is fixed
+    prefix = hashlib.sha256((known >> (8 - free_bits)).to_bytes(ent_bytes - 1, 'big'))
+    high = (known << free_bits) & 0xFF
+    shift = 8 - cs_len
+    
+    finals = []
+    for v in range(1 << free_bits):
+        h = prefix.copy()
+        h.update(_SINGLE_BYTES[high | v])
+        finals.append(wordlist[(v << cs_len) | (h.digest()[0] >> shift)])
+    return finals
+
+
+class WordCompleter:
+    """
+    Prefix lookups over a BIP39 wordlist (sorted array + bisect, built once).
+    
+    BIP39 words are unique in their first four letters, so any typed prefix
+    of four letters or more stands for at most one word.
+    """
+    
+    UNIQUE_PREFIX = 4
+    
+    def __init__(self, wordlist: List[str]):
+        self.words = sorted(wordlist)
+    
+    def matches(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Words starting with prefix, in sorted order"""
+        words = self.words
+        i = bisect.bisect_left(words, prefix)
+        found = []
+        while i < len(words) and words[i].startswith(prefix) and (limit is None or len(found) < limit):
+            found.append(words[i])
+            i += 1
+        return found
+    
+    def resolve(self, token: str) -> Optional[str]:
+        """The word a typed token stands for (exact word or unambiguous prefix), or None"""
+        found = self.matches(token, 2)
+        if found and (found[0] == token or len(found) == 1):
+            return found[0]
+        return None
+
+
+class MnemonicBuilder:
+    """
+    A mnemonic entered word by word, with an incremental checksum.
+    
+    Every prefix of the phrase is kept packed as one integer, so editing the
+    end of the phrase only repacks the changed words, and checking the
+    checksum at 12/15/18/21/24 words costs one SHA-256.
+    """
     
-    # Convert words to indices, then to bits
-    indices = [wordlist.index(w) for w in words]
-    bits = "".join(f"{i:011b}" for i in indices)
+    def __init__(self, wordlist: List[str]):
+        self._index = wordlist_index(wordlist)
+        self.words: List[str] = []
+        self._packed = [0]
+    
+    @property
+    def mnemonic(self) -> str:
+        return " ".join(self.words)
+    
+    def push(self, word: str) -> None:
+        """
+        Append a word.
+        
+        Raises:
+            ValueError: If the word is not in the wordlist
+        """
+        i = self._index.get(word)
+        if i is None:
+            raise ValueError(f"Unknown word {word!r}")
+        self.words.append(word)
+        self._packed.append((self._packed[-1] << 11) | i)
     
-    # Split entropy and checksum
-    ent_len = len(words) * 11 * 32 // 33
-    ent_bits = bits[:ent_len]
-    cs_bits = bits[ent_len:]
+    def pop(self) -> str:
+        """Remove and return the last word"""
+        self._packed.pop()
+        return self.words.pop()
     
-    # Reconstruct entropy bytes
-    entropy = bytes(int(ent_bits[i:i+8], 2) for i in range(0, ent_len, 8))
+    def set_words(self, words: List[str]) -> None:
+        """
+        Replace the phrase, keeping the prefix it shares with the current one.
+        
+        Raises:
+            ValueError: If a word is not in the wordlist
+        """
+        common = 0
+        while common < min(len(words), len(self.words)) and words[common] == self.words[common]:
+            common += 1
+        while len(self.words) > common:
+            self.pop()
+        for word in words[common:]:
+            self.push(word)
     
-    # Verify checksum
-    expected_cs = bytes_to_bits(hashlib.sha256(entropy).digest())[:len(cs_bits)]
+    @property
+    def checksum_valid(self) -> Optional[bool]:
+        """Whether the checksum matches, or None while the word count is not a mnemonic length"""
+        if len(self.words) not in (12, 15, 18, 21, 24):
+            return None
+        return _unpack_mnemonic(self._packed[-1], len(self.words))[1]
     
-    return cs_bits == expected_cs
+    def entropy(self) -> bytes:
+        """
+        Entropy of the phrase.
+        
+        Raises:
+            ValueError: If the word count or checksum is invalid
+        """
+        if self.checksum_valid is not True:
+            raise ValueError("Incomplete or invalid mnemonic")
+        return _unpack_mnemonic(self._packed[-1], len(self.words))[0]
 
 
 # ============================================================================
@@ -268,6 +569,44 @@ def process_dice_roll(d20: int, d100: int) -> DiceRollResult:
         )
 
 
+_ROLL_SEPARATORS = str.maketrans(",;/|\t\n", "      ")
+
+
+def parse_roll_pairs(text: str, partial: bool = False) -> List[Tuple[int, int]]:
+    """
+    Parse a fast-entry line of D20/d100 pairs.
+    
+    Numbers are read two by two; commas, semicolons, slashes and
+    whitespace all separate them ("17 42, 3 88, 20 05" or "17/42 3/88").
+    
+    Args:
+        text: Fast-entry line
+        partial: Line still being typed: ignore an unpaired trailing D20
+        
+    Returns:
+        List of (d20, d100) pairs
+        
+    Raises:
+        ValueError: On a non-numeric token, an out-of-range roll or (unless
+            partial) an unpaired trailing D20
+    """
+    tokens = text.translate(_ROLL_SEPARATORS).split()
+    pairs = []
+    for i in range(0, len(tokens) - 1, 2):
+        d20, d100 = tokens[i], tokens[i + 1]
+        if not (d20.isdigit() and d100.isdigit()):
+            raise ValueError(f"Roll #{i // 2 + 1}: {d20} {d100} is not a number pair")
+        d20, d100 = int(d20), int(d100)
+        if not (1 <= d20 <= 20):
+            raise ValueError(f"Roll #{i // 2 + 1}: D20 must be 1-20, got {d20}")
+        if not (0 <= d100 <= 99):
+            raise ValueError(f"Roll #{i // 2 + 1}: d100 must be 0-99, got {d100}")
+        pairs.append((d20, d100))
+    if len(tokens) % 2 and not partial:
+        raise ValueError(f"Roll #{len(pairs) + 1}: D20 {tokens[-1]} has no d100")
+    return pairs
+
+
 def process_n_value(n: int) -> DiceRollResult:
     """
     Process a pre-computed N value (0-1999) for entropy.
@@ -315,6 +654,10 @@ class DiceEntropyCollector:
         self._bytes: List[int] = []
         self._total_rolls = 0
         self._rejected_rolls = 0
+        # Every roll of the session, one byte per column entry
+        self._d20 = array('B')
+        self._d100 = array('B')
+        self._accepted = array('B')
     
     @property
     def is_complete(self) -> bool:
@@ -350,6 +693,7 @@ class DiceEntropyCollector:
         
         result = process_dice_roll(d20, d100)
         self._total_rolls += 1
+        self._record(d20, d100, result.accepted)
         
         if result.accepted:
             self._bytes.append(result.byte_value)
@@ -373,6 +717,7 @@ class DiceEntropyCollector:
         
         result = process_n_value(n)
         self._total_rolls += 1
+        self._record(n // 100 + 1, n % 100, result.accepted)
         
         if result.accepted:
             self._bytes.append(result.byte_value)
@@ -381,6 +726,46 @@ class DiceEntropyCollector:
         
         return result
     
+    def _record(self, d20: int, d100: int, accepted: bool) -> None:
+        self._d20.append(d20)
+        self._d100.append(d100)
+        self._accepted.append(accepted)
+    
+    def recent_rolls(self, count: int) -> List[Tuple[int, int, int, bool]]:
+        """
+        Last rolls of the session, oldest first.
+        
+        N values are recorded as the D20/d100 pair they encode.
+        
+        Args:
+            count: Number of rolls wanted
+            
+        Returns:
+            List of (roll number, d20, d100, accepted)
+        """
+        start = max(0, len(self._d20) - count)
+        return [
+            (i + 1, self._d20[i], self._d100[i], bool(self._accepted[i]))
+            for i in range(start, len(self._d20))
+        ]
+    
+    def add_rolls(self, pairs: Iterable[Tuple[int, int]]) -> List[DiceRollResult]:
+        """
+        Add a batch of D20 + d100 rolls, stopping once complete.
+        
+        Args:
+            pairs: (d20, d100) pairs, e.g. from parse_roll_pairs()
+            
+        Returns:
+            DiceRollResult of each roll used (rolls past completion are ignored)
+        """
+        results = []
+        for d20, d100 in pairs:
+            if self.is_complete:
+                break
+            results.append(self.add_roll(d20, d100))
+        return results
+    
     def get_entropy(self) -> bytes:
         """
         Get collected entropy bytes.
@@ -402,178 +787,4828 @@ class DiceEntropyCollector:
         self._bytes = []
         self._total_rolls = 0
         self._rejected_rolls = 0
-
+        self._d20 = array('B')
+        self._d100 = array('B')
+        self._accepted = array('B')
 
 # ============================================================================
-# KEY DERIVATION (BIP32/BIP44)
+# DICE SCHEME SIMULATION
 # ============================================================================
 
-def mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
+# Optional: vectorized simulation; a pure-Python loop is used otherwise
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+@dataclass
+class DiceScheme:
     """
-    Convert mnemonic to BIP39 seed using PBKDF2.
+    A dice setup for entropy rolls.
+    
+    One roll throws every die; the faces (0-based, first die most
+    significant) form a mixed-radix number N in [0, outcomes). Like
+    process_n_value, a roll is accepted if N is below the largest multiple
+    of 2**bits, and then yields N % 2**bits.
+    """
+    name: str
+    dice: Tuple[int, ...]
+    bits: int
+    
+    @property
+    def outcomes(self) -> int:
+        return math.prod(self.dice)
+    
+    @property
+    def threshold(self) -> int:
+        return (self.outcomes >> self.bits) << self.bits
+    
+    @property
+    def acceptance(self) -> float:
+        return self.threshold / self.outcomes
+    
+    @property
+    def bits_per_roll(self) -> float:
+        """Expected entropy bits per roll, rejections included"""
+        return self.bits * self.acceptance
+    
+    def accepted_needed(self, entropy_bytes: int) -> int:
+        """Accepted rolls needed for entropy_bytes"""
+        return -(-8 * entropy_bytes // self.bits)
+    
+    def extract(self, n: int) -> Optional[int]:
+        """Value of a roll N, or None if rejected"""
+        return n % (1 << self.bits) if n < self.threshold else None
+
+
+def best_extraction_bits(outcomes: int) -> int:
+    """Bits per accepted roll maximizing the expected bits per roll"""
+    return max(
+        range(1, outcomes.bit_length()),
+        key=lambda bits: bits * ((outcomes >> bits) << bits),
+    )
+
+
+def parse_dice_scheme(spec: str) -> DiceScheme:
+    """
+    Parse a dice setup such as "d20+d100", "3d6" or "d10x4".
     
     Args:
-        mnemonic: Space-separated mnemonic phrase
-        passphrase: Optional passphrase
+        spec: Dice terms joined by "+": "dK", "NdK" or "dKxN"
         
     Returns:
-        64-byte seed
+        DiceScheme extracting the best number of bits per roll (8 bits for
+        D20+d100, as DiceEntropyCollector does)
+        
+    Raises:
+        ValueError: If the spec is malformed
     """
-    mnemonic_bytes = mnemonic.encode('utf-8')
-    salt = ('mnemonic' + passphrase).encode('utf-8')
-    return hashlib.pbkdf2_hmac('sha512', mnemonic_bytes, salt, 2048)
+    dice = []
+    for term in spec.lower().replace(" ", "").split("+"):
+        count, _, faces = term.partition("d")
+        faces, _, repeat = faces.partition("x")
+        if not faces.isdigit() or (count and not count.isdigit()) or (repeat and not repeat.isdigit()):
+            raise ValueError(f"Invalid dice term {term!r} (expected dK, NdK or dKxN)")
+        n = int(count or 1) * int(repeat or 1)
+        if int(faces) < 2 or n < 1:
+            raise ValueError(f"Invalid dice term {term!r}")
+        dice += [int(faces)] * n
+    scheme = DiceScheme(spec, tuple(dice), 0)
+    if scheme.outcomes < 2:
+        raise ValueError(f"Dice setup {spec!r} has a single outcome")
+    scheme.bits = best_extraction_bits(scheme.outcomes)
+    return scheme
 
 
-def _hmac_sha512(key: bytes, data: bytes) -> bytes:
-    """HMAC-SHA512"""
-    return hmac.new(key, data, hashlib.sha512).digest()
+# Setups compared by default; "d20+d100" is the ritual's own scheme
+DICE_SCHEMES = {
+    spec: parse_dice_scheme(spec)
+    for spec in ("d20+d100", "d10x4", "5d6", "3d6", "d100", "d20", "d6")
+}
 
 
-def _derive_key(parent_key: bytes, parent_chain: bytes, index: int) -> Tuple[bytes, bytes]:
-    """BIP32 hardened key derivation"""
-    if index >= 0x80000000:  # Hardened
-        data = b'\x00' + parent_key + struct.pack('>I', index)
-    else:
-        data = b'\x00' + parent_key + struct.pack('>I', index)
+def reference_scheme_agrees() -> bool:
+    """Check DICE_SCHEMES["d20+d100"] against process_dice_roll on every outcome"""
+    scheme = DICE_SCHEMES["d20+d100"]
+    for d20 in range(1, 21):
+        for d100 in range(100):
+            result = process_dice_roll(d20, d100)
+            value = scheme.extract((d20 - 1) * 100 + d100)
+            if result.accepted != (value is not None) or (value is not None and value != result.byte_value):
+                return False
+    return True
+
+
+@dataclass
+class DiceSimulation:
+    """Rolls needed per session for one scheme and entropy size"""
+    scheme: str
+    dice: int
+    entropy_bytes: int
+    bits: int
+    accepted_needed: int
+    sessions: int
+    mean_rolls: float
+    p95_rolls: int
+    p99_rolls: int
+    expected_mean: float
+    expected_p95: int
+    expected_p99: int
+    acceptance: float
+    expected_acceptance: float
+    acceptance_z: float
+    backend: str
+    elapsed: float
+    
+    @property
+    def rate(self) -> float:
+        """Simulated sessions per second"""
+        return self.sessions / self.elapsed if self.elapsed > 0 else 0.0
     
-    h = _hmac_sha512(parent_chain, data)
-    return h[:32], h[32:]
+    @property
+    def acceptance_ok(self) -> bool:
+        """Observed acceptance within 4 standard errors of theory"""
+        return abs(self.acceptance_z) < 4.0
 
 
-def derive_key_from_path(seed: bytes, path: str) -> bytes:
+def _rolls_quantiles(r: int, p: float, qs: Tuple[float, ...]) -> List[int]:
+    """Exact quantiles of the rolls needed for r acceptances (negative binomial)"""
+    q = 1.0 - p
+    pmf = p ** r      # P(no rejection)
+    cdf = pmf
+    k = 0
+    out = []
+    for target in qs:
+        while cdf < target and pmf > 0.0:
+            pmf *= q * (k + r) / (k + 1)
+            k += 1
+            cdf += pmf
+        out.append(r + k)
+    return out
+
+
+def _quantile(sorted_values: List[int], q: float) -> int:
+    """Smallest value with at least a fraction q of the values at or below it"""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+_SIM_BLOCK = 1 << 18
+
+
+def _simulate_numpy(scheme: DiceScheme, r: int, sessions: int, seed: Optional[int]):
+    """Session roll counts and (accepted, drawn) totals, a block of sessions at a time"""
+    rng = np.random.default_rng(seed)
+    p = scheme.acceptance
+    # Rolls drawn per session and pass: covers nearly every session at once
+    width = int(r / p + 6 * math.sqrt(r * (1 - p)) / p) + 4
+    # N of fair dice is uniform over the outcomes: one draw per roll, in the
+    # narrowest dtype (several times faster than a draw per die)
+    dtype = np.uint16 if scheme.outcomes <= 1 << 16 else np.int64
+    rolls = np.empty(sessions, dtype=np.int64)
+    accepted_total = drawn_total = 0
+    for start in range(0, sessions, _SIM_BLOCK):
+        pending = np.arange(start, min(start + _SIM_BLOCK, sessions))
+        have = np.zeros(len(pending), dtype=np.int32)
+        used = 0
+        while len(pending):
+            # Roll i of every pending session is row i: each step is one
+            # contiguous vector operation across the sessions
+            ok = rng.integers(0, scheme.outcomes, size=(width, len(pending)), dtype=dtype) < scheme.threshold
+            accepted_total += int(np.count_nonzero(ok))
+            drawn_total += ok.size
+            stop = np.full(len(pending), -1, dtype=np.int64)
+            for i in range(width):
+                have += ok[i]
+                # have only grows by one, so this is the r-th acceptance
+                stop[ok[i] & (have == r)] = i
+            done = stop >= 0
+            rolls[pending[done]] = used + stop[done] + 1
+            pending, have = pending[~done], have[~done]
+            used += width
+    return rolls, accepted_total, drawn_total
+
+
+def _simulate_python(scheme: DiceScheme, r: int, sessions: int, seed: Optional[int]):
+    """Same as _simulate_numpy, one roll at a time"""
+    import random
+    randrange = random.Random(seed).randrange
+    threshold = scheme.threshold
+    rolls = []
+    accepted_total = drawn_total = 0
+    for _ in range(sessions):
+        have = count = 0
+        while have < r:
+            n = 0
+            for faces in scheme.dice:
+                n = n * faces + randrange(faces)
+            count += 1
+            have += n < threshold
+        rolls.append(count)
+        accepted_total += have
+        drawn_total += count
+    return rolls, accepted_total, drawn_total
+
+
+def simulate_dice_scheme(scheme: DiceScheme, entropy_bytes: int = 16, sessions: int = 1_000_000,
+                         seed: Optional[int] = None, use_numpy: Optional[bool] = None) -> DiceSimulation:
     """
-    Derive private key from seed using BIP32 path.
+    Monte Carlo estimate of the rolls a ceremony needs with a dice setup.
+    
+    Every simulated roll throws each die of the scheme; sessions stop at
+    the accepted rolls needed for entropy_bytes. The results are compared
+    with the exact negative binomial distribution.
     
     Args:
-        seed: BIP39 seed (64 bytes)
-        path: Derivation path (e.g., "m/44'/60'/0'/0/0")
+        scheme: Dice setup (see DICE_SCHEMES / parse_dice_scheme)
+        entropy_bytes: Entropy per session (16 or 32)
+        sessions: Simulated sessions
+        seed: RNG seed, for reproducible runs (not security-relevant)
+        use_numpy: Force or forbid NumPy (default: when installed)
         
     Returns:
-        32-byte private key
+        DiceSimulation
     """
-    # Master key generation
-    h = _hmac_sha512(b"Bitcoin seed", seed)
-    key = h[:32]
-    chain = h[32:]
+    if sessions < 1:
+        raise ValueError("At least one session is required")
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    elif use_numpy and not HAS_NUMPY:
+        raise ValueError("NumPy is not installed")
     
-    # Parse and follow path
-    for part in path.split('/')[1:]:  # Skip 'm'
-        if part.endswith("'"):
-            index = int(part[:-1]) + 0x80000000
-        else:
-            index = int(part)
-        key, chain = _derive_key(key, chain, index)
+    r = scheme.accepted_needed(entropy_bytes)
+    p = scheme.acceptance
+    start = time.perf_counter()
+    if use_numpy:
+        rolls, accepted, drawn = _simulate_numpy(scheme, r, sessions, seed)
+        mean = float(rolls.mean())
+        p95, p99 = (int(v) for v in np.quantile(rolls, (0.95, 0.99), method="inverted_cdf"))
+    else:
+        rolls, accepted, drawn = _simulate_python(scheme, r, sessions, seed)
+        mean = sum(rolls) / sessions
+        rolls.sort()
+        p95, p99 = _quantile(rolls, 0.95), _quantile(rolls, 0.99)
+    elapsed = time.perf_counter() - start
     
-    return key
+    observed = accepted / drawn
+    stderr = math.sqrt(p * (1 - p) / drawn)
+    expected_p95, expected_p99 = _rolls_quantiles(r, p, (0.95, 0.99))
+    return DiceSimulation(
+        scheme=scheme.name,
+        dice=len(scheme.dice),
+        entropy_bytes=entropy_bytes,
+        bits=scheme.bits,
+        accepted_needed=r,
+        sessions=sessions,
+        mean_rolls=mean,
+        p95_rolls=p95,
+        p99_rolls=p99,
+        expected_mean=r / p,
+        expected_p95=expected_p95,
+        expected_p99=expected_p99,
+        acceptance=observed,
+        expected_acceptance=p,
+        acceptance_z=(observed - p) / stderr if stderr else 0.0,
+        backend="numpy" if use_numpy else "python",
+        elapsed=elapsed,
+    )
 
 
 # ============================================================================
-# ADDRESS GENERATION
+# ENTROPY FILE IMPORT
 # ============================================================================
 
-def _base58_encode(data: bytes) -> str:
-    """Base58 encoding for Bitcoin addresses"""
-    alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-    num = int.from_bytes(data, 'big')
-    
-    if num == 0:
-        return alphabet[0]
-    
-    result = ''
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        result = alphabet[remainder] + result
-    
-    # Add leading '1's for leading zero bytes
-    for byte in data:
-        if byte == 0:
-            result = alphabet[0] + result
-        else:
-            break
-    
-    return result
+@dataclass
+class EntropyImportResult:
+    """Outcome of conditioning an entropy file"""
+    entropy: bytes
+    mode: str               # "condition" (HKDF-SHA256) or "dice" (rejection sampling)
+    fmt: str                # "binary", "hex" or "text"
+    bytes_processed: int    # Raw file bytes consumed
+    elapsed: float
+    min_entropy: float      # Estimated bits per input symbol (byte, or N value in dice mode)
+    symbols: int            # Input symbols consumed
+    rolls_rejected: int = 0
+
+    @property
+    def rate(self) -> float:
+        """Raw file bytes processed per second"""
+        return self.bytes_processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def total_min_entropy(self) -> float:
+        """Estimated min-entropy of everything consumed, in bits"""
+        return self.min_entropy * self.symbols
 
 
-def private_key_to_eth_address(private_key: bytes) -> str:
+_IMPORT_CHUNK = 1 << 20
+_HKDF_SALT = b"Dungeon & Wallets entropy import"
+_HKDF_INFO = b"BIP39 entropy"
+_HEX_CHARS = frozenset(b"0123456789abcdefABCDEF \t\r\n")
+_WHITESPACE = b" \t\r\n"
+# Blocks sampled for the min-entropy estimate (a histogram runs ~50x slower than the hash)
+_ESTIMATE_BLOCK = 4096
+_ESTIMATE_LIMIT = 1 << 20
+
+
+def _mcv_min_entropy(counts, n: int) -> float:
     """
-    Convert private key to Ethereum address.
-    
-    Note: This is a simplified implementation. For production,
-    use proper secp256k1 library to derive public key.
+    Most-common-value min-entropy estimate, in bits per symbol (NIST SP 800-90B 6.3.1).
     
-    Args:
-        private_key: 32-byte private key
-        
-    Returns:
-        Ethereum address with 0x prefix
+    The frequency of the most common symbol is raised to its 99% upper
+    confidence bound, so small samples give conservative estimates.
     """
-    # Simplified: hash the private key 
-    # In production, derive public key via secp256k1 and keccak256
-    pub_hash = hashlib.sha256(private_key).digest()
-    address = '0x' + pub_hash[-20:].hex()
-    return address
+    if n < 2:
+        return 0.0
+    p = max(counts) / n
+    p_upper = min(1.0, p + 2.576 * math.sqrt(p * (1 - p) / (n - 1)))
+    return -math.log2(p_upper)
 
 
-def private_key_to_btc_address(private_key: bytes) -> str:
+def _hkdf_sha256_expand(prk: bytes, info: bytes, length: int) -> bytes:
+    """HKDF-Expand (RFC 5869) with HMAC-SHA256"""
+    okm = b""
+    block = b""
+    counter = 1
+    while len(okm) < length:
+        block = hmac.digest(prk, block + info + bytes([counter]), 'sha256')
+        okm += block
+        counter += 1
+    return okm[:length]
+
+
+def _file_chunks(view: mmap.mmap, fmt: str, chunk_size: int) -> Iterator[Tuple[int, bytes]]:
+    """(raw bytes consumed, decoded bytes) per chunk of a mapped binary or hex file"""
+    carry = b""
+    for start in range(0, len(view), chunk_size):
+        raw = view[start:start + chunk_size]
+        if fmt == "binary":
+            yield len(raw), raw
+            continue
+        digits = carry + raw.translate(None, _WHITESPACE)
+        if start == 0 and digits[:2].lower() == b"0x":
+            digits = digits[2:]
+        cut = len(digits) & ~1
+        carry = digits[cut:]
+        yield len(raw), bytes.fromhex(digits[:cut].decode('ascii'))
+    if carry:
+        raise ValueError("Hex file has an odd number of digits")
+
+
+def _detect_file_format(view: mmap.mmap) -> str:
+    head = view[:4096]
+    if head[:2].lower() == b"0x":
+        head = head[2:]
+    return "hex" if all(c in _HEX_CHARS for c in head) else "binary"
+
+
+def import_entropy_file(
+    path: str,
+    length: int = 16,
+    mode: str = "condition",
+    fmt: Optional[str] = None,
+    chunk_size: int = _IMPORT_CHUNK,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> EntropyImportResult:
     """
-    Convert private key to Bitcoin P2PKH address.
+    Turn a raw entropy dump (hardware RNG, dice rig) into BIP39 entropy.
     
-    Note: This is a simplified implementation. For production,
-    use proper secp256k1 library to derive public key.
+    The file is memory-mapped and streamed chunk by chunk, never loaded whole.
+    
+    - "condition": binary or hex data goes through an incremental HKDF-SHA256
+      (extract over the whole stream, then expand to length bytes). The
+      estimated input min-entropy must cover the output plus 64 bits
+      (the SP 800-90B full-entropy margin).
+    - "dice": text of N values (0-1999, separated by spaces, commas or
+      newlines) goes through DiceEntropyCollector's rejection sampling;
+      reading stops as soon as enough bytes are accepted.
     
     Args:
-        private_key: 32-byte private key
+        path: File to import
+        length: Entropy bytes to produce (16, 20, 24, 28 or 32)
+        mode: "condition" or "dice"
+        fmt: "binary" or "hex" in condition mode (default: detected)
+        chunk_size: Bytes mapped per step
+        progress: Optional callback(bytes_processed, file_size)
         
     Returns:
-        Bitcoin address (P2PKH format)
+        EntropyImportResult
+        
+    Raises:
+        ValueError: If the file is empty, malformed or holds too little entropy
     """
-    # Simplified version
-    pubkey_hash = hashlib.new(
-        'ripemd160', 
-        hashlib.sha256(private_key).digest()
-    ).digest()
+    if length not in (16, 20, 24, 28, 32):
+        raise ValueError("Entropy length must be 16/20/24/28/32 bytes (128..256 bits).")
+    if mode not in ("condition", "dice"):
+        raise ValueError(f"Unknown import mode {mode!r}, expected 'condition' or 'dice'")
+    
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("Entropy file is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if mode == "dice":
+                result = _import_dice(view, length, chunk_size, progress)
+            else:
+                result = _import_condition(view, length, fmt or _detect_file_format(view), chunk_size, progress)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _import_condition(view: mmap.mmap, length: int, fmt: str, chunk_size: int, progress) -> EntropyImportResult:
+    if fmt not in ("binary", "hex"):
+        raise ValueError(f"Unknown file format {fmt!r}, expected 'binary' or 'hex'")
+    extract = hmac.new(_HKDF_SALT, digestmod='sha256')
+    counts = [0] * 256
+    processed = symbols = sampled = 0
+    # Sample evenly spaced blocks: the file size bounds the decoded size
+    stride = max(_ESTIMATE_BLOCK, len(view) // (_ESTIMATE_LIMIT // _ESTIMATE_BLOCK))
+    
+    for raw_len, data in _file_chunks(view, fmt, chunk_size):
+        extract.update(data)
+        for offset in range(-symbols % stride, len(data), stride):
+            block = data[offset:offset + _ESTIMATE_BLOCK]
+            for value, count in Counter(block).items():
+                counts[value] += count
+            sampled += len(block)
+        symbols += len(data)
+        processed += raw_len
+        if progress:
+            progress(processed, len(view))
+    
+    min_entropy = _mcv_min_entropy(counts, sampled)
+    needed = length * 8 + 64
+    if min_entropy * symbols < needed:
+        raise ValueError(
+            f"Not enough entropy in file: estimated {min_entropy * symbols:.0f} bits, need {needed}"
+        )
+    return EntropyImportResult(
+        entropy=_hkdf_sha256_expand(extract.digest(), _HKDF_INFO, length),
+        mode="condition",
+        fmt=fmt,
+        bytes_processed=processed,
+        elapsed=0.0,
+        min_entropy=min_entropy,
+        symbols=symbols,
+    )
+
+
+def _import_dice(view: mmap.mmap, length: int, chunk_size: int, progress) -> EntropyImportResult:
+    collector = DiceEntropyCollector(bytes_needed=length)
+    counts = [0] * 2000
+    processed = 0
+    carry = b""
     
-    # Version byte (0x00 for mainnet P2PKH)
-    versioned = b'\x00' + pubkey_hash
-    checksum = hashlib.sha256(hashlib.sha256(versioned).digest()).digest()[:4]
+    for start in range(0, len(view), chunk_size):
+        raw = view[start:start + chunk_size]
+        tokens = (carry + raw.replace(b",", b" ")).split()
+        # A token touching the chunk end may continue in the next chunk
+        carry = tokens.pop() if tokens and not raw[-1:].isspace() and raw[-1:] != b"," else b""
+        for token in tokens:
+            if not token.isdigit():
+                raise ValueError(f"Invalid dice value {token.decode('latin-1')!r}")
+            n = int(token)
+            collector.add_n_value(n)
+            counts[n] += 1
+            if collector.is_complete:
+                break
+        processed = start + len(raw)
+        if progress:
+            progress(processed, len(view))
+        if collector.is_complete:
+            break
     
-    return _base58_encode(versioned + checksum)
+    if not collector.is_complete and carry:
+        if not carry.isdigit():
+            raise ValueError(f"Invalid dice value {carry.decode('latin-1')!r}")
+        collector.add_n_value(int(carry))
+        counts[int(carry)] += 1
+    if not collector.is_complete:
+        stats = collector.stats
+        raise ValueError(
+            f"Not enough dice values: {stats.bytes_collected}/{length} bytes accepted "
+            f"from {stats.total_rolls} values"
+        )
+    stats = collector.stats
+    return EntropyImportResult(
+        entropy=collector.get_entropy(),
+        mode="dice",
+        fmt="text",
+        bytes_processed=processed,
+        elapsed=0.0,
+        min_entropy=_mcv_min_entropy(counts, stats.total_rolls),
+        symbols=stats.total_rolls,
+        rolls_rejected=stats.rejected_rolls,
+    )
 
 
-def derive_wallet_info(mnemonic: str) -> List[WalletInfo]:
+# ============================================================================
+# ENTROPY PIPELINE
+# ============================================================================
+
+class EntropySource(ABC):
     """
-    Derive wallet addresses from mnemonic.
+    Interface of the async entropy pipeline.
     
-    Args:
-        mnemonic: BIP39 mnemonic phrase
-        
-    Returns:
-        List of WalletInfo for supported chains
+    A source yields entropy bytes from the async generator chunks(), as they
+    become available. Sources are pulled by collect_entropy(), so fast
+    machine sources (files, bulk values) only run as far as the collector
+    needs, while slow human sources (dice) simply await their next roll.
+    A subclass without chunks() cannot be instantiated.
     """
-    seed = mnemonic_to_seed(mnemonic)
-    wallets = []
     
-    # Ethereum (BIP44: m/44'/60'/0'/0/0)
-    eth_key = derive_key_from_path(seed, "m/44'/60'/0'/0/0")
-    eth_address = private_key_to_eth_address(eth_key)
-    wallets.append(WalletInfo(
-        chain="Ethereum",
-        address=eth_address,
-        path="m/44'/60'/0'/0/0",
-        explorer_url=f"https://etherscan.io/address/{eth_address}"
-    ))
-    
-    # Bitcoin (BIP44: m/44'/0'/0'/0/0)
-    btc_key = derive_key_from_path(seed, "m/44'/0'/0'/0/0")
-    btc_address = private_key_to_btc_address(btc_key)
-    wallets.append(WalletInfo(
-        chain="Bitcoin",
-        address=btc_address,
-        path="m/44'/0'/0'/0/0",
-        explorer_url=f"https://www.blockchain.com/explorer/addresses/btc/{btc_address}"
-    ))
+    name = "source"
     
-    return wallets
+    @abstractmethod
+    def chunks(self) -> AsyncIterator[bytes]:
+        """Entropy bytes, as they become available"""
+
+
+class RandomSource(EntropySource):
+    """The operating system's CSPRNG"""
+    
+    name = "random"
+    
+    def __init__(self, length: int = 16):
+        self.length = length
+    
+    async def chunks(self) -> AsyncIterator[bytes]:
+        yield random_entropy(self.length)
+
+
+class HexSource(EntropySource):
+    """Entropy typed as hex"""
+    
+    name = "hex"
+    
+    def __init__(self, hex_string: str):
+        self.entropy = hex_to_entropy(hex_string)
+    
+    async def chunks(self) -> AsyncIterator[bytes]:
+        yield self.entropy
+
+
+class NValueSource(EntropySource):
+    """Pre-computed N values (0-1999) with the dice rejection sampling"""
+    
+    name = "bulk-n"
+    
+    # Accepted bytes handed over per step, yielding to the event loop in between
+    BATCH = 64
+    
+    def __init__(self, values: Iterable[int]):
+        self.values = values
+        self.total = 0
+        self.rejected = 0
+    
+    async def chunks(self) -> AsyncIterator[bytes]:
+        batch = bytearray()
+        for n in self.values:
+            result = process_n_value(n)
+            self.total += 1
+            if result.accepted:
+                batch.append(result.byte_value)
+                if len(batch) >= self.BATCH:
+                    yield bytes(batch)
+                    batch.clear()
+            else:
+                self.rejected += 1
+        if batch:
+            yield bytes(batch)
+
+
+class DiceSource(EntropySource):
+    """
+    Interactive dice rolls, pushed one at a time.
+    
+    add_roll() / add_n_value() validate and process a roll immediately (so
+    the UI can show the result), and queue its byte if accepted; chunks()
+    awaits the queued bytes.
+    """
+    
+    name = "dice"
+    
+    def __init__(self, bytes_needed: int = 16):
+        self.collector = DiceEntropyCollector(bytes_needed=bytes_needed)
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+    
+    @property
+    def is_complete(self) -> bool:
+        return self.collector.is_complete
+    
+    @property
+    def stats(self) -> EntropyStats:
+        return self.collector.stats
+    
+    def _queued(self, result: DiceRollResult) -> DiceRollResult:
+        if result.accepted:
+            self._queue.put_nowait(bytes([result.byte_value]))
+        return result
+    
+    def add_roll(self, d20: int, d100: int) -> DiceRollResult:
+        """Add a D20 + d100 roll (see DiceEntropyCollector.add_roll)"""
+        return self._queued(self.collector.add_roll(d20, d100))
+    
+    def add_n_value(self, n: int) -> DiceRollResult:
+        """Add a pre-computed N value (see DiceEntropyCollector.add_n_value)"""
+        return self._queued(self.collector.add_n_value(n))
+    
+    def add_rolls(self, pairs: Iterable[Tuple[int, int]]) -> List[DiceRollResult]:
+        """Add a batch of rolls (see DiceEntropyCollector.add_rolls), queued as one chunk"""
+        results = self.collector.add_rolls(pairs)
+        chunk = bytes(r.byte_value for r in results if r.accepted)
+        if chunk:
+            self._queue.put_nowait(chunk)
+        return results
+    
+    def close(self) -> None:
+        """End the source early (the pending collect_entropy fails)"""
+        self._queue.put_nowait(None)
+    
+    async def chunks(self) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self._queue.get()
+            if chunk is None:
+                return
+            yield chunk
+
+
+class FileSource(EntropySource):
+    """An entropy file, imported in a thread (see import_entropy_file)"""
+    
+    name = "file"
+    
+    def __init__(self, path: str, length: int = 16, mode: str = "condition",
+                 progress: Optional[Callable[[int, int], None]] = None):
+        self.path = path
+        self.length = length
+        self.mode = mode
+        self.progress = progress
+        self.result: Optional[EntropyImportResult] = None
+    
+    async def chunks(self) -> AsyncIterator[bytes]:
+        self.result = await asyncio.to_thread(
+            import_entropy_file, self.path, self.length, self.mode, progress=self.progress,
+        )
+        yield self.result.entropy
+
+
+_MIX_SALT = b"Dungeon & Wallets entropy mix"
+
+
+async def _take(source: EntropySource, length: int) -> bytes:
+    """First length bytes of a source"""
+    buf = bytearray()
+    chunks = source.chunks()
+    try:
+        async for chunk in chunks:
+            buf += chunk
+            if len(buf) >= length:
+                return bytes(buf[:length])
+    finally:
+        await chunks.aclose()
+    raise ValueError(f"Entropy source {source.name!r} ended after {len(buf)}/{length} bytes")
+
+
+def lane_share(length: int, lanes: int) -> int:
+    """
+    Bytes each of several lanes must supply so that together they cover length.
+    
+    Args:
+        length: Entropy bytes to produce
+        lanes: Number of parallel sources (operators)
+        
+    Returns:
+        ceil(length / lanes)
+    """
+    if lanes < 1:
+        raise ValueError("At least one lane is required")
+    return -(-length // lanes)
+
+
+async def collect_entropy(sources: List[EntropySource], length: int = 16, combine: str = "hash",
+                          share: Optional[int] = None) -> bytes:
+    """
+    Await length bytes from every source and combine them.
+    
+    Sources are read concurrently; a single source's bytes are returned
+    unchanged. Several sources are combined by:
+    - "xor": XOR of the outputs (as unpredictable as the best independent source)
+    - "hash": HKDF-SHA256 over the length-prefixed outputs
+    
+    With share, each source only supplies share bytes (see lane_share) and
+    the hash merge spreads them over length bytes: N operators each roll
+    1/N of the dice, and none of them alone controls the result.
+    
+    Args:
+        sources: Entropy sources (any mix)
+        length: Entropy bytes to produce
+        combine: "hash" or "xor"
+        share: Bytes read from each source (default: length, "hash" only)
+        
+    Returns:
+        Entropy bytes
+        
+    Raises:
+        ValueError: If a source ends early, the shares don't cover length,
+            or combine is unknown
+    """
+    if not sources:
+        raise ValueError("No entropy source")
+    if combine not in ("hash", "xor"):
+        raise ValueError(f"Unknown combine mode {combine!r}, expected 'hash' or 'xor'")
+    if share is None or share == length:
+        share = length
+    elif combine != "hash" or len(sources) == 1:
+        raise ValueError("Partial shares need the hash combine and several sources")
+    elif share * len(sources) < length:
+        raise ValueError(f"{len(sources)} shares of {share} bytes don't cover {length} bytes")
+    parts = await asyncio.gather(*(_take(source, share) for source in sources))
+    if len(parts) == 1:
+        return parts[0]
+    if combine == "xor":
+        mixed = 0
+        for part in parts:
+            mixed ^= int.from_bytes(part, 'big')
+        return mixed.to_bytes(length, 'big')
+    extract = hmac.new(_MIX_SALT, digestmod='sha256')
+    for part in parts:
+        extract.update(_varint(len(part)) + part)
+    return _hkdf_sha256_expand(extract.digest(), _HKDF_INFO, length)
+
+
+# ============================================================================
+# HASH FUNCTIONS
+# ============================================================================
+
+def _sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+_RMD_R1 = [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
+    1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13,
+]
+_RMD_R2 = [
+    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
+    6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
+    8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11,
+]
+_RMD_S1 = [
+    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
+    7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
+    11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6,
+]
+_RMD_S2 = [
+    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
+    9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
+    15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11,
+]
+_RMD_K1 = [0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E]
+_RMD_K2 = [0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000]
+_MASK32 = 0xFFFFFFFF
+
+
+def _rmd_f(j: int, x: int, y: int, z: int) -> int:
+    if j == 0:
+        return x ^ y ^ z
+    if j == 1:
+        return (x & y) | (~x & z)
+    if j == 2:
+        return (x | ~y) ^ z
+    if j == 3:
+        return (x & z) | (y & ~z)
+    return x ^ (y | ~z)
+
+
+def _rol32(v: int, n: int) -> int:
+    return ((v << n) | (v >> (32 - n))) & _MASK32
+
+
+def _ripemd160_python(data: bytes) -> bytes:
+    """Pure-Python RIPEMD-160 (hashlib may lack it on OpenSSL 3 builds)"""
+    h = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]
+    msg = bytearray(data)
+    msg.append(0x80)
+    msg.extend(b'\x00' * ((55 - len(data)) % 64))
+    msg.extend(struct.pack('<Q', (len(data) * 8) & 0xFFFFFFFFFFFFFFFF))
+    
+    for off in range(0, len(msg), 64):
+        x = struct.unpack('<16I', msg[off:off + 64])
+        al, bl, cl, dl, el = h
+        ar, br, cr, dr, er = h
+        for j in range(80):
+            rnd = j >> 4
+            t = (_rol32((al + _rmd_f(rnd, bl, cl, dl) + x[_RMD_R1[j]] + _RMD_K1[rnd]) & _MASK32, _RMD_S1[j]) + el) & _MASK32
+            al, el, dl, cl, bl = el, dl, _rol32(cl, 10), bl, t
+            t = (_rol32((ar + _rmd_f(4 - rnd, br, cr, dr) + x[_RMD_R2[j]] + _RMD_K2[rnd]) & _MASK32, _RMD_S2[j]) + er) & _MASK32
+            ar, er, dr, cr, br = er, dr, _rol32(cr, 10), br, t
+        h = [
+            (h[1] + cl + dr) & _MASK32,
+            (h[2] + dl + er) & _MASK32,
+            (h[3] + el + ar) & _MASK32,
+            (h[4] + al + br) & _MASK32,
+            (h[0] + bl + cr) & _MASK32,
+        ]
+    return struct.pack('<5I', *h)
+
+
+def _hash160_python(data: bytes) -> bytes:
+    return _ripemd160_python(_sha256(data))
+
+
+def hash160(data: bytes) -> bytes:
+    """RIPEMD160(SHA256(data)), used for Bitcoin key hashes and fingerprints"""
+    return backend("hash160")(data)
+
+
+_KECCAK_ROUND_CONSTANTS = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+]
+
+# Rotation offsets indexed [x][y]
+_KECCAK_ROTATIONS = [
+    [0, 36, 3, 41, 18],
+    [1, 44, 10, 45, 2],
+    [62, 6, 43, 15, 61],
+    [28, 55, 25, 21, 56],
+    [27, 20, 39, 8, 14],
+]
+
+_MASK64 = (1 << 64) - 1
+
+
+# Combined theta/rho/pi plan: (source lane, destination lane, rotation, theta column)
+_KECCAK_RHO_PI = [
+    (x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5), _KECCAK_ROTATIONS[x][y], x)
+    for x in range(5) for y in range(5)
+]
+# chi: lane i ^= ~lane(i+1 in row) & lane(i+2 in row)
+_KECCAK_CHI = [
+    (i, (i + 1) % 5 + i - i % 5, (i + 2) % 5 + i - i % 5) for i in range(25)
+]
+
+
+def _keccak_f1600(lanes: List[int]) -> List[int]:
+    """Keccak-f[1600] permutation on 25 lanes (index x + 5*y)"""
+    mask = _MASK64
+    rho_pi = _KECCAK_RHO_PI
+    chi = _KECCAK_CHI
+    b = [0] * 25
+    for rc in _KECCAK_ROUND_CONSTANTS:
+        # theta
+        c = [lanes[x] ^ lanes[x + 5] ^ lanes[x + 10] ^ lanes[x + 15] ^ lanes[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ (((c[(x + 1) % 5] << 1) | (c[(x + 1) % 5] >> 63)) & mask) for x in range(5)]
+        # rho + pi
+        for src, dst, rot, col in rho_pi:
+            v = lanes[src] ^ d[col]
+            b[dst] = ((v << rot) | (v >> (64 - rot))) & mask if rot else v
+        # chi
+        lanes = [b[i] ^ (~b[j] & b[k]) for i, j, k in chi]
+        # iota
+        lanes[0] ^= rc
+    return lanes
+
+
+def keccak256(data: bytes) -> bytes:
+    """
+    Keccak-256 as used by Ethereum (original Keccak padding, not SHA3-256).
+    
+    Args:
+        data: Message bytes
+        
+    Returns:
+        32-byte digest
+    """
+    return backend("keccak256")(data)
+
+
+def _keccak256_python(data: bytes) -> bytes:
+    """Reference Keccak-256 sponge over _keccak_f1600"""
+    rate = 136
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b'\x00' * (-len(padded) % rate))
+    padded[-1] |= 0x80
+    
+    lanes = [0] * 25
+    for off in range(0, len(padded), rate):
+        block = padded[off:off + rate]
+        for i in range(rate // 8):
+            lanes[i] ^= int.from_bytes(block[8 * i:8 * i + 8], 'little')
+        lanes = _keccak_f1600(lanes)
+    
+    return b''.join(lane.to_bytes(8, 'little') for lane in lanes[:4])
+
+
+# ============================================================================
+# SECP256K1 (pure Python, Jacobian coordinates)
+# ============================================================================
+
+SECP256K1_P = 2**256 - 2**32 - 977
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+SECP256K1_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+
+# Affine points are (x, y) tuples, Jacobian points (X, Y, Z); None is infinity
+Point = Optional[Tuple[int, int]]
+
+
+def _jacobian_double(p: Optional[Tuple[int, int, int]]) -> Optional[Tuple[int, int, int]]:
+    if p is None or p[1] == 0:
+        return None
+    P = SECP256K1_P
+    x, y, z = p
+    ysq = y * y % P
+    s = 4 * x * ysq % P
+    m = 3 * x * x % P
+    nx = (m * m - 2 * s) % P
+    ny = (m * (s - nx) - 8 * ysq * ysq) % P
+    nz = 2 * y * z % P
+    return nx, ny, nz
+
+
+def _jacobian_add(p: Optional[Tuple[int, int, int]], q: Optional[Tuple[int, int, int]]) -> Optional[Tuple[int, int, int]]:
+    if p is None:
+        return q
+    if q is None:
+        return p
+    P = SECP256K1_P
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    z1z1 = z1 * z1 % P
+    z2z2 = z2 * z2 % P
+    u1 = x1 * z2z2 % P
+    u2 = x2 * z1z1 % P
+    s1 = y1 * z2 * z2z2 % P
+    s2 = y2 * z1 * z1z1 % P
+    if u1 == u2:
+        return _jacobian_double(p) if s1 == s2 else None
+    h = u2 - u1
+    r = s2 - s1
+    h2 = h * h % P
+    h3 = h * h2 % P
+    u1h2 = u1 * h2 % P
+    nx = (r * r - h3 - 2 * u1h2) % P
+    ny = (r * (u1h2 - nx) - s1 * h3) % P
+    nz = h * z1 * z2 % P
+    return nx, ny, nz
+
+
+def _jacobian_add_affine(p: Optional[Tuple[int, int, int]], q: Point) -> Optional[Tuple[int, int, int]]:
+    """Mixed addition of a Jacobian point and an affine point (Z2 = 1)"""
+    if q is None:
+        return p
+    if p is None:
+        return q[0], q[1], 1
+    P = SECP256K1_P
+    x1, y1, z1 = p
+    x2, y2 = q
+    z1z1 = z1 * z1 % P
+    u2 = x2 * z1z1 % P
+    s2 = y2 * z1 * z1z1 % P
+    if x1 == u2:
+        return _jacobian_double(p) if y1 == s2 else None
+    h = u2 - x1
+    r = s2 - y1
+    h2 = h * h % P
+    h3 = h * h2 % P
+    u1h2 = x1 * h2 % P
+    nx = (r * r - h3 - 2 * u1h2) % P
+    ny = (r * (u1h2 - nx) - y1 * h3) % P
+    nz = h * z1 % P
+    return nx, ny, nz
+
+
+def _to_affine(p: Optional[Tuple[int, int, int]]) -> Point:
+    if p is None:
+        return None
+    P = SECP256K1_P
+    x, y, z = p
+    zinv = pow(z, -1, P)
+    zinv2 = zinv * zinv % P
+    return x * zinv2 % P, y * zinv2 * zinv % P
+
+
+# Fixed-base table: _G_TABLE[i][j] = j * 256**i * G (affine), built on first use
+_G_WINDOW = 8
+_G_TABLE: List[List[Point]] = []
+
+
+def _g_table() -> List[List[Point]]:
+    if not _G_TABLE:
+        rows = []
+        base = (SECP256K1_G[0], SECP256K1_G[1], 1)
+        for _ in range(256 // _G_WINDOW):
+            row = [None]
+            acc = None
+            for _ in range((1 << _G_WINDOW) - 1):
+                acc = _jacobian_add(acc, base)
+                row.append(acc)
+            rows.append(row)
+            base = _jacobian_add(acc, base)
+        # One shared inversion for the whole table (see _batch_inverse)
+        flat = _batch_to_affine([p for row in rows for p in row])
+        width = 1 << _G_WINDOW
+        _G_TABLE.extend(flat[i:i + width] for i in range(0, len(flat), width))
+    return _G_TABLE
+
+
+def _scalar_base_mult_jacobian(k: int) -> Optional[Tuple[int, int, int]]:
+    """k * G in Jacobian coordinates using the fixed-base window table"""
+    table = _g_table()
+    mask = (1 << _G_WINDOW) - 1
+    acc = None
+    i = 0
+    while k:
+        acc = _jacobian_add_affine(acc, table[i][k & mask])
+        k >>= _G_WINDOW
+        i += 1
+    return acc
+
+
+def scalar_base_mult(k: int) -> Point:
+    """k * G as an affine point"""
+    return _to_affine(_scalar_base_mult_jacobian(k % SECP256K1_N))
+
+
+def point_mult(point: Point, k: int) -> Point:
+    """k * point for an arbitrary affine point (double-and-add)"""
+    acc = None
+    k %= SECP256K1_N
+    for bit in bin(k)[2:] if k else "":
+        acc = _jacobian_double(acc)
+        if bit == "1":
+            acc = _jacobian_add_affine(acc, point)
+    return _to_affine(acc)
+
+
+def point_add(p: Point, q: Point) -> Point:
+    """Affine point addition"""
+    if q is None:
+        return p
+    return _to_affine(_jacobian_add_affine(None if p is None else (p[0], p[1], 1), q))
+
+
+# ----------------------------------------------------------------------------
+# Batch operations (Montgomery simultaneous inversion)
+# ----------------------------------------------------------------------------
+
+def _batch_inverse(values: List[int], P: int = SECP256K1_P) -> List[int]:
+    """
+    Invert many non-zero field elements with a single modular inversion.
+    
+    Montgomery's trick: prefix products, one pow(-1), then walk back,
+    costing about 3 multiplications per element.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % P
+    inv = pow(acc, -1, P)
+    
+    out = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = prefix[i] * inv % P
+        inv = inv * values[i] % P
+    return out
+
+
+def _batch_to_affine(points: List[Optional[Tuple[int, int, int]]]) -> List[Point]:
+    """Normalize many Jacobian points with one inversion"""
+    P = SECP256K1_P
+    finite = [i for i, p in enumerate(points) if p is not None]
+    out: List[Point] = [None] * len(points)
+    for i, zinv in zip(finite, _batch_inverse([points[i][2] for i in finite])):
+        x, y, _ = points[i]
+        zinv2 = zinv * zinv % P
+        out[i] = x * zinv2 % P, y * zinv2 * zinv % P
+    return out
+
+
+def _batch_add_affine(lhs: List[Point], rhs: List[Point]) -> List[Point]:
+    """
+    Pairwise affine additions lhs[i] + rhs[i] sharing one inversion.
+    
+    Doubling and opposite points (equal x) are rare and fall back to the
+    Jacobian formulas.
+    """
+    P = SECP256K1_P
+    out: List[Point] = list(lhs)
+    pending = []
+    denominators = []
+    for i, (a, b) in enumerate(zip(lhs, rhs)):
+        if b is None:
+            continue
+        if a is None:
+            out[i] = b
+        elif a[0] == b[0]:
+            out[i] = point_add(a, b)
+        else:
+            pending.append(i)
+            denominators.append(b[0] - a[0])
+    
+    if denominators:
+        for i, inv in zip(pending, _batch_inverse(denominators)):
+            (x1, y1), (x2, y2) = lhs[i], rhs[i]
+            lam = (y2 - y1) * inv % P
+            x3 = (lam * lam - x1 - x2) % P
+            out[i] = x3, (lam * (x1 - x3) - y1) % P
+    return out
+
+
+def batch_scalar_base_mult(scalars: List[int]) -> List[Point]:
+    """
+    k * G for many scalars at once.
+    
+    Walks the fixed-base window table one window at a time for the whole
+    batch, so every window costs a single shared inversion and the result
+    is already affine.
+    """
+    table = _g_table()
+    mask = (1 << _G_WINDOW) - 1
+    remaining = [k % SECP256K1_N for k in scalars]
+    accs: List[Point] = [None] * len(scalars)
+    
+    for row in table:
+        addends: List[Point] = []
+        for j, k in enumerate(remaining):
+            addends.append(row[k & mask])
+            remaining[j] = k >> _G_WINDOW
+        accs = _batch_add_affine(accs, addends)
+        if not any(remaining):
+            break
+    return accs
+
+
+def batch_public_keys(private_keys: List[bytes], compressed: bool = True) -> List[bytes]:
+    """
+    SEC1 public keys of many private keys (batched private_key_to_public_key).
+    
+    Args:
+        private_keys: 32-byte private keys
+        compressed: 33-byte compressed (default) or 65-byte uncompressed keys
+        
+    Returns:
+        Public keys in the same order
+    """
+    scalars = [int.from_bytes(k, 'big') for k in private_keys]
+    if not all(0 < k < SECP256K1_N for k in scalars):
+        raise ValueError("Private key out of range")
+    return [serialize_point(p, compressed) for p in batch_scalar_base_mult(scalars)]
+
+
+def sequential_public_keys(start_key: bytes, count: int, compressed: bool = True) -> List[bytes]:
+    """
+    Public keys of the consecutive private keys start_key, start_key+1, ...
+    
+    Each point is the previous one plus G (one mixed addition), and all
+    points are normalized together with one inversion.
+    
+    Raises:
+        ValueError: If count < 1 or the range leaves 1..n-1
+    """
+    if count < 1:
+        raise ValueError(f"count must be at least 1, got {count}")
+    k = int.from_bytes(start_key, 'big')
+    if not (0 < k and k + count <= SECP256K1_N):
+        raise ValueError("Private key range out of bounds")
+    
+    acc = _scalar_base_mult_jacobian(k)
+    points = [acc]
+    for _ in range(count - 1):
+        acc = _jacobian_add_affine(acc, SECP256K1_G)
+        points.append(acc)
+    return [serialize_point(p, compressed) for p in _batch_to_affine(points)]
+
+
+def serialize_point(point: Point, compressed: bool = True) -> bytes:
+    """SEC1 encoding of a public key point"""
+    x, y = point
+    if compressed:
+        return bytes([2 + (y & 1)]) + x.to_bytes(32, 'big')
+    return b'\x04' + x.to_bytes(32, 'big') + y.to_bytes(32, 'big')
+
+
+def parse_point(data: bytes) -> Point:
+    """
+    Decode a SEC1 compressed (33 bytes) or uncompressed (65 bytes) public key.
+    
+    Raises:
+        ValueError: If the encoding is invalid or the point is not on the curve
+    """
+    P = SECP256K1_P
+    if len(data) == 33 and data[0] in (2, 3):
+        x = int.from_bytes(data[1:], 'big')
+        y = pow((x * x * x + 7) % P, (P + 1) // 4, P)
+        if (y & 1) != (data[0] & 1):
+            y = P - y
+    elif len(data) == 65 and data[0] == 4:
+        x = int.from_bytes(data[1:33], 'big')
+        y = int.from_bytes(data[33:], 'big')
+    else:
+        raise ValueError("Invalid public key encoding")
+    
+    if x >= P or (y * y - x * x * x - 7) % P != 0:
+        raise ValueError("Public key is not on secp256k1")
+    return x, y
+
+
+def private_key_to_public_key(private_key: bytes, compressed: bool = True) -> bytes:
+    """
+    Compute the SEC1-encoded secp256k1 public key of a private key.
+    
+    Args:
+        private_key: 32-byte private key
+        compressed: Return 33-byte compressed (default) or 65-byte uncompressed key
+        
+    Returns:
+        Public key bytes
+    """
+    k = int.from_bytes(private_key, 'big')
+    if not (0 < k < SECP256K1_N):
+        raise ValueError("Private key out of range")
+    return backend("pubkey")(private_key, compressed)
+
+
+# ============================================================================
+# CRYPTO BACKENDS
+# ============================================================================
+
+# Optional accelerated libraries: used only when importable, never required
+try:
+    import coincurve
+    HAS_COINCURVE = True
+except ImportError:
+    HAS_COINCURVE = False
+
+try:
+    from Crypto.Hash import keccak as _pycryptodome_keccak
+    from Crypto.Hash import RIPEMD160 as _pycryptodome_ripemd160
+    HAS_PYCRYPTODOME = True
+except ImportError:
+    HAS_PYCRYPTODOME = False
+
+# Backend name forced for every operation it provides (e.g. "python" to debug)
+CRYPTO_BACKEND_ENV = "DW_CRYPTO_BACKEND"
+REFERENCE_BACKEND = "python"
+
+
+@dataclass
+class BackendChoice:
+    """Outcome of backend selection for one operation"""
+    operation: str
+    backend: str
+    seconds_per_call: float
+    # Candidate name -> seconds per call, None when it failed the vectors
+    candidates: Dict[str, Optional[float]]
+
+
+# Known-answer vectors per operation: (args, expected result)
+_BACKEND_VECTORS = {
+    "hash160": (
+        (b"",),
+        bytes.fromhex("b472a266d0bd89c13706a4132ccfb16f7c3b9fcb"),
+    ),
+    "keccak256": (
+        (b"",),
+        bytes.fromhex("c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+    ),
+    "hmac_sha512": (
+        (b"Jefe", b"what do ya want for nothing?"),
+        bytes.fromhex(
+            "164b7a7bfcf819e2e395fbe73b56e0a387bd64222e831fd610270cd7ea250554"
+            "9758bf75c05a994a6d034f65f8f0e6fdcaeab1a34d4a6b4b636e070a38bce737"
+        ),
+    ),
+    # BIP32 test vector 1 master key, so the EC paths do full-size scalar work
+    "pubkey": (
+        (bytes.fromhex("e8f32e723decf4051aefac8e2c93c9c5b214313817cdb01a1494b917c8436b35"), True),
+        bytes.fromhex("0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2"),
+    ),
+    "pubkey_tweak_add": (
+        (bytes.fromhex("0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2"),
+         bytes.fromhex("3982f19bef1615bccfbb05e321c10e1d4cba3df0e841c2e41eeb6016347653c3")),
+        bytes.fromhex("028540ee7371a368267f3bac09e17b64bac6d10b81794c1c5c24d1342092c3e0d7"),
+    ),
+    "pubkey_decompress": (
+        (bytes.fromhex("0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2"),),
+        bytes.fromhex(
+            "0439a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2"
+            "3cbe7ded0e7ce6a594896b8f62888fdbc5c8821305e2ea42bf01e37300116281"
+        ),
+    ),
+}
+
+# How an implementation is called on its vector (and benchmarked), when not fn(*args).
+# hmac_sha512 implementations are context factories new(key) with the hmac module's
+# update/copy/digest interface, so BIP32 can keep prepared contexts per parent.
+_BACKEND_PROBES: Dict[str, Callable] = {
+    "hmac_sha512": lambda new, key, data: _hmac_context_digest(new(key), data),
+}
+
+
+def _hmac_context_digest(context, data: bytes) -> bytes:
+    context.update(data)
+    return context.digest()
+
+
+# Operation -> {backend name: implementation}, in registration order
+_BACKENDS: Dict[str, Dict[str, Callable]] = {}
+_SELECTED: Dict[str, Callable] = {}
+_CHOICES: Dict[str, BackendChoice] = {}
+_backend_lock = threading.RLock()
+
+
+def register_backend(operation: str, name: str, fn: Callable) -> None:
+    """
+    Register an implementation of a crypto operation.
+    
+    Registering invalidates the cached selection for that operation, so the
+    next call re-runs the vectors and the benchmark.
+    
+    Args:
+        operation: One of the keys of _BACKEND_VECTORS
+        name: Backend name ("python", "hashlib", "coincurve", ...)
+        fn: Implementation with the reference signature
+    """
+    if operation not in _BACKEND_VECTORS:
+        raise ValueError(f"Unknown crypto operation: {operation}")
+    with _backend_lock:
+        _BACKENDS.setdefault(operation, {})[name] = fn
+        _SELECTED.pop(operation, None)
+        _CHOICES.pop(operation, None)
+
+
+def _benchmark_backend(call: Callable, args: tuple, budget: float = 0.002, max_calls: int = 200) -> float:
+    """Average seconds per call, timing at most max_calls or budget seconds"""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while calls < max_calls and elapsed < budget:
+        call(*args)
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / calls
+
+
+def select_backend(operation: str, name: Optional[str] = None) -> BackendChoice:
+    """
+    Pick the implementation used for an operation in this process.
+    
+    Every candidate is checked against the operation's known-answer vector
+    (the call doubles as warm-up, e.g. for the fixed-base table), then timed
+    with a short micro-benchmark; the fastest correct one wins. The result
+    is cached until the next register_backend or select_backend call.
+    
+    Args:
+        operation: Operation name
+        name: Force this backend instead of benchmarking (must pass the vectors)
+        
+    Returns:
+        The BackendChoice now in effect
+        
+    Raises:
+        ValueError: If the operation is unknown or no candidate is correct
+    """
+    if operation not in _BACKEND_VECTORS:
+        raise ValueError(f"Unknown crypto operation: {operation}")
+    args, expected = _BACKEND_VECTORS[operation]
+    
+    with _backend_lock:
+        candidates = dict(_BACKENDS.get(operation, {}))
+        forced = name or os.environ.get(CRYPTO_BACKEND_ENV)
+        if forced in candidates:
+            candidates = {forced: candidates[forced]}
+        elif name is not None:
+            raise ValueError(f"No '{name}' backend for {operation}")
+        
+        probe = _BACKEND_PROBES.get(operation)
+        timings: Dict[str, Optional[float]] = {}
+        for backend_name, fn in candidates.items():
+            call = functools.partial(probe, fn) if probe else fn
+            try:
+                correct = call(*args) == expected
+            except Exception:
+                correct = False
+            timings[backend_name] = _benchmark_backend(call, args) if correct else None
+        
+        working = {n: t for n, t in timings.items() if t is not None}
+        if not working:
+            raise ValueError(f"No working crypto backend for {operation}")
+        best = min(working, key=working.get)
+        
+        choice = BackendChoice(operation, best, working[best], timings)
+        _SELECTED[operation] = candidates[best]
+        _CHOICES[operation] = choice
+        return choice
+
+
+def backend(operation: str) -> Callable:
+    """Implementation selected for an operation (selected on first use)"""
+    fn = _SELECTED.get(operation)
+    if fn is None:
+        select_backend(operation)
+        fn = _SELECTED[operation]
+    return fn
+
+
+def backend_name(operation: str) -> str:
+    """Name of the backend selected for an operation"""
+    backend(operation)
+    return _CHOICES[operation].backend
+
+
+def backend_report() -> List[BackendChoice]:
+    """Selection result for every operation (runs pending selections)"""
+    report = []
+    for operation in _BACKEND_VECTORS:
+        backend(operation)
+        report.append(_CHOICES[operation])
+    return report
+
+
+class _HmacSha512Python:
+    """HMAC-SHA512 built from the RFC 2104 construction, with the hmac module's interface"""
+    
+    def __init__(self, key: bytes, contexts=None):
+        if contexts is not None:
+            self._inner, self._outer = contexts
+            return
+        if len(key) > 128:
+            key = hashlib.sha512(key).digest()
+        key = key.ljust(128, b'\x00')
+        self._inner = hashlib.sha512(bytes(b ^ 0x36 for b in key))
+        self._outer = hashlib.sha512(bytes(b ^ 0x5C for b in key))
+    
+    def update(self, data: bytes) -> None:
+        self._inner.update(data)
+    
+    def copy(self) -> "_HmacSha512Python":
+        return _HmacSha512Python(b"", (self._inner.copy(), self._outer.copy()))
+    
+    def digest(self) -> bytes:
+        outer = self._outer.copy()
+        outer.update(self._inner.digest())
+        return outer.digest()
+
+
+def _hmac_sha512_hashlib(key: bytes):
+    return hmac.new(key, digestmod='sha512')
+
+
+def _pubkey_python(private_key: bytes, compressed: bool) -> bytes:
+    return serialize_point(scalar_base_mult(int.from_bytes(private_key, 'big')), compressed)
+
+
+def _pubkey_tweak_add_python(public_key: bytes, tweak: bytes) -> bytes:
+    child = point_add(scalar_base_mult(int.from_bytes(tweak, 'big')), parse_point(public_key))
+    if child is None:
+        raise ValueError("Tweaked public key is the point at infinity")
+    return serialize_point(child)
+
+
+def _pubkey_decompress_python(public_key: bytes) -> bytes:
+    return serialize_point(parse_point(public_key), compressed=False)
+
+
+register_backend("hash160", REFERENCE_BACKEND, _hash160_python)
+register_backend("keccak256", REFERENCE_BACKEND, _keccak256_python)
+register_backend("hmac_sha512", REFERENCE_BACKEND, _HmacSha512Python)
+register_backend("pubkey", REFERENCE_BACKEND, _pubkey_python)
+register_backend("pubkey_tweak_add", REFERENCE_BACKEND, _pubkey_tweak_add_python)
+register_backend("pubkey_decompress", REFERENCE_BACKEND, _pubkey_decompress_python)
+
+register_backend("hmac_sha512", "hashlib", _hmac_sha512_hashlib)
+try:
+    hashlib.new('ripemd160')
+    register_backend("hash160", "hashlib", lambda data: hashlib.new('ripemd160', _sha256(data)).digest())
+except ValueError:
+    # OpenSSL 3 builds may ship without the legacy provider
+    pass
+
+if HAS_PYCRYPTODOME:
+    register_backend(
+        "keccak256", "pycryptodome",
+        lambda data: _pycryptodome_keccak.new(digest_bits=256, data=data).digest(),
+    )
+    register_backend(
+        "hash160", "pycryptodome",
+        lambda data: _pycryptodome_ripemd160.new(_sha256(data)).digest(),
+    )
+
+if HAS_COINCURVE:
+    register_backend(
+        "pubkey", "coincurve",
+        lambda private_key, compressed: coincurve.PrivateKey(private_key).public_key.format(compressed),
+    )
+    register_backend(
+        "pubkey_tweak_add", "coincurve",
+        lambda public_key, tweak: coincurve.PublicKey(public_key).add(tweak).format(True),
+    )
+    register_backend(
+        "pubkey_decompress", "coincurve",
+        lambda public_key: coincurve.PublicKey(public_key).format(False),
+    )
+
+
+# ============================================================================
+# KEY DERIVATION (BIP32/BIP44)
+# ============================================================================
+
+HARDENED = 0x80000000
+
+
+def mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
+    """
+    Convert mnemonic to BIP39 seed using PBKDF2.
+    
+    Both are NFKD-normalized first, as BIP39 requires; each mnemonic word
+    is normalized once and cached.
+    
+    Args:
+        mnemonic: Space-separated mnemonic phrase
+        passphrase: Optional passphrase
+        
+    Returns:
+        64-byte seed
+    """
+    mnemonic_bytes = _nfkd(mnemonic).encode('utf-8')
+    salt = ('mnemonic' + unicodedata.normalize("NFKD", passphrase)).encode('utf-8')
+    return hashlib.pbkdf2_hmac('sha512', mnemonic_bytes, salt, 2048)
+
+
+def _hmac_sha512(key: bytes, data: bytes) -> bytes:
+    """HMAC-SHA512"""
+    return _hmac_context_digest(backend("hmac_sha512")(key), data)
+
+
+# Prepared HMAC contexts of the master steps, by (backend factory, key);
+# copies skip rebuilding the pads
+_KEYED_HMACS: Dict[Tuple[Callable, bytes], object] = {}
+_CHILD_INDEX = struct.Struct('>I')
+
+
+def _keyed_hmac(key: bytes):
+    """Fresh HMAC-SHA512 context for a fixed key ("Bitcoin seed", "ed25519 seed")"""
+    new = backend("hmac_sha512")
+    prepared = _KEYED_HMACS.get((new, key))
+    if prepared is None:
+        prepared = _KEYED_HMACS[(new, key)] = new(key)
+    return prepared.copy()
+
+
+def _prepared_ckd_hmac(parent_chain: bytes, prefix: bytes):
+    """
+    HMAC-SHA512 keyed with a parent chain code, with the 33-byte data prefix
+    (0x00 || key for hardened children, the public key otherwise) already
+    absorbed. Each child then costs one copy() plus 4 index bytes.
+    """
+    prepared = backend("hmac_sha512")(parent_chain)
+    prepared.update(prefix)
+    return prepared
+
+
+def _ckd_hmac(prepared, index: int) -> bytes:
+    """HMAC-SHA512(chain, prefix || ser32(index)) from a prepared context"""
+    h = prepared.copy()
+    h.update(_CHILD_INDEX.pack(index))
+    return h.digest()
+
+
+def _derive_key(
+    parent_key: bytes,
+    parent_chain: bytes,
+    index: int,
+    parent_pub: Optional[bytes] = None,
+    prepared=None,
+) -> Tuple[bytes, bytes]:
+    """
+    BIP32 private parent -> private child key derivation (CKDpriv).
+    
+    prepared, if given, is _prepared_ckd_hmac(parent_chain, prefix) for the
+    kind (hardened or not) of index, and is reused across siblings.
+    """
+    if prepared is not None:
+        h = _ckd_hmac(prepared, index)
+    elif index >= HARDENED:
+        h = _hmac_sha512(parent_chain, b'\x00' + parent_key + _CHILD_INDEX.pack(index))
+    else:
+        h = _hmac_sha512(parent_chain, (parent_pub or private_key_to_public_key(parent_key)) + _CHILD_INDEX.pack(index))
+    
+    il = int.from_bytes(h[:32], 'big')
+    child = (il + int.from_bytes(parent_key, 'big')) % SECP256K1_N
+    if il >= SECP256K1_N or child == 0:
+        raise ValueError(f"Invalid child key at index {index}, use the next index")
+    return child.to_bytes(32, 'big'), h[32:]
+
+
+def _derive_public_key(
+    parent_pub: bytes,
+    parent_chain: bytes,
+    index: int,
+    prepared=None,
+) -> Tuple[bytes, bytes]:
+    """BIP32 public parent -> public child key derivation (CKDpub)"""
+    if index >= HARDENED:
+        raise ValueError("Cannot derive a hardened child from a public key")
+    
+    if prepared is not None:
+        h = _ckd_hmac(prepared, index)
+    else:
+        h = _hmac_sha512(parent_chain, parent_pub + _CHILD_INDEX.pack(index))
+    il = int.from_bytes(h[:32], 'big')
+    if il >= SECP256K1_N:
+        raise ValueError(f"Invalid child key at index {index}, use the next index")
+    try:
+        child = backend("pubkey_tweak_add")(parent_pub, h[:32])
+    except ValueError:
+        raise ValueError(f"Invalid child key at index {index}, use the next index") from None
+    return child, h[32:]
+
+
+def batch_child_points(parent_pub: bytes, parent_chain: bytes, indices: List[int]) -> List[Point]:
+    """
+    CKDpub for many non-hardened children of one public parent at once.
+    
+    The parent point is decompressed once, the child tweaks IL*G go through
+    batch_scalar_base_mult and the final additions share one inversion.
+    
+    Args:
+        parent_pub: Compressed parent public key
+        parent_chain: Parent chain code
+        indices: Non-hardened child indices
+        
+    Returns:
+        Affine child points, in the same order as indices
+    """
+    parent = parse_point(parent_pub)
+    prepared = _prepared_ckd_hmac(parent_chain, parent_pub)
+    
+    tweaks = []
+    for index in indices:
+        if index >= HARDENED:
+            raise ValueError("Cannot derive a hardened child from a public key")
+        il = int.from_bytes(_ckd_hmac(prepared, index)[:32], 'big')
+        if il >= SECP256K1_N:
+            raise ValueError(f"Invalid child key at index {index}, use the next index")
+        tweaks.append(il)
+    
+    points = _batch_add_affine(batch_scalar_base_mult(tweaks), [parent] * len(tweaks))
+    for index, point in zip(indices, points):
+        if point is None:
+            raise ValueError(f"Invalid child key at index {index}, use the next index")
+    return points
+
+
+def parse_path(path: str) -> List[int]:
+    """
+    Parse a BIP32 path such as "m/44'/0'/0'/0/0" into child indices.
+    
+    Raises:
+        ValueError: If the path is malformed
+    """
+    parts = path.strip().split('/')
+    if parts[0] not in ('m', 'M'):
+        raise ValueError(f"Derivation path must start with 'm': {path!r}")
+    
+    indices = []
+    for part in parts[1:]:
+        hardened = part.endswith("'") or part.endswith("h")
+        digits = part[:-1] if hardened else part
+        if not digits.isdigit() or int(digits) >= HARDENED:
+            raise ValueError(f"Invalid path component {part!r}")
+        indices.append(int(digits) + (HARDENED if hardened else 0))
+    return indices
+
+
+class ExtendedKey:
+    """
+    BIP32 node: a private (32-byte) or public (33-byte) key plus chain code.
+    
+    The public key and the parent fingerprint are computed on first use, so
+    walking a hardened path costs one HMAC per step and no EC multiplication.
+    The CKD HMAC contexts are prepared once per node and per child kind, so
+    siblings (address pages, shared path prefixes) only pay a copy().
+    """
+    
+    __slots__ = ("key", "chain_code", "depth", "child_number",
+                 "_parent", "_parent_fingerprint", "_public_key",
+                 "_hmac_hardened", "_hmac_normal")
+    
+    def __init__(
+        self,
+        key: bytes,
+        chain_code: bytes,
+        depth: int = 0,
+        parent_fingerprint: Optional[bytes] = b'\x00\x00\x00\x00',
+        child_number: int = 0,
+        parent: Optional["ExtendedKey"] = None,
+    ):
+        self.key = key
+        self.chain_code = chain_code
+        self.depth = depth
+        self.child_number = child_number
+        self._parent = parent
+        self._parent_fingerprint = parent_fingerprint
+        self._public_key = None if len(key) == 32 else key
+        self._hmac_hardened = None
+        self._hmac_normal = None
+    
+    def __repr__(self) -> str:
+        kind = "private" if self.is_private else "public"
+        return f"ExtendedKey({kind}, depth={self.depth}, child_number={self.child_number:#x})"
+    
+    @property
+    def is_private(self) -> bool:
+        return len(self.key) == 32
+    
+    @property
+    def public_key(self) -> bytes:
+        """Compressed public key of this node"""
+        if self._public_key is None:
+            self._public_key = private_key_to_public_key(self.key)
+        return self._public_key
+    
+    @property
+    def fingerprint(self) -> bytes:
+        return hash160(self.public_key)[:4]
+    
+    @property
+    def parent_fingerprint(self) -> bytes:
+        if self._parent_fingerprint is None:
+            self._parent_fingerprint = self._parent.fingerprint
+        return self._parent_fingerprint
+    
+    def neuter(self) -> "ExtendedKey":
+        """Public-only copy of this node"""
+        return ExtendedKey(
+            key=self.public_key,
+            chain_code=self.chain_code,
+            depth=self.depth,
+            parent_fingerprint=self.parent_fingerprint,
+            child_number=self.child_number,
+        )
+    
+    def _prepared_hmac(self, hardened: bool):
+        """CKD HMAC context of this node for hardened or normal children"""
+        if hardened:
+            if self._hmac_hardened is None:
+                self._hmac_hardened = _prepared_ckd_hmac(self.chain_code, b'\x00' + self.key)
+            return self._hmac_hardened
+        if self._hmac_normal is None:
+            self._hmac_normal = _prepared_ckd_hmac(self.chain_code, self.public_key)
+        return self._hmac_normal
+    
+    def child(self, index: int) -> "ExtendedKey":
+        """Derive a child node (private if this node is private)"""
+        hardened = index >= HARDENED
+        if not self.is_private:
+            if hardened:
+                raise ValueError("Cannot derive a hardened child from a public key")
+            key, chain = _derive_public_key(self.key, self.chain_code, index, self._prepared_hmac(False))
+        else:
+            key, chain = _derive_key(self.key, self.chain_code, index, prepared=self._prepared_hmac(hardened))
+        return ExtendedKey(
+            key=key,
+            chain_code=chain,
+            depth=self.depth + 1,
+            parent_fingerprint=None,
+            child_number=index,
+            parent=self,
+        )
+    
+    def derive(self, path: str) -> "ExtendedKey":
+        """Derive a descendant by path; 'm' refers to this node"""
+        node = self
+        for index in parse_path(path):
+            node = node.child(index)
+        return node
+
+
+def master_key_from_seed(seed: bytes) -> ExtendedKey:
+    """BIP32 master node from a BIP39 seed"""
+    h = _keyed_hmac(b"Bitcoin seed")
+    h.update(seed)
+    digest = h.digest()
+    return ExtendedKey(key=digest[:32], chain_code=digest[32:])
+
+
+def derive_paths(master: ExtendedKey, paths: List[str], cache: Optional[dict] = None) -> List[ExtendedKey]:
+    """
+    Derive several paths from one master node, sharing common prefixes.
+    
+    Every intermediate node is memoized by its index prefix, so e.g.
+    m/44'/0'/0'/0/0 and m/44'/0'/0'/0/1 only differ in the last step.
+    Paths are walked one depth at a time, so the parent public keys needed
+    by normal (non-hardened) steps are computed together for all paths.
+    
+    Args:
+        master: Master node
+        paths: Derivation paths
+        cache: Optional dict reused across calls for the same master
+        
+    Returns:
+        Nodes in the same order as paths
+    """
+    if cache is None:
+        cache = {}
+    cache.setdefault((), master)
+    
+    targets = [tuple(parse_path(path)) for path in paths]
+    for depth in range(1, max(map(len, targets), default=0) + 1):
+        pending = sorted({t[:depth] for t in targets if len(t) >= depth and t[:depth] not in cache})
+        _prime_public_keys([cache[prefix[:-1]] for prefix in pending if prefix[-1] < HARDENED])
+        for prefix in pending:
+            cache[prefix] = cache[prefix[:-1]].child(prefix[-1])
+    return [cache[t] for t in targets]
+
+
+# Below this many keys, one inversion per table window costs more than it saves
+_PRIME_BATCH_MIN = 8
+
+
+def _prime_public_keys(nodes: List[ExtendedKey]) -> None:
+    """Compute the missing public keys of private nodes with one shared inversion"""
+    todo = list({id(node): node for node in nodes if node._public_key is None}.values())
+    # Accelerated backends are faster one key at a time
+    if len(todo) < _PRIME_BATCH_MIN or backend_name("pubkey") != REFERENCE_BACKEND:
+        return
+    for node, public_key in zip(todo, batch_public_keys([node.key for node in todo])):
+        node._public_key = public_key
+
+
+def derive_node_from_path(seed: bytes, path: str) -> ExtendedKey:
+    """
+    Derive the BIP32 node at path from a seed.
+    
+    Args:
+        seed: BIP39 seed (64 bytes)
+        path: Derivation path (e.g., "m/44'/60'/0'")
+        
+    Returns:
+        Private ExtendedKey at that path
+    """
+    return master_key_from_seed(seed).derive(path)
+
+
+def derive_key_from_path(seed: bytes, path: str) -> bytes:
+    """
+    Derive private key from seed using BIP32 path.
+    
+    Args:
+        seed: BIP39 seed (64 bytes)
+        path: Derivation path (e.g., "m/44'/60'/0'/0/0")
+        
+    Returns:
+        32-byte private key
+    """
+    return derive_node_from_path(seed, path).key
+
+
+# ============================================================================
+# ED25519 / SLIP-10 (pure Python, extended twisted Edwards coordinates)
+# ============================================================================
+
+ED25519_P = 2**255 - 19
+ED25519_L = 2**252 + 27742317777372353535851937790883648493
+ED25519_D = -121665 * pow(121666, -1, ED25519_P) % ED25519_P
+_ED25519_D2 = 2 * ED25519_D % ED25519_P
+ED25519_B = (
+    15112221349535400772501151409588531511454012693041857206046113283949847762202,
+    46316835694926478169428394003475163141307993866256225615783033603165251855960,
+)
+
+# Extended points are (X, Y, Z, T) with x = X/Z, y = Y/Z, x*y = T/Z.
+# Table entries are precomputed affine (y + x, y - x, 2*d*x*y) for mixed adds.
+EdPoint = Tuple[int, int, int, int]
+_ED_IDENTITY = (0, 1, 1, 0)
+
+
+def _ed_double(p: EdPoint) -> EdPoint:
+    """dbl-2008-hwcd for a = -1"""
+    P = ED25519_P
+    x1, y1, z1, _ = p
+    a = x1 * x1 % P
+    b = y1 * y1 % P
+    c = 2 * z1 * z1 % P
+    h = a + b
+    e = (h - (x1 + y1) * (x1 + y1)) % P
+    g = a - b
+    f = c + g
+    return e * f % P, g * h % P, f * g % P, e * h % P
+
+
+def _ed_add(p: EdPoint, q: EdPoint) -> EdPoint:
+    """add-2008-hwcd-3 (unified, also valid for doubling)"""
+    P = ED25519_P
+    x1, y1, z1, t1 = p
+    x2, y2, z2, t2 = q
+    a = (y1 - x1) * (y2 - x2) % P
+    b = (y1 + x1) * (y2 + x2) % P
+    c = t1 * _ED25519_D2 * t2 % P
+    d = 2 * z1 * z2 % P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return e * f % P, g * h % P, f * g % P, e * h % P
+
+
+def _ed_add_precomputed(p: EdPoint, q: Tuple[int, int, int]) -> EdPoint:
+    """Mixed addition with a precomputed affine (y + x, y - x, 2*d*x*y) point"""
+    P = ED25519_P
+    x1, y1, z1, t1 = p
+    yplusx, yminusx, xy2d = q
+    a = (y1 - x1) * yminusx % P
+    b = (y1 + x1) * yplusx % P
+    c = t1 * xy2d % P
+    d = 2 * z1 % P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return e * f % P, g * h % P, f * g % P, e * h % P
+
+
+# Fixed-base table: _ED_TABLE[i][j] = j * 256**i * B (precomputed form), built on first use
+_ED_TABLE: List[List[Optional[Tuple[int, int, int]]]] = []
+
+
+def _ed_table() -> List[List[Optional[Tuple[int, int, int]]]]:
+    if not _ED_TABLE:
+        P = ED25519_P
+        rows = []
+        base = (ED25519_B[0], ED25519_B[1], 1, ED25519_B[0] * ED25519_B[1] % P)
+        for _ in range(32):
+            row = [base]
+            for _ in range(254):
+                row.append(_ed_add(row[-1], base))
+            rows.append(row)
+            base = _ed_add(row[-1], base)
+        # One shared inversion for the whole table (see _batch_inverse)
+        flat = [p for row in rows for p in row]
+        zinvs = _batch_inverse([p[2] for p in flat], P)
+        entries = []
+        for (x, y, _, _), zinv in zip(flat, zinvs):
+            x, y = x * zinv % P, y * zinv % P
+            entries.append(((y + x) % P, (y - x) % P, _ED25519_D2 * x * y % P))
+        _ED_TABLE.extend([None] + entries[i:i + 255] for i in range(0, len(entries), 255))
+    return _ED_TABLE
+
+
+def _ed_base_mult(k: int) -> EdPoint:
+    """k * B in extended coordinates using the fixed-base window table"""
+    table = _ed_table()
+    acc = _ED_IDENTITY
+    i = 0
+    while k:
+        entry = table[i][k & 0xFF]
+        if entry is not None:
+            acc = _ed_add_precomputed(acc, entry)
+        k >>= 8
+        i += 1
+    return acc
+
+
+def _ed_encode(x: int, y: int) -> bytes:
+    """RFC 8032 point encoding: y little-endian with the sign of x in bit 255"""
+    return (y | ((x & 1) << 255)).to_bytes(32, 'little')
+
+
+def _ed25519_scalar(private_key: bytes) -> int:
+    """Clamped secret scalar of an ed25519 private key (RFC 8032)"""
+    h = bytearray(hashlib.sha512(private_key).digest()[:32])
+    h[0] &= 248
+    h[31] &= 127
+    h[31] |= 64
+    return int.from_bytes(h, 'little')
+
+
+def ed25519_public_key(private_key: bytes) -> bytes:
+    """
+    32-byte ed25519 public key of a 32-byte private key (seed).
+    
+    Args:
+        private_key: 32-byte ed25519 private key
+        
+    Returns:
+        Encoded public key
+    """
+    if len(private_key) != 32:
+        raise ValueError("ed25519 private key must be 32 bytes")
+    x, y, z, _ = _ed_base_mult(_ed25519_scalar(private_key))
+    zinv = pow(z, -1, ED25519_P)
+    return _ed_encode(x * zinv % ED25519_P, y * zinv % ED25519_P)
+
+
+def ed25519_public_keys(private_keys: List[bytes]) -> List[bytes]:
+    """Batched ed25519_public_key (one shared inversion for all points)"""
+    P = ED25519_P
+    points = [_ed_base_mult(_ed25519_scalar(key)) for key in private_keys]
+    zinvs = _batch_inverse([p[2] for p in points], P)
+    return [_ed_encode(x * zinv % P, y * zinv % P) for (x, y, _, _), zinv in zip(points, zinvs)]
+
+
+def slip10_ed25519_master(seed: bytes) -> Tuple[bytes, bytes]:
+    """SLIP-10 ed25519 master (private key, chain code) from a BIP39 seed"""
+    h = _keyed_hmac(b"ed25519 seed")
+    h.update(seed)
+    digest = h.digest()
+    return digest[:32], digest[32:]
+
+
+def slip10_ed25519_child(key: bytes, chain_code: bytes, index: int) -> Tuple[bytes, bytes]:
+    """
+    SLIP-10 ed25519 child derivation (hardened only).
+    
+    Raises:
+        ValueError: If index is not hardened
+    """
+    if index < HARDENED:
+        raise ValueError("SLIP-10 ed25519 only supports hardened derivation")
+    digest = _ckd_hmac(_prepared_ckd_hmac(chain_code, b'\x00' + key), index)
+    return digest[:32], digest[32:]
+
+
+def derive_ed25519_path(seed: bytes, path: str, cache: Optional[dict] = None) -> Tuple[bytes, bytes]:
+    """
+    SLIP-10 ed25519 (private key, chain code) at a hardened path.
+    
+    Args:
+        seed: BIP39 seed (64 bytes)
+        path: Derivation path, every step hardened (e.g. "m/44'/501'/0'/0'")
+        cache: Optional dict memoizing nodes by index prefix
+        
+    Returns:
+        (private key, chain code)
+    """
+    if cache is None:
+        cache = {}
+    if () not in cache:
+        cache[()] = slip10_ed25519_master(seed)
+    
+    indices = tuple(parse_path(path))
+    depth = len(indices)
+    while indices[:depth] not in cache:
+        depth -= 1
+    key, chain = cache[indices[:depth]]
+    for i in range(depth, len(indices)):
+        key, chain = slip10_ed25519_child(key, chain, indices[i])
+        cache[indices[:i + 1]] = (key, chain)
+    return key, chain
+
+
+def ed25519_range_keys(parent: Tuple[bytes, bytes], indices: List[int], suffix: List[int]) -> List[bytes]:
+    """
+    Private keys of parent/i/suffix... for many hardened indices i.
+    
+    The parent's CKD HMAC is prepared once and copied for every sibling,
+    which is what range sweeps such as m/44'/501'/i'/0' need.
+    """
+    key, chain = parent
+    prepared = _prepared_ckd_hmac(chain, b'\x00' + key)
+    keys = []
+    for index in indices:
+        if index < HARDENED:
+            raise ValueError("SLIP-10 ed25519 only supports hardened derivation")
+        digest = _ckd_hmac(prepared, index)
+        child = (digest[:32], digest[32:])
+        for step in suffix:
+            child = slip10_ed25519_child(child[0], child[1], step)
+        keys.append(child[0])
+    return keys
+
+
+# ============================================================================
+# EXTENDED KEY SERIALIZATION (xpub/ypub/zpub/xprv)
+# ============================================================================
+
+# SLIP-132 version bytes: name -> (public version, private version)
+EXTENDED_KEY_VERSIONS = {
+    "xpub": (0x0488B21E, 0x0488ADE4),   # BIP44 P2PKH (and Ethereum)
+    "ypub": (0x049D7CB2, 0x049D7878),   # BIP49 P2SH-P2WPKH
+    "zpub": (0x04B24746, 0x04B2430C),   # BIP84 P2WPKH
+    "tpub": (0x043587CF, 0x04358394),   # testnet
+    "vpub": (0x045F1CF6, 0x045F18BC),   # BIP84 P2WPKH testnet
+}
+
+
+def _base58_decode(s: str) -> bytes:
+    """Base58 decoding (inverse of _base58_encode)"""
+    num = 0
+    for c in s:
+        digit = BASE58_ALPHABET.find(c)
+        if digit < 0:
+            raise ValueError(f"Invalid Base58 character {c!r}")
+        num = num * 58 + digit
+    
+    body = num.to_bytes((num.bit_length() + 7) // 8, 'big') if num else b''
+    leading = len(s) - len(s.lstrip(BASE58_ALPHABET[0]))
+    return b'\x00' * leading + body
+
+
+def base58check_encode(payload: bytes) -> str:
+    """Base58 with a 4-byte double-SHA256 checksum"""
+    return _base58_encode(payload + _sha256(_sha256(payload))[:4])
+
+
+def base58check_decode(s: str) -> bytes:
+    """
+    Decode Base58Check and verify its checksum.
+    
+    Raises:
+        ValueError: If the string is not valid Base58Check
+    """
+    raw = _base58_decode(s)
+    payload, checksum = raw[:-4], raw[-4:]
+    if len(raw) < 4 or _sha256(_sha256(payload))[:4] != checksum:
+        raise ValueError("Invalid Base58Check checksum")
+    return payload
+
+
+def serialize_extended_key(node: ExtendedKey, kind: str = "xpub", private: bool = False) -> str:
+    """
+    Serialize a BIP32 node as xpub/ypub/zpub/tpub/vpub (or the matching xprv/.../vprv).
+    
+    Args:
+        node: BIP32 node
+        kind: Public prefix family ("xpub", "ypub", "zpub", "tpub" or "vpub")
+        private: Serialize the private key (node must be private)
+        
+    Returns:
+        Base58Check extended key string
+    """
+    try:
+        pub_version, prv_version = EXTENDED_KEY_VERSIONS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown extended key kind {kind!r}")
+    
+    if private:
+        if not node.is_private:
+            raise ValueError("Cannot serialize a public node as a private key")
+        version, key = prv_version, b'\x00' + node.key
+    else:
+        version, key = pub_version, node.public_key
+    
+    payload = (
+        struct.pack('>I', version)
+        + bytes([node.depth])
+        + node.parent_fingerprint
+        + struct.pack('>I', node.child_number)
+        + node.chain_code
+        + key
+    )
+    return base58check_encode(payload)
+
+
+def parse_extended_key(s: str) -> Tuple[ExtendedKey, str]:
+    """
+    Parse an xpub/ypub/zpub/tpub/vpub or xprv/yprv/zprv/tprv/vprv string.
+    
+    Args:
+        s: Base58Check extended key
+        
+    Returns:
+        Tuple of (node, kind) where kind is the public prefix family
+        
+    Raises:
+        ValueError: If the string is not a valid extended key
+    """
+    payload = base58check_decode(s.strip())
+    if len(payload) != 78:
+        raise ValueError("Extended key must be 78 bytes")
+    
+    version = struct.unpack('>I', payload[:4])[0]
+    for kind, (pub_version, prv_version) in EXTENDED_KEY_VERSIONS.items():
+        if version in (pub_version, prv_version):
+            break
+    else:
+        raise ValueError(f"Unknown extended key version {version:#010x}")
+    
+    key = payload[45:]
+    if version == prv_version:
+        if key[0] != 0 or not (0 < int.from_bytes(key[1:], 'big') < SECP256K1_N):
+            raise ValueError("Invalid extended private key")
+        key = key[1:]
+    else:
+        parse_point(key)
+    
+    node = ExtendedKey(
+        key=key,
+        chain_code=payload[13:45],
+        depth=payload[4],
+        parent_fingerprint=payload[5:9],
+        child_number=struct.unpack('>I', payload[9:13])[0],
+    )
+    return node, kind
+
+
+# ============================================================================
+# ADDRESS GENERATION
+# ============================================================================
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+
+# Every two-digit base58 string, indexed by its value (0..58*58-1)
+_BASE58_PAIRS = [a + b for a in BASE58_ALPHABET for b in BASE58_ALPHABET]
+
+
+def _base58_encode(data: bytes) -> str:
+    """
+    Base58 encoding for Bitcoin addresses and Solana public keys.
+    
+    Digits are peeled two at a time (divmod by 58**2 and a pair lookup),
+    halving the big-integer divisions of the digit-by-digit loop.
+    """
+    num = int.from_bytes(data, 'big')
+    
+    pairs = []
+    while num >= 3364:
+        num, remainder = divmod(num, 3364)
+        pairs.append(_BASE58_PAIRS[remainder])
+    head = _BASE58_PAIRS[num] if num >= 58 else BASE58_ALPHABET[num] if num else ''
+    digits = (head + ''.join(reversed(pairs))).lstrip(BASE58_ALPHABET[0])
+    
+    # Add leading '1's for leading zero bytes
+    zeros = len(data) - len(data.lstrip(b'\x00'))
+    return BASE58_ALPHABET[0] * zeros + digits
+
+
+def eth_checksum_address(address: str) -> str:
+    """EIP-55 mixed-case checksum encoding of a hex Ethereum address"""
+    hex_addr = address.lower().replace('0x', '')
+    digest = keccak256(hex_addr.encode('ascii')).hex()
+    return '0x' + ''.join(
+        c.upper() if int(digest[i], 16) >= 8 else c
+        for i, c in enumerate(hex_addr)
+    )
+
+
+def public_key_to_eth_address(public_key: bytes) -> str:
+    """Ethereum address (EIP-55) of a SEC1 public key"""
+    raw = backend("pubkey_decompress")(public_key)[1:]
+    return eth_checksum_address(keccak256(raw)[-20:].hex())
+
+
+def public_key_to_btc_address(public_key: bytes, version: int = 0x00) -> str:
+    """Bitcoin P2PKH address of a compressed SEC1 public key"""
+    # Version byte (0x00 for mainnet P2PKH; Litecoin 0x30, Dogecoin 0x1E, testnet 0x6F)
+    return base58check_encode(bytes([version]) + hash160(public_key))
+
+
+def public_key_to_p2sh_p2wpkh_address(public_key: bytes) -> str:
+    """Bitcoin BIP49 P2SH-wrapped SegWit address (starts with '3')"""
+    redeem_script = b'\x00\x14' + hash160(public_key)
+    # Version byte (0x05 for mainnet P2SH)
+    return base58check_encode(b'\x05' + hash160(redeem_script))
+
+
+def public_key_to_p2wpkh_address(public_key: bytes, hrp: str = "bc") -> str:
+    """Bitcoin BIP84 native SegWit v0 address (bc1q...)"""
+    return encode_segwit_address(hrp, 0, hash160(public_key))
+
+
+def public_key_to_sol_address(public_key: bytes) -> str:
+    """Solana address: the 32-byte ed25519 public key in Base58"""
+    return _base58_encode(public_key)
+
+
+def public_key_to_p2tr_address(public_key: bytes, hrp: str = "bc") -> str:
+    """Bitcoin BIP86 Taproot address (bc1p...) with a key-path-only output key"""
+    return encode_segwit_address(hrp, 1, taproot_output_key(public_key))
+
+
+# ----------------------------------------------------------------------------
+# Bech32 / Bech32m (BIP173 / BIP350)
+# ----------------------------------------------------------------------------
+
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_BECH32_CONST = 1
+_BECH32M_CONST = 0x2BC830A3
+_BECH32_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+# XOR of the generator terms selected by the 5 bits shifted out of the checksum
+_BECH32_TABLE = [
+    functools.reduce(
+        lambda acc, i: acc ^ (_BECH32_GENERATOR[i] if (top >> i) & 1 else 0), range(5), 0
+    )
+    for top in range(32)
+]
+_BECH32_REVERSE = {c: i for i, c in enumerate(BECH32_CHARSET)}
+
+
+def _bech32_polymod(values) -> int:
+    chk = 1
+    table = _BECH32_TABLE
+    for v in values:
+        chk = ((chk & 0x1FFFFFF) << 5) ^ v ^ table[chk >> 25]
+    return chk
+
+
+def _bech32_hrp_expand(hrp: str) -> List[int]:
+    return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+
+def _convert_bits(data: bytes, from_bits: int, to_bits: int, pad: bool = True) -> List[int]:
+    """Regroup a sequence of from_bits-wide values into to_bits-wide values"""
+    acc = 0
+    bits = 0
+    out = []
+    maxv = (1 << to_bits) - 1
+    for value in data:
+        if value >> from_bits:
+            raise ValueError("Invalid value for bit conversion")
+        acc = (acc << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            out.append((acc >> bits) & maxv)
+    if pad:
+        if bits:
+            out.append((acc << (to_bits - bits)) & maxv)
+    elif bits >= from_bits or ((acc << (to_bits - bits)) & maxv):
+        raise ValueError("Invalid padding in bit conversion")
+    return out
+
+
+def encode_segwit_address(hrp: str, witver: int, program: bytes) -> str:
+    """
+    Encode a SegWit output as Bech32 (v0) or Bech32m (v1+).
+    
+    Args:
+        hrp: Human-readable part ("bc" mainnet, "tb" testnet)
+        witver: Witness version (0-16)
+        program: Witness program (20 or 32 bytes for v0, 2-40 bytes otherwise)
+        
+    Returns:
+        SegWit address string
+    """
+    data = [witver] + _convert_bits(program, 8, 5)
+    const = _BECH32_CONST if witver == 0 else _BECH32M_CONST
+    polymod = _bech32_polymod(_bech32_hrp_expand(hrp) + data + [0] * 6) ^ const
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + "1" + "".join(BECH32_CHARSET[d] for d in data + checksum)
+
+
+def decode_segwit_address(hrp: str, address: str) -> Tuple[int, bytes]:
+    """
+    Decode a Bech32/Bech32m SegWit address.
+    
+    Returns:
+        Tuple of (witness version, witness program)
+        
+    Raises:
+        ValueError: If the address is invalid for this hrp
+    """
+    if address.lower() != address and address.upper() != address:
+        raise ValueError("Mixed-case Bech32 address")
+    address = address.lower()
+    pos = address.rfind("1")
+    if address[:pos] != hrp or len(address) - pos < 8 or len(address) > 90:
+        raise ValueError("Invalid Bech32 address")
+    try:
+        data = [_BECH32_REVERSE[c] for c in address[pos + 1:]]
+    except KeyError:
+        raise ValueError("Invalid Bech32 character")
+    
+    witver = data[0]
+    const = _bech32_polymod(_bech32_hrp_expand(hrp) + data)
+    if const != (_BECH32_CONST if witver == 0 else _BECH32M_CONST):
+        raise ValueError("Invalid Bech32 checksum")
+    program = bytes(_convert_bits(bytes(data[1:-6]), 5, 8, pad=False))
+    if witver > 16 or not (2 <= len(program) <= 40) or (witver == 0 and len(program) not in (20, 32)):
+        raise ValueError("Invalid witness program")
+    return witver, program
+
+
+# ----------------------------------------------------------------------------
+# CashAddr (Bitcoin Cash)
+# ----------------------------------------------------------------------------
+
+_CASHADDR_GENERATOR = (0x98F2BC8E61, 0x79B76D99E2, 0xF33E5FB3C4, 0xAE2EABE2A8, 0x1E4F43E470)
+
+
+def _cashaddr_polymod(values) -> int:
+    chk = 1
+    for v in values:
+        top = chk >> 35
+        chk = ((chk & 0x07FFFFFFFF) << 5) ^ v
+        for i, g in enumerate(_CASHADDR_GENERATOR):
+            if (top >> i) & 1:
+                chk ^= g
+    return chk ^ 1
+
+
+def encode_cashaddr(prefix: str, kind: int, payload: bytes) -> str:
+    """
+    CashAddr address (prefix:q...) of a 20-byte hash.
+    
+    Args:
+        prefix: Network prefix ("bitcoincash", "bchtest")
+        kind: 0 for P2PKH, 1 for P2SH
+        payload: hash160 of the public key or script
+    """
+    if len(payload) != 20:
+        raise ValueError("CashAddr payload must be a 20-byte hash")
+    # Version byte: type in bits 3-6, size code 0 (160 bits)
+    data = _convert_bits(bytes([kind << 3]) + payload, 8, 5)
+    checksum = _cashaddr_polymod([ord(c) & 31 for c in prefix] + [0] + data + [0] * 8)
+    data += [(checksum >> 5 * (7 - i)) & 31 for i in range(8)]
+    return prefix + ":" + "".join(BECH32_CHARSET[d] for d in data)
+
+
+def public_key_to_cashaddr(public_key: bytes, prefix: str = "bitcoincash") -> str:
+    """Bitcoin Cash P2PKH address in CashAddr format (bitcoincash:q...)"""
+    return encode_cashaddr(prefix, 0, hash160(public_key))
+
+
+# ----------------------------------------------------------------------------
+# Taproot (BIP340/341/86)
+# ----------------------------------------------------------------------------
+
+_TAG_HASH_PREFIXES: dict = {}
+
+
+def tagged_hash(tag: str, msg: bytes) -> bytes:
+    """BIP340 tagged hash: SHA256(SHA256(tag) || SHA256(tag) || msg)"""
+    prefix = _TAG_HASH_PREFIXES.get(tag)
+    if prefix is None:
+        tag_hash = _sha256(tag.encode())
+        prefix = _TAG_HASH_PREFIXES[tag] = tag_hash + tag_hash
+    return _sha256(prefix + msg)
+
+
+def taproot_output_key(public_key: bytes) -> bytes:
+    """
+    BIP86 tweaked x-only output key Q = lift_x(P) + H_TapTweak(P) * G.
+    
+    Args:
+        public_key: Internal key (SEC1 compressed or uncompressed)
+        
+    Returns:
+        32-byte x-only output key
+    """
+    x, y = parse_point(public_key)
+    if y & 1:
+        y = SECP256K1_P - y
+    xonly = x.to_bytes(32, 'big')
+    t = int.from_bytes(tagged_hash("TapTweak", xonly), 'big')
+    if t >= SECP256K1_N:
+        raise ValueError("Invalid Taproot tweak")
+    q = point_add(scalar_base_mult(t), (x, y))
+    return q[0].to_bytes(32, 'big')
+
+
+def private_key_to_eth_address(private_key: bytes) -> str:
+    """
+    Convert private key to Ethereum address.
+    
+    Args:
+        private_key: 32-byte private key
+        
+    Returns:
+        EIP-55 checksummed Ethereum address with 0x prefix
+    """
+    return public_key_to_eth_address(private_key_to_public_key(private_key, compressed=False))
+
+
+def private_key_to_btc_address(private_key: bytes) -> str:
+    """
+    Convert private key to Bitcoin P2PKH address.
+    
+    Args:
+        private_key: 32-byte private key
+        
+    Returns:
+        Bitcoin address (P2PKH format, compressed public key)
+    """
+    return public_key_to_btc_address(private_key_to_public_key(private_key))
+
+
+def private_keys_to_eth_addresses(private_keys: List[bytes]) -> List[str]:
+    """Batched private_key_to_eth_address (one shared inversion per window)"""
+    return [public_key_to_eth_address(pub) for pub in batch_public_keys(private_keys, compressed=False)]
+
+
+def private_keys_to_btc_addresses(private_keys: List[bytes]) -> List[str]:
+    """Batched private_key_to_btc_address (one shared inversion per window)"""
+    return [public_key_to_btc_address(pub) for pub in batch_public_keys(private_keys)]
+
+
+# ============================================================================
+# CHAIN REGISTRY
+# ============================================================================
+
+@dataclass(frozen=True)
+class WalletSpec:
+    """
+    A chain plugin: derivation path template, curve, address encoder and
+    display metadata.
+    
+    path_template is a derivation path with {account}, {change} and {index}
+    placeholders; spec.path is the first address (all placeholders 0).
+    """
+    chain: str
+    alias: str
+    path_template: str
+    to_address: Callable[[bytes], str]
+    explorer_url: str
+    xpub_kind: str = "xpub"
+    # Encoders that decompress anyway are cheaper fed an uncompressed key
+    uncompressed: bool = False
+    # "secp256k1" (BIP32) or "ed25519" (SLIP-10, hardened-only, no xpub)
+    curve: str = "secp256k1"
+    # Display metadata for the UI and exported files
+    icon: str = "🟠"
+    realm: str = "Royaume Bitcoin"
+    testnet: bool = False
+    
+    @property
+    def path(self) -> str:
+        return self.path_for()
+    
+    def path_for(self, account: int = 0, change: int = 0, index: int = 0) -> str:
+        """Derivation path of one address"""
+        return self.path_template.format(account=account, change=change, index=index)
+
+
+# Every registered chain by alias, in display order
+CHAIN_REGISTRY: Dict[str, WalletSpec] = {}
+
+# Short chain names accepted on the command line -> chain name
+CHAIN_ALIASES: Dict[str, str] = {}
+
+
+def register_chain(spec: WalletSpec) -> WalletSpec:
+    """
+    Add a chain plugin to the registry.
+    
+    Raises:
+        ValueError: If the alias or chain name is already registered,
+                    or the curve is unsupported
+    """
+    if spec.curve not in ("secp256k1", "ed25519"):
+        raise ValueError(f"Unsupported curve {spec.curve!r}")
+    if spec.alias in CHAIN_REGISTRY or spec.chain in CHAIN_ALIASES.values():
+        raise ValueError(f"Chain {spec.chain!r} ({spec.alias}) is already registered")
+    CHAIN_REGISTRY[spec.alias] = spec
+    CHAIN_ALIASES[spec.alias] = spec.chain
+    return spec
+
+
+_BTC_EXPLORER = "https://www.blockchain.com/explorer/addresses/btc/{}"
+_BTC_TESTNET_EXPLORER = "https://mempool.space/testnet/address/{}"
+_ETH = dict(uncompressed=True, icon="🔷", realm="Royaume Ethereum")
+_TESTNET = dict(icon="🧪", realm="Terres d'Essai", testnet=True)
+
+for _spec in (
+    WalletSpec("Ethereum", "eth", "m/44'/60'/{account}'/{change}/{index}", public_key_to_eth_address,
+               "https://etherscan.io/address/{}", **_ETH),
+    WalletSpec("Bitcoin", "btc", "m/44'/0'/{account}'/{change}/{index}", public_key_to_btc_address,
+               _BTC_EXPLORER),
+    WalletSpec("Bitcoin P2SH-SegWit", "btc-p2sh", "m/49'/0'/{account}'/{change}/{index}",
+               public_key_to_p2sh_p2wpkh_address, _BTC_EXPLORER, "ypub"),
+    WalletSpec("Bitcoin SegWit", "btc-segwit", "m/84'/0'/{account}'/{change}/{index}",
+               public_key_to_p2wpkh_address, _BTC_EXPLORER, "zpub"),
+    WalletSpec("Bitcoin Taproot", "btc-taproot", "m/86'/0'/{account}'/{change}/{index}",
+               public_key_to_p2tr_address, _BTC_EXPLORER, uncompressed=True),
+    WalletSpec("Solana", "sol", "m/44'/501'/{account}'/0'", public_key_to_sol_address,
+               "https://explorer.solana.com/address/{}", curve="ed25519",
+               icon="🟣", realm="Royaume Solana"),
+    WalletSpec("Litecoin", "ltc", "m/44'/2'/{account}'/{change}/{index}",
+               functools.partial(public_key_to_btc_address, version=0x30),
+               "https://blockchair.com/litecoin/address/{}", icon="⚪", realm="Royaume Litecoin"),
+    WalletSpec("Litecoin SegWit", "ltc-segwit", "m/84'/2'/{account}'/{change}/{index}",
+               functools.partial(public_key_to_p2wpkh_address, hrp="ltc"),
+               "https://blockchair.com/litecoin/address/{}", "zpub", icon="⚪", realm="Royaume Litecoin"),
+    WalletSpec("Dogecoin", "doge", "m/44'/3'/{account}'/{change}/{index}",
+               functools.partial(public_key_to_btc_address, version=0x1E),
+               "https://blockchair.com/dogecoin/address/{}", icon="🐕", realm="Royaume Dogecoin"),
+    WalletSpec("Bitcoin Cash", "bch", "m/44'/145'/{account}'/{change}/{index}", public_key_to_cashaddr,
+               "https://blockchair.com/bitcoin-cash/address/{}", icon="🟢", realm="Royaume Bitcoin Cash"),
+    WalletSpec("Bitcoin Testnet", "btc-test", "m/44'/1'/{account}'/{change}/{index}",
+               functools.partial(public_key_to_btc_address, version=0x6F),
+               _BTC_TESTNET_EXPLORER, "tpub", **_TESTNET),
+    WalletSpec("Bitcoin Testnet SegWit", "btc-test-segwit", "m/84'/1'/{account}'/{change}/{index}",
+               functools.partial(public_key_to_p2wpkh_address, hrp="tb"),
+               _BTC_TESTNET_EXPLORER, "vpub", **_TESTNET),
+    WalletSpec("Ethereum Sepolia", "eth-sepolia", "m/44'/60'/{account}'/{change}/{index}",
+               public_key_to_eth_address, "https://sepolia.etherscan.io/address/{}",
+               uncompressed=True, icon="🧪", realm="Terres d'Essai", testnet=True),
+):
+    register_chain(_spec)
+
+# Address types shown by derive_wallet_info by default, in display order
+WALLET_SPECS = [CHAIN_REGISTRY[alias] for alias in ("eth", "btc", "btc-p2sh", "btc-segwit", "btc-taproot", "sol")]
+
+
+def _chain_spec(chain: str) -> WalletSpec:
+    """Look up a registered chain by chain name or short alias"""
+    spec = CHAIN_REGISTRY.get(chain.lower())
+    if spec is not None:
+        return spec
+    for spec in CHAIN_REGISTRY.values():
+        if spec.chain.lower() == chain.lower():
+            return spec
+    raise ValueError(
+        f"Unsupported chain {chain!r}, expected one of {', '.join(CHAIN_ALIASES)}"
+    )
+
+
+def chain_specs(chains: Optional[List[str]] = None) -> List[WalletSpec]:
+    """Registered chains by name or alias (default: WALLET_SPECS)"""
+    if chains is None:
+        return list(WALLET_SPECS)
+    return [_chain_spec(chain) for chain in chains]
+
+
+def account_path(path: str) -> str:
+    """Account-level prefix of a BIP44-style path ("m/44'/0'/0'/0/0" -> "m/44'/0'/0'")"""
+    return "/".join(path.split("/")[:4])
+
+
+def _wallet_from_node(node: ExtendedKey, spec: WalletSpec) -> WalletInfo:
+    """Build the WalletInfo of a derived node for a registered chain"""
+    address = spec.to_address(node.public_key)
+    return WalletInfo(
+        chain=spec.chain,
+        address=address,
+        path=spec.path,
+        explorer_url=spec.explorer_url.format(address)
+    )
+
+
+def _ed25519_wallet(seed: bytes, spec: WalletSpec, cache: dict) -> WalletInfo:
+    """WalletInfo of an ed25519 spec (SLIP-10 nodes memoized under cache["ed25519"])"""
+    key, _ = derive_ed25519_path(seed, spec.path, cache.setdefault("ed25519", {}))
+    address = spec.to_address(ed25519_public_key(key))
+    return WalletInfo(
+        chain=spec.chain,
+        address=address,
+        path=spec.path,
+        explorer_url=spec.explorer_url.format(address)
+    )
+
+
+def wallets_from_seed(
+    seed: bytes,
+    specs: Optional[List[WalletSpec]] = None,
+    cache: Optional[dict] = None,
+) -> List[WalletInfo]:
+    """
+    Derive every address type from one seed.
+    
+    All paths are walked from a single master node with shared prefixes,
+    level by level across chains (see derive_paths), so extra address types
+    cost one short branch each and their public keys share one inversion.
+    
+    Args:
+        seed: BIP39 seed (64 bytes)
+        specs: Registered chains (default: WALLET_SPECS)
+        cache: Optional derive_paths cache shared with derive_account_keys
+        
+    Returns:
+        List of WalletInfo, one per spec
+    """
+    specs = WALLET_SPECS if specs is None else specs
+    if cache is None:
+        cache = {}
+    master = cache.get(()) or master_key_from_seed(seed)
+    secp = [spec for spec in specs if spec.curve == "secp256k1"]
+    nodes = dict(zip(secp, derive_paths(master, [spec.path for spec in secp], cache)))
+    _prime_public_keys(list(nodes.values()))
+    return [
+        _wallet_from_node(nodes[spec], spec) if spec in nodes else _ed25519_wallet(seed, spec, cache)
+        for spec in specs
+    ]
+
+
+def derive_wallet_info(mnemonic: str, chains: Optional[List[str]] = None) -> List[WalletInfo]:
+    """
+    Derive wallet addresses from mnemonic.
+    
+    PBKDF2 runs once for all chains, which then share one node cache.
+    
+    Args:
+        mnemonic: BIP39 mnemonic phrase
+        chains: Chain names or aliases from CHAIN_REGISTRY (default: WALLET_SPECS)
+        
+    Returns:
+        List of WalletInfo, one per chain
+        
+    Raises:
+        ValueError: If a chain is not registered
+    """
+    specs = chain_specs(chains)
+    return wallets_from_seed(mnemonic_to_seed(mnemonic), specs)
+
+
+# ============================================================================
+# WATCH-ONLY ACCOUNTS
+# ============================================================================
+
+@dataclass
+class AccountKey:
+    """Account-level extended public key of a chain"""
+    chain: str
+    path: str
+    xpub: str
+
+
+def derive_account_keys(
+    seed: bytes,
+    cache: Optional[dict] = None,
+    specs: Optional[List[WalletSpec]] = None,
+) -> List[AccountKey]:
+    """
+    Extended public keys of the account nodes behind derive_wallet_info.
+    
+    The account node is the last hardened step of each path, so everything
+    below it (change/index) can later be derived from the xpub alone, without
+    the mnemonic and without PBKDF2. ed25519 chains have no xpub and are
+    skipped.
+    
+    Args:
+        seed: BIP39 seed (64 bytes)
+        cache: Optional derive_paths cache shared with wallets_from_seed
+        specs: Registered chains (default: WALLET_SPECS)
+        
+    Returns:
+        List of AccountKey for supported chains
+    """
+    if cache is None:
+        cache = {}
+    master = cache.get(()) or master_key_from_seed(seed)
+    specs = [spec for spec in (WALLET_SPECS if specs is None else specs) if spec.curve == "secp256k1"]
+    paths = [account_path(spec.path) for spec in specs]
+    nodes = derive_paths(master, paths, cache)
+    # Account public keys and their parents' (for the fingerprint), batched
+    _prime_public_keys(nodes + [node._parent for node in nodes if node._parent is not None])
+    return [
+        AccountKey(chain=spec.chain, path=path, xpub=serialize_extended_key(node, spec.xpub_kind))
+        for spec, path, node in zip(specs, paths, nodes)
+    ]
+
+
+def derive_watch_only_wallets(
+    xpub: str,
+    chain: str,
+    start: int = 0,
+    count: int = 1,
+    change: int = 0,
+    path_prefix: Optional[str] = None,
+) -> List[WalletInfo]:
+    """
+    Derive receive (or change) addresses from an account-level extended public key.
+    
+    Args:
+        xpub: Account xpub/ypub/zpub (a private xprv is accepted and neutered)
+        chain: Chain name or short alias ("btc", "eth")
+        start: First address index
+        count: Number of addresses
+        change: 0 for receive addresses, 1 for change addresses
+        path_prefix: Account path shown in WalletInfo.path
+                     (default: the chain's standard account path)
+        
+    Returns:
+        List of WalletInfo, one per index
+        
+    Raises:
+        ValueError: If the key or chain is invalid
+    """
+    spec = _chain_spec(chain)
+    if spec.curve != "secp256k1":
+        raise ValueError(f"{spec.chain} has no extended public keys (SLIP-10 ed25519 is hardened-only)")
+    node, _ = parse_extended_key(xpub)
+    branch = node.neuter().child(change)
+    prefix = f"{path_prefix or account_path(spec.path)}/{change}"
+    return _branch_wallets(branch, spec, prefix, start, count)
+
+
+def _branch_wallets(branch: ExtendedKey, spec: WalletSpec, prefix: str, start: int, count: int) -> List[WalletInfo]:
+    """WalletInfo for children start..start+count-1 of a change-level node"""
+    indices = list(range(start, start + count))
+    if backend_name("pubkey_tweak_add") == REFERENCE_BACKEND:
+        points = batch_child_points(branch.public_key, branch.chain_code, indices)
+        keys = [serialize_point(point, compressed=not spec.uncompressed) for point in points]
+    else:
+        # Accelerated backends are faster one child at a time than the batch
+        keys = [branch.child(index).public_key for index in indices]
+    wallets = []
+    for index, key in zip(indices, keys):
+        address = spec.to_address(key)
+        wallets.append(WalletInfo(
+            chain=spec.chain,
+            address=address,
+            path=f"{prefix}/{index}",
+            explorer_url=spec.explorer_url.format(address),
+        ))
+    return wallets
+
+
+class _AddressPages(ABC):
+    """
+    Thread-safe, LRU-bounded page cache shared by the address pagers.
+    
+    Subclasses derive the page_size addresses from a start index in _derive.
+    """
+    
+    # Non-hardened indices stop at 2**31 - 1
+    MAX_INDEX = HARDENED - 1
+    
+    def __init__(self, spec: WalletSpec, page_size: int, max_pages: int, change: int = 0):
+        self.spec = spec
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.change = change
+        self._pages: "OrderedDict[int, List[WalletInfo]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @property
+    def page_count(self) -> int:
+        return (self.MAX_INDEX + 1) // self.page_size
+    
+    def page_of(self, index: int) -> int:
+        """Page number containing an address index"""
+        return index // self.page_size
+    
+    def cached(self, page: int) -> Optional[List[WalletInfo]]:
+        """Page if already derived, without deriving it"""
+        with self._lock:
+            rows = self._pages.get(page)
+            if rows is not None:
+                self._pages.move_to_end(page)
+            return rows
+    
+    def page(self, page: int) -> List[WalletInfo]:
+        """
+        Addresses of a page, derived on first use.
+        
+        Raises:
+            ValueError: If the page is out of range
+        """
+        if not (0 <= page < self.page_count):
+            raise ValueError(f"Page must be 0-{self.page_count - 1}, got {page}")
+        
+        with self._lock:
+            rows = self._pages.get(page)
+            if rows is None:
+                rows = self._derive(page * self.page_size)
+                self._pages[page] = rows
+                while len(self._pages) > self.max_pages:
+                    self._pages.popitem(last=False)
+            else:
+                self._pages.move_to_end(page)
+            return rows
+    
+    @abstractmethod
+    def _derive(self, start: int) -> List[WalletInfo]:
+        """Addresses start .. start + page_size - 1"""
+
+
+class AddressPager(_AddressPages):
+    """
+    Lazily derived, LRU-bounded pages of addresses for one account.
+    
+    Pages are derived on first access from the public account node (no
+    secret material needed) and the most recently used max_pages pages are
+    kept. page() is thread-safe, so a UI can derive and prefetch pages from
+    a background worker.
+    
+    Usage:
+        pager = AddressPager(account_node, spec)
+        rows = pager.page(0)        # indices 0..page_size-1
+        pager.page(1)               # prefetch the next one
+    """
+    
+    def __init__(
+        self,
+        account: ExtendedKey,
+        spec: WalletSpec,
+        page_size: int = 50,
+        max_pages: int = 16,
+        change: int = 0,
+        path_prefix: Optional[str] = None,
+    ):
+        super().__init__(spec, page_size, max_pages, change)
+        self._branch = account.neuter().child(change)
+        self._prefix = f"{path_prefix or account_path(spec.path)}/{change}"
+    
+    def _derive(self, start: int) -> List[WalletInfo]:
+        return _branch_wallets(self._branch, self.spec, self._prefix, start, self.page_size)
+
+
+class Ed25519Pager(_AddressPages):
+    """
+    AddressPager for a SLIP-10 ed25519 chain, sweeping the account index.
+    
+    ed25519 paths are hardened all the way down (Solana: m/44'/501'/i'/0'),
+    so pages are derived from the private coin-level node: its CKD HMAC is
+    prepared once per page and the public keys share one inversion.
+    """
+    
+    def __init__(
+        self,
+        seed: bytes,
+        spec: WalletSpec,
+        page_size: int = 50,
+        max_pages: int = 16,
+        cache: Optional[dict] = None,
+    ):
+        super().__init__(spec, page_size, max_pages)
+        # m/44'/501' is the shared parent, the rest of the path follows the account index
+        steps = spec.path_template.split("/")
+        if steps[3] != "{account}'":
+            raise ValueError(f"{spec.chain} path does not sweep the account index")
+        self._coin_path = "/".join(steps[:3])
+        self._suffix = "/".join(steps[4:]).format(change=0, index=0)
+        self._suffix_indices = parse_path("m/" + self._suffix) if self._suffix else []
+        self._parent = derive_ed25519_path(seed, self._coin_path, cache)
+    
+    def _derive(self, start: int) -> List[WalletInfo]:
+        indices = range(start, start + self.page_size)
+        keys = ed25519_range_keys(self._parent, [HARDENED + i for i in indices], self._suffix_indices)
+        wallets = []
+        for index, public_key in zip(indices, ed25519_public_keys(keys)):
+            address = self.spec.to_address(public_key)
+            path = f"{self._coin_path}/{index}'" + (f"/{self._suffix}" if self._suffix else "")
+            wallets.append(WalletInfo(
+                chain=self.spec.chain,
+                address=address,
+                path=path,
+                explorer_url=self.spec.explorer_url.format(address),
+            ))
+        return wallets
+
+
+# ============================================================================
+# MESSAGE SIGNING (BIP-137 / EIP-191)
+# ============================================================================
+
+# BIP-137 header byte (before + recid) per compressed address type
+_BIP137_HEADERS = {
+    "Bitcoin": 31,
+    "Bitcoin P2SH-SegWit": 35,
+    "Bitcoin SegWit": 39,
+}
+_EIP191_CHAINS = ("Ethereum",)
+
+
+@dataclass
+class SignedMessage:
+    """A message signed with a vault key, as proof of ownership"""
+    chain: str
+    address: str
+    message: str
+    signature: str  # base64 (BIP-137) or 0x-prefixed r || s || v (EIP-191)
+
+
+@dataclass
+class VerifyResult:
+    """Outcome of verifying one line of a signature file"""
+    line: int
+    address: str
+    valid: bool
+    error: str = ""
+
+
+@dataclass
+class VerifyStats:
+    """Totals for a batch verification run"""
+    checked: int = 0
+    valid: int = 0
+    invalid: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Signatures per second"""
+        return self.checked / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _varint(n: int) -> bytes:
+    """Bitcoin CompactSize encoding"""
+    if n < 0xFD:
+        return bytes([n])
+    if n <= 0xFFFF:
+        return b'\xfd' + struct.pack('<H', n)
+    if n <= 0xFFFFFFFF:
+        return b'\xfe' + struct.pack('<I', n)
+    return b'\xff' + struct.pack('<Q', n)
+
+
+def bitcoin_message_hash(message: bytes) -> bytes:
+    """Double SHA-256 of the "Bitcoin Signed Message" envelope"""
+    data = b"\x18Bitcoin Signed Message:\n" + _varint(len(message)) + message
+    return _sha256(_sha256(data))
+
+
+def ethereum_message_hash(message: bytes) -> bytes:
+    """EIP-191 personal_sign digest (version 0x45)"""
+    return keccak256(b"\x19Ethereum Signed Message:\n" + str(len(message)).encode('ascii') + message)
+
+
+def _rfc6979_nonces(d: int, msg_hash: bytes) -> Iterator[int]:
+    """RFC 6979 deterministic nonce candidates (HMAC-SHA256, 256-bit order)"""
+    N = SECP256K1_N
+    x = d.to_bytes(32, 'big')
+    h1 = (int.from_bytes(msg_hash, 'big') % N).to_bytes(32, 'big')
+    v = b'\x01' * 32
+    k = b'\x00' * 32
+    k = hmac.digest(k, v + b'\x00' + x + h1, 'sha256')
+    v = hmac.digest(k, v, 'sha256')
+    k = hmac.digest(k, v + b'\x01' + x + h1, 'sha256')
+    v = hmac.digest(k, v, 'sha256')
+    while True:
+        v = hmac.digest(k, v, 'sha256')
+        candidate = int.from_bytes(v, 'big')
+        if 0 < candidate < N:
+            yield candidate
+        k = hmac.digest(k, v + b'\x00', 'sha256')
+        v = hmac.digest(k, v, 'sha256')
+
+
+def ecdsa_sign(private_key: bytes, msg_hash: bytes) -> Tuple[int, int, int]:
+    """
+    Deterministic secp256k1 ECDSA signature (RFC 6979, low-S).
+    
+    The nonce point k*G comes from the fixed-base window table.
+    
+    Args:
+        private_key: 32-byte private key
+        msg_hash: 32-byte message digest
+        
+    Returns:
+        (r, s, recovery_id)
+    """
+    N = SECP256K1_N
+    d = int.from_bytes(private_key, 'big')
+    if not (0 < d < N):
+        raise ValueError("Private key out of range")
+    z = int.from_bytes(msg_hash, 'big') % N
+    
+    for k in _rfc6979_nonces(d, msg_hash):
+        x, y = scalar_base_mult(k)
+        r = x % N
+        if r == 0:
+            continue
+        s = pow(k, -1, N) * (z + r * d) % N
+        if s == 0:
+            continue
+        recid = (y & 1) | (2 if x >= N else 0)
+        if s > N // 2:
+            s = N - s
+            recid ^= 1
+        return r, s, recid
+
+
+# GLV endomorphism of secp256k1: lambda * (x, y) = (beta * x, y)
+_GLV_BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+_GLV_LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+_GLV_A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+_GLV_B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+_GLV_A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+
+
+def _glv_split(k: int) -> Tuple[int, int]:
+    """Split k into signed ~128-bit (k1, k2) with k = k1 + k2 * lambda mod N"""
+    N = SECP256K1_N
+    c1 = (_GLV_A1 * k + N // 2) // N
+    c2 = (-_GLV_B1 * k + N // 2) // N
+    k1 = k - c1 * _GLV_A1 - c2 * _GLV_A2
+    k2 = -c1 * _GLV_B1 - c2 * _GLV_A1
+    return k1, k2
+
+
+def _shamir_mult(a: int, b: int, q: Point) -> Optional[Tuple[int, int, int]]:
+    """
+    a*G + b*Q in Jacobian coordinates with Shamir's trick.
+    
+    Both scalars are split with the GLV endomorphism, giving four ~128-bit
+    scalars over G, lambda*G, Q and lambda*Q. They are scanned together one
+    bit at a time against the 15 subset sums of those points (normalized
+    with one shared inversion), so 128 doublings serve all four terms.
+    """
+    P = SECP256K1_P
+    scalars = []
+    points = []
+    for k, (x, y) in ((a, SECP256K1_G), (b, q)):
+        for part, px in zip(_glv_split(k % SECP256K1_N), (x, _GLV_BETA * x % P)):
+            scalars.append(abs(part))
+            points.append((px, y if part >= 0 else P - y))
+    
+    sums = [None] * 16
+    for mask in range(1, 16):
+        low = mask & -mask
+        sums[mask] = _jacobian_add_affine(sums[mask ^ low], points[low.bit_length() - 1])
+    table = _batch_to_affine(sums)
+    
+    s0, s1, s2, s3 = scalars
+    acc = None
+    for bit in range(max(s.bit_length() for s in scalars) - 1, -1, -1):
+        acc = _jacobian_double(acc)
+        mask = ((s0 >> bit) & 1) | ((s1 >> bit) & 1) << 1 | ((s2 >> bit) & 1) << 2 | ((s3 >> bit) & 1) << 3
+        if mask:
+            acc = _jacobian_add_affine(acc, table[mask])
+    return acc
+
+
+def ecdsa_verify(public_key: bytes, msg_hash: bytes, r: int, s: int) -> bool:
+    """
+    Verify a secp256k1 ECDSA signature (u1*G + u2*Q via _shamir_mult).
+    
+    Args:
+        public_key: SEC1 public key
+        msg_hash: 32-byte message digest
+        r, s: Signature scalars
+        
+    Returns:
+        True if the signature is valid
+    """
+    N, P = SECP256K1_N, SECP256K1_P
+    if not (0 < r < N and 0 < s < N):
+        return False
+    w = pow(s, -1, N)
+    z = int.from_bytes(msg_hash, 'big') % N
+    acc = _shamir_mult(z * w % N, r * w % N, parse_point(public_key))
+    if acc is None:
+        return False
+    # Compare x(R) mod N to r without leaving Jacobian coordinates
+    x, _, zr = acc
+    zz = zr * zr % P
+    return any(x == c * zz % P for c in (r, r + N) if c < P)
+
+
+def recover_public_key(msg_hash: bytes, r: int, s: int, recid: int) -> bytes:
+    """
+    Public key that produced a recoverable signature (Q = r^-1 (s*R - z*G)).
+    
+    Returns:
+        Compressed SEC1 public key
+        
+    Raises:
+        ValueError: If the signature does not recover to a valid key
+    """
+    N = SECP256K1_N
+    if not (0 < r < N and 0 < s < N) or not (0 <= recid <= 3):
+        raise ValueError("Invalid signature values")
+    x = r + (recid >> 1) * N
+    if x >= SECP256K1_P:
+        raise ValueError("Invalid signature recovery id")
+    big_r = parse_point(bytes([2 + (recid & 1)]) + x.to_bytes(32, 'big'))
+    
+    rinv = pow(r, -1, N)
+    z = int.from_bytes(msg_hash, 'big') % N
+    q = _to_affine(_shamir_mult(-z * rinv % N, s * rinv % N, big_r))
+    if q is None:
+        raise ValueError("Signature recovers to the point at infinity")
+    return serialize_point(q)
+
+
+def sign_message(private_key: bytes, message: str, chain: str) -> SignedMessage:
+    """
+    Sign a text message the way wallets do for proof of ownership.
+    
+    Ethereum uses EIP-191 personal_sign (hex r || s || v); Bitcoin P2PKH,
+    P2SH-SegWit and native SegWit use BIP-137 (base64, header byte encodes
+    the address type). BIP-137 has no Taproot format and ed25519
+    chains are not supported.
+    
+    Args:
+        private_key: 32-byte private key
+        message: Text message (UTF-8)
+        chain: Chain name or alias from CHAIN_REGISTRY
+        
+    Returns:
+        SignedMessage with the signing address
+        
+    Raises:
+        ValueError: If the chain has no message signature format
+    """
+    spec = _chain_spec(chain)
+    data = message.encode('utf-8')
+    
+    if spec.chain in _EIP191_CHAINS:
+        r, s, recid = ecdsa_sign(private_key, ethereum_message_hash(data))
+        signature = '0x' + (r.to_bytes(32, 'big') + s.to_bytes(32, 'big') + bytes([27 + recid])).hex()
+        address = private_key_to_eth_address(private_key)
+    elif spec.chain in _BIP137_HEADERS:
+        r, s, recid = ecdsa_sign(private_key, bitcoin_message_hash(data))
+        raw = bytes([_BIP137_HEADERS[spec.chain] + recid]) + r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
+        signature = base64.b64encode(raw).decode('ascii')
+        address = spec.to_address(private_key_to_public_key(private_key))
+    else:
+        raise ValueError(f"No message signature format for {spec.chain}")
+    
+    return SignedMessage(chain=spec.chain, address=address, message=message, signature=signature)
+
+
+def sign_wallet_message(seed: bytes, wallet: WalletInfo, message: str) -> SignedMessage:
+    """Sign a message with the key of a derived wallet (derive_key_from_path)"""
+    signed = sign_message(derive_key_from_path(seed, wallet.path), message, wallet.chain)
+    if signed.address != wallet.address:
+        raise ValueError("Derived key does not match the wallet address")
+    return signed
+
+
+def verify_message(address: str, message: str, signature: str) -> bool:
+    """
+    Verify a BIP-137 or EIP-191 signed message against an address.
+    
+    0x addresses are checked as EIP-191, anything else as BIP-137. Compressed
+    BIP-137 signatures are accepted for any of the three single-key address
+    types, as some wallets always use the P2PKH header.
+    
+    Returns:
+        True if the signature was made by the key behind address
+        
+    Raises:
+        ValueError: If the signature encoding is malformed
+    """
+    data = message.encode('utf-8')
+    
+    if address.lower().startswith('0x'):
+        try:
+            raw = bytes.fromhex(signature[2:] if signature.lower().startswith('0x') else signature)
+        except ValueError:
+            raise ValueError("Signature is not hex") from None
+        if len(raw) != 65:
+            raise ValueError("EIP-191 signature must be 65 bytes")
+        v = raw[64]
+        recid = v - 27 if v >= 27 else v
+        pub = recover_public_key(
+            ethereum_message_hash(data),
+            int.from_bytes(raw[:32], 'big'), int.from_bytes(raw[32:64], 'big'), recid,
+        )
+        return public_key_to_eth_address(pub).lower() == address.lower()
+    
+    try:
+        raw = base64.b64decode(signature, validate=True)
+    except ValueError:
+        raise ValueError("Signature is not base64") from None
+    if len(raw) != 65 or not (27 <= raw[0] <= 42):
+        raise ValueError("BIP-137 signature must be 65 bytes with a 27..42 header")
+    header = raw[0]
+    pub = recover_public_key(
+        bitcoin_message_hash(data),
+        int.from_bytes(raw[1:33], 'big'), int.from_bytes(raw[33:], 'big'), (header - 27) & 3,
+    )
+    if header < 31:
+        candidates = [base58check_encode(b'\x00' + hash160(serialize_point(parse_point(pub), compressed=False)))]
+    else:
+        candidates = [
+            public_key_to_btc_address(pub),
+            public_key_to_p2sh_p2wpkh_address(pub),
+            public_key_to_p2wpkh_address(pub),
+        ]
+    return address in candidates
+
+
+def _verify_line(number: int, line: str) -> VerifyResult:
+    """Verify one JSON line {"address", "message", "signature"}"""
+    address = ""
+    try:
+        record = json.loads(line)
+        for name in ("address", "message", "signature"):
+            if not isinstance(record[name], str):
+                raise ValueError(f"{name} must be a string, got {type(record[name]).__name__}")
+        address = record["address"]
+        valid = verify_message(address, record["message"], record["signature"])
+        return VerifyResult(line=number, address=address, valid=valid)
+    except (ValueError, KeyError, TypeError) as e:
+        return VerifyResult(line=number, address=address, valid=False, error=str(e) or type(e).__name__)
+
+
+def _verify_chunk(chunk: List[Tuple[int, str]]) -> List[VerifyResult]:
+    """Worker process: verify a chunk of (line_number, line) pairs"""
+    return [_verify_line(number, line) for number, line in chunk]
+
+
+def _numbered_chunks(lines, chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Group non-blank lines into chunks of (1-based line number, line)"""
+    chunk = []
+    for number, line in enumerate(lines, 1):
+        if line.strip():
+            chunk.append((number, line))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def verify_message_file(
+    lines,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    progress: Optional[Callable[[VerifyStats], None]] = None,
+) -> Tuple[List[VerifyResult], VerifyStats]:
+    """
+    Verify many signed messages, one JSON object per line.
+    
+    Each line holds "address", "message" and "signature" (the format written
+    by the vault screen). Chunks of lines are spread over worker processes
+    and results come back in file order. Malformed lines are reported as
+    errors rather than aborting the run.
+    
+    Args:
+        lines: Iterable of text lines (e.g. an open file)
+        workers: Worker processes (default: all cores, 1 = in-process)
+        chunk_size: Lines per IPC message
+        progress: Optional callback(stats) after each chunk
+        
+    Returns:
+        (results for non-blank lines, VerifyStats)
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = VerifyStats()
+    results: List[VerifyResult] = []
+    started = time.monotonic()
+    
+    def collect(chunk_results: List[VerifyResult]) -> None:
+        for result in chunk_results:
+            stats.checked += 1
+            if result.error:
+                stats.errors += 1
+            elif result.valid:
+                stats.valid += 1
+            else:
+                stats.invalid += 1
+        results.extend(chunk_results)
+        stats.elapsed = time.monotonic() - started
+        if progress is not None:
+            progress(stats)
+    
+    chunks = _numbered_chunks(lines, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            collect(_verify_chunk(chunk))
+    else:
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            for chunk_results in pool.imap(_verify_chunk, chunks):
+                collect(chunk_results)
+    
+    stats.elapsed = time.monotonic() - started
+    return results, stats
+
+
+# ============================================================================
+# VANITY ADDRESS SEARCH
+# ============================================================================
+
+# Chains supported by the vanity search (short alias -> chain name)
+VANITY_CHAINS = {
+    "btc": "Bitcoin",
+    "eth": "Ethereum",
+}
+
+
+@dataclass
+class VanityResult:
+    """Winning mnemonic of a vanity search"""
+    mnemonic: str
+    entropy_hex: str
+    wallet: WalletInfo
+    attempts: int
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        return self.attempts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def normalize_vanity_pattern(chain: str, prefix: str = "", suffix: str = "") -> Tuple[str, str]:
+    """
+    Validate and lowercase a vanity prefix/suffix pair.
+    
+    Ethereum patterns are matched against the hex part of the address, so an
+    optional 0x prefix is dropped. Bitcoin P2PKH patterns are matched against
+    the full address, which always starts with '1'.
+    
+    Args:
+        chain: Short chain name ("btc" or "eth")
+        prefix: Wanted address prefix (case-insensitive)
+        suffix: Wanted address suffix (case-insensitive)
+        
+    Returns:
+        Tuple of (prefix, suffix), lowercased
+        
+    Raises:
+        ValueError: If the chain is unknown or a pattern can never match
+    """
+    if chain.lower() not in VANITY_CHAINS:
+        raise ValueError(
+            f"Unsupported chain {chain!r}, expected one of {', '.join(VANITY_CHAINS)}"
+        )
+    prefix = prefix.strip().lower()
+    suffix = suffix.strip().lower()
+    
+    if chain.lower() == "eth":
+        if prefix.startswith("0x"):
+            prefix = prefix[2:]
+        alphabet = set("0123456789abcdef")
+    else:
+        if prefix and not prefix.startswith("1"):
+            raise ValueError("Bitcoin P2PKH addresses always start with '1'")
+        alphabet = set(BASE58_ALPHABET.lower())
+    
+    for c in prefix + suffix:
+        if c not in alphabet:
+            raise ValueError(f"Character {c!r} can never appear in a {chain.upper()} address")
+    
+    if not prefix and not suffix:
+        raise ValueError("Vanity search needs a prefix or a suffix")
+    
+    return prefix, suffix
+
+
+def vanity_difficulty(chain: str, prefix: str = "", suffix: str = "") -> float:
+    """
+    Estimate the expected number of attempts to find a vanity match.
+    
+    Each pattern character is treated as independent and uniformly
+    distributed over the address alphabet; case-insensitive matching lets a
+    letter match any of its case variants present in the alphabet.
+    
+    Args:
+        chain: Short chain name ("btc" or "eth")
+        prefix: Wanted address prefix
+        suffix: Wanted address suffix
+        
+    Returns:
+        Expected attempts (1 / probability of a match)
+    """
+    prefix, suffix = normalize_vanity_pattern(chain, prefix, suffix)
+    
+    if chain.lower() == "eth":
+        return 16.0 ** (len(prefix) + len(suffix))
+    
+    def variants(c: str) -> int:
+        return sum(1 for a in BASE58_ALPHABET if a.lower() == c)
+    
+    difficulty = 1.0
+    # The leading '1' of a P2PKH address is fixed
+    for c in prefix[1:] + suffix:
+        difficulty *= len(BASE58_ALPHABET) / variants(c)
+    return difficulty
+
+
+def _vanity_matches(address: str, chain: str, prefix: str, suffix: str) -> bool:
+    """Case-insensitive vanity match on an address"""
+    body = address[2:] if chain == "eth" else address
+    body = body.lower()
+    return body.startswith(prefix) and body.endswith(suffix)
+
+
+def _vanity_worker(
+    wordlist: List[str],
+    chain: str,
+    prefix: str,
+    suffix: str,
+    entropy_bytes: int,
+    stop_event,
+    counter,
+    results,
+    report_every: int = 16,
+) -> None:
+    """Worker process: try random mnemonics until a match or stop_event"""
+    spec = _chain_spec(chain)
+    pending = 0
+    
+    while not stop_event.is_set():
+        entropy = random_entropy(entropy_bytes)
+        mnemonic = entropy_to_mnemonic(entropy, wordlist)
+        wallet = wallets_from_seed(mnemonic_to_seed(mnemonic), [spec])[0]
+        pending += 1
+        
+        if _vanity_matches(wallet.address, chain, prefix, suffix):
+            with counter.get_lock():
+                counter.value += pending
+            results.put((mnemonic, entropy.hex(), wallet))
+            stop_event.set()
+            return
+        
+        if pending >= report_every:
+            with counter.get_lock():
+                counter.value += pending
+            pending = 0
+    
+    with counter.get_lock():
+        counter.value += pending
+
+
+class VanitySearch:
+    """
+    Multi-process vanity address search over random BIP39 mnemonics.
+    
+    Every worker runs the full random_entropy -> entropy_to_mnemonic ->
+    mnemonic_to_seed -> derivation pipeline, so the winning mnemonic is a
+    regular wallet backup.
+    
+    Usage:
+        search = VanitySearch(wordlist, chain="btc", prefix="1abc")
+        search.start()
+        result = search.wait()      # or poll search.poll() from a UI timer
+        search.cancel()             # stops and reaps the workers
+    """
+    
+    def __init__(
+        self,
+        wordlist: List[str],
+        chain: str = "btc",
+        prefix: str = "",
+        suffix: str = "",
+        entropy_bytes: int = 16,
+        workers: Optional[int] = None,
+    ):
+        self.chain = chain.lower()
+        self.prefix, self.suffix = normalize_vanity_pattern(self.chain, prefix, suffix)
+        self.difficulty = vanity_difficulty(self.chain, self.prefix, self.suffix)
+        self.wordlist = wordlist
+        self.entropy_bytes = entropy_bytes
+        self.workers = workers or os.cpu_count() or 1
+        
+        # spawn keeps workers independent of the (threaded) TUI process
+        self._ctx = multiprocessing.get_context("spawn")
+        self._stop = self._ctx.Event()
+        self._counter = self._ctx.Value("Q", 0)
+        self._results = self._ctx.Queue()
+        self._processes: List[multiprocessing.Process] = []
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+        self.result: Optional[VanityResult] = None
+    
+    @property
+    def attempts(self) -> int:
+        return self._counter.value
+    
+    @property
+    def elapsed(self) -> float:
+        if self._started_at is None:
+            return 0.0
+        end = self._stopped_at or time.monotonic()
+        return end - self._started_at
+    
+    @property
+    def rate(self) -> float:
+        """Attempts per second across all workers"""
+        elapsed = self.elapsed
+        return self.attempts / elapsed if elapsed > 0 else 0.0
+    
+    @property
+    def is_running(self) -> bool:
+        return self._started_at is not None and self._stopped_at is None
+    
+    def start(self) -> None:
+        """Start one worker process per core"""
+        if self._started_at is not None:
+            raise ValueError("Vanity search already started")
+        
+        self._started_at = time.monotonic()
+        for _ in range(self.workers):
+            p = self._ctx.Process(
+                target=_vanity_worker,
+                args=(
+                    self.wordlist, self.chain, self.prefix, self.suffix,
+                    self.entropy_bytes, self._stop, self._counter, self._results,
+                ),
+                daemon=True,
+            )
+            p.start()
+            self._processes.append(p)
+    
+    def poll(self, timeout: float = 0.0) -> Optional[VanityResult]:
+        """
+        Check for a winning mnemonic without blocking (or up to timeout).
+        
+        Returns:
+            VanityResult once found, None otherwise
+        """
+        if self.result is not None:
+            return self.result
+        if self._started_at is None:
+            return None
+        
+        try:
+            if timeout > 0:
+                mnemonic, entropy_hex, wallet = self._results.get(timeout=timeout)
+            else:
+                mnemonic, entropy_hex, wallet = self._results.get_nowait()
+        except queue.Empty:
+            return None
+        
+        self.cancel()
+        self.result = VanityResult(
+            mnemonic=mnemonic,
+            entropy_hex=entropy_hex,
+            wallet=wallet,
+            attempts=self.attempts,
+            elapsed=self.elapsed,
+        )
+        return self.result
+    
+    def wait(self, timeout: Optional[float] = None, interval: float = 0.5) -> Optional[VanityResult]:
+        """Block until a match is found, the timeout expires or cancel() is called"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.result is None and not self._stop.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            self.poll(timeout=interval)
+        # A worker may set the stop flag just before its result is flushed
+        return self.poll(timeout=interval)
+    
+    def cancel(self, join_timeout: float = 2.0) -> None:
+        """Stop all workers and reap them"""
+        self._stop.set()
+        for p in self._processes:
+            p.join(join_timeout)
+            if p.is_alive():
+                p.terminate()
+                p.join()
+        if self._started_at is not None and self._stopped_at is None:
+            self._stopped_at = time.monotonic()
+    
+    def __enter__(self) -> "VanitySearch":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.cancel()
+
+
+# ============================================================================
+# BATCH WALLET GENERATION
+# ============================================================================
+
+@dataclass
+class BatchStats:
+    """Statistics for a batch generation run"""
+    wallets: int
+    elapsed: float
+    workers: int
+
+    @property
+    def rate(self) -> float:
+        """Wallets per second across all workers"""
+        return self.wallets / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def batch_fieldnames(public_only: bool = False) -> List[str]:
+    """Column names of a batch record, in output order"""
+    fields = ["index"]
+    if not public_only:
+        fields += ["mnemonic", "entropy_hex"]
+    for spec in WALLET_SPECS:
+        column = spec.alias.replace("-", "_")
+        fields += [f"{column}_address", f"{column}_path"]
+    return fields
+
+
+def _batch_record(index: int, entropy: bytes, wordlist: List[str], public_only: bool) -> dict:
+    """Mnemonic, seed and addresses for one wallet of a batch"""
+    mnemonic = entropy_to_mnemonic(entropy, wordlist)
+    seed = mnemonic_to_seed(mnemonic)
+    record = {"index": index}
+    if not public_only:
+        record["mnemonic"] = mnemonic
+        record["entropy_hex"] = entropy.hex()
+    for spec, wallet in zip(WALLET_SPECS, wallets_from_seed(seed)):
+        column = spec.alias.replace("-", "_")
+        record[f"{column}_address"] = wallet.address
+        record[f"{column}_path"] = wallet.path
+    return record
+
+
+def _batch_worker(wordlist: List[str], entropy_bytes: int, public_only: bool, tasks, results) -> None:
+    """
+    Worker process: turn (first_index, count) tasks into records until the None sentinel.
+    
+    Entropy is drawn here, in one secrets.token_bytes call per chunk, so it
+    never crosses the task queue.
+    """
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        start, count = task
+        chunk = secrets.token_bytes(count * entropy_bytes)
+        records = [
+            _batch_record(start + i, chunk[off:off + entropy_bytes], wordlist, public_only)
+            for i, off in enumerate(range(0, len(chunk), entropy_bytes))
+        ]
+        results.put(records)
+    results.put(None)
+
+
+def generate_wallet_batch(
+    count: int,
+    out: TextIO,
+    wordlist: List[str],
+    fmt: str = "jsonl",
+    public_only: bool = False,
+    entropy_bytes: int = 16,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> BatchStats:
+    """
+    Generate independent wallets in parallel and stream them to a file.
+    
+    A feeder thread pushes (first_index, count) chunks into a bounded task
+    queue, one worker process per core draws the entropy and derives
+    mnemonics, seeds and addresses, and the calling thread writes records
+    as they arrive through a bounded result queue. Entropy never crosses
+    the task queue; with public_only it stays out of the results too.
+    Memory stays proportional to the queue sizes, not to count.
+    Records are written in completion order; each carries its index.
+    
+    Args:
+        count: Number of wallets
+        out: Text file opened for writing (use newline="" for CSV)
+        wordlist: BIP39 wordlist
+        fmt: "jsonl" or "csv"
+        public_only: Omit mnemonic and entropy from the records
+        entropy_bytes: Entropy per wallet (16 for 12 words, 32 for 24 words)
+        workers: Worker processes (default: all cores)
+        chunk_size: Wallets per task / IPC message
+        progress: Optional callback(wallets_written, elapsed_seconds)
+        
+    Returns:
+        BatchStats for the run
+        
+    Raises:
+        ValueError: If the format or entropy length is invalid
+        RuntimeError: If a worker process dies
+    """
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError(f"Unsupported batch format {fmt!r}, expected jsonl or csv")
+    if entropy_bytes not in (16, 20, 24, 28, 32):
+        raise ValueError("Entropy length must be 16/20/24/28/32 bytes (128..256 bits).")
+    
+    workers = workers or os.cpu_count() or 1
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue(maxsize=workers * 2)
+    results = ctx.Queue(maxsize=workers * 2)
+    
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=batch_fieldnames(public_only))
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(record: dict) -> None:
+            out.write(json.dumps(record) + "\n")
+    
+    processes = [
+        ctx.Process(
+            target=_batch_worker,
+            args=(wordlist, entropy_bytes, public_only, tasks, results),
+            daemon=True,
+        )
+        for _ in range(workers)
+    ]
+    for p in processes:
+        p.start()
+    
+    def feed() -> None:
+        for start in range(0, count, chunk_size):
+            tasks.put((start, min(chunk_size, count - start)))
+        for _ in processes:
+            tasks.put(None)
+    
+    started = time.monotonic()
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    
+    written = 0
+    finished = 0
+    try:
+        while finished < len(processes):
+            try:
+                records = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(p.exitcode not in (None, 0) for p in processes):
+                    raise RuntimeError("A batch worker process died")
+                continue
+            if records is None:
+                finished += 1
+                continue
+            for record in records:
+                write(record)
+            written += len(records)
+            if progress is not None:
+                progress(written, time.monotonic() - started)
+    finally:
+        for p in processes:
+            if p.is_alive() and written < count:
+                p.terminate()
+            p.join()
+    
+    feeder.join()
+    out.flush()
+    return BatchStats(wallets=written, elapsed=time.monotonic() - started, workers=workers)
+
+
+# ============================================================================
+# MNEMONIC AUDIT
+# ============================================================================
+
+@dataclass
+class AuditIssue:
+    """A line of an audited file that failed a check (no secret words are quoted)"""
+    line: int
+    kind: str
+    message: str
+
+
+@dataclass
+class AuditStats:
+    """Totals for a mnemonic audit run"""
+    checked: int = 0
+    valid: int = 0
+    derived: int = 0
+    issues: Dict[str, int] = field(default_factory=dict)
+    languages: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def invalid(self) -> int:
+        """Lines with an issue of any kind"""
+        return sum(self.issues.values())
+
+    @property
+    def rate(self) -> float:
+        """Lines per second"""
+        return self.checked / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _audit_words(words: List[str]) -> Tuple[str, str, str]:
+    """
+    Check the word count, word membership and checksum of a split phrase.
+    
+    Lookups go through the precomputed English index, then the combined
+    index of every language, so no wordlist is scanned.
+    
+    Returns:
+        (language, "", "") if valid, else ("", issue kind, message)
+    """
+    if len(words) not in (12, 15, 18, 21, 24):
+        return "", "word_count", f"{len(words)} words, expected 12/15/18/21/24"
+    
+    english = wordlist_index(get_wordlist("english"))
+    if all(word in english for word in words):
+        language, indices = "english", [english[word] for word in words]
+    else:
+        index = _language_index()
+        candidates = None
+        for position, word in enumerate(words, 1):
+            languages = index.get(word) or index.get(_nfkd_word(word))
+            if languages is None:
+                return "", "unknown_word", f"word {position} is in no BIP39 wordlist"
+            candidates = set(languages) if candidates is None else candidates.intersection(languages)
+            if not candidates:
+                return "", "mixed_languages", f"word {position} is not in the wordlist of the words before it"
+        language = next(language for language in BIP39_LANGUAGES if language in candidates)
+        indices = [(index.get(word) or index[_nfkd_word(word)])[language] for word in words]
+    
+    value = 0
+    for i in indices:
+        value = (value << 11) | i
+    if not _unpack_mnemonic(value, len(words))[1]:
+        return "", "checksum", "checksum mismatch"
+    return language, "", ""
+
+
+def _audit_chunk(
+    chunk: List[Tuple[int, str]],
+    chain: Optional[str],
+    derive_every: int,
+) -> Tuple[int, int, Dict[str, int], List[AuditIssue]]:
+    """
+    Worker process: audit a chunk of (line_number, line) pairs.
+    
+    A line is a mnemonic, or a JSON object with a "mnemonic" field (the
+    format written by batch); a record that also stores the address of the
+    audited chain is compared with the derived one. Only counters and the
+    failing lines travel back to the parent.
+    
+    Returns:
+        (valid lines, derived addresses, lines per language, issues)
+    """
+    spec = _chain_spec(chain) if chain else None
+    column = f"{spec.alias.replace('-', '_')}_address" if spec else ""
+    valid = derived = 0
+    languages: Dict[str, int] = {}
+    issues: List[AuditIssue] = []
+    
+    for number, line in chunk:
+        text = line.strip()
+        record = None
+        if text.startswith("{"):
+            try:
+                record = json.loads(text)
+                text = record["mnemonic"]
+                if not isinstance(text, str):
+                    raise TypeError
+            except (ValueError, KeyError, TypeError):
+                issues.append(AuditIssue(number, "format", "JSON line without a mnemonic string"))
+                continue
+        words = text.split()
+        
+        language, kind, message = _audit_words(words)
+        if kind:
+            issues.append(AuditIssue(number, kind, message))
+            continue
+        
+        if spec is not None and number % derive_every == 0:
+            seed = mnemonic_to_seed(" ".join(words))
+            address = wallets_from_seed(seed, [spec])[0].address
+            derived += 1
+            expected = record.get(column) if isinstance(record, dict) else None
+            if expected is not None and expected != address:
+                issues.append(AuditIssue(number, "address_mismatch", f"{column} differs from the derived address"))
+                continue
+        valid += 1
+        languages[language] = languages.get(language, 0) + 1
+    return valid, derived, languages, issues
+
+
+def audit_mnemonic_file(
+    lines,
+    chain: Optional[str] = None,
+    derive_every: int = 1,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    on_issue: Optional[Callable[[AuditIssue], None]] = None,
+    progress: Optional[Callable[[AuditStats], None]] = None,
+) -> AuditStats:
+    """
+    Re-verify an archive of mnemonics, one per line, streaming.
+    
+    Chunks of lines are spread over worker processes, with at most two
+    chunks per worker in flight, so memory stays bounded whatever the file
+    size. Issues are reported in file order through on_issue as soon as
+    their chunk is done; only totals are kept.
+    
+    Args:
+        lines: Iterable of text lines (e.g. an open file)
+        chain: Also derive the first address of this chain (name or alias)
+        derive_every: With chain, derive on every Nth line only (spot checks)
+        workers: Worker processes (default: all cores, 1 = in-process)
+        chunk_size: Lines per IPC message
+        on_issue: Optional callback(issue) for each failing line
+        progress: Optional callback(stats) after each chunk
+        
+    Returns:
+        AuditStats for the run
+        
+    Raises:
+        ValueError: If the chain is not registered or derive_every < 1
+    """
+    if chain is not None:
+        _chain_spec(chain)
+    if derive_every < 1:
+        raise ValueError("derive_every must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    stats = AuditStats()
+    started = time.monotonic()
+    
+    def collect(count: int, chunk_result) -> None:
+        valid, derived, languages, issues = chunk_result
+        stats.checked += count
+        stats.valid += valid
+        stats.derived += derived
+        for language, count in languages.items():
+            stats.languages[language] = stats.languages.get(language, 0) + count
+        for issue in issues:
+            stats.issues[issue.kind] = stats.issues.get(issue.kind, 0) + 1
+            if on_issue is not None:
+                on_issue(issue)
+        stats.elapsed = time.monotonic() - started
+        if progress is not None:
+            progress(stats)
+    
+    chunks = _numbered_chunks(lines, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            collect(len(chunk), _audit_chunk(chunk, chain, derive_every))
+    else:
+        # Pool.imap would read the whole file ahead; keep a bounded window instead
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append((len(chunk), pool.apply_async(_audit_chunk, (chunk, chain, derive_every))))
+                if len(in_flight) >= workers * 2:
+                    size, pending = in_flight.popleft()
+                    collect(size, pending.get())
+            while in_flight:
+                size, pending = in_flight.popleft()
+                collect(size, pending.get())
+    
+    stats.elapsed = time.monotonic() - started
+    return stats
+
+
+# ============================================================================
+# SEEDQR / COMPACTSEEDQR
+# ============================================================================
+
+# A minimal QR code codec, enough for SeedQR: versions 1-4, numeric and
+# byte mode (alphanumeric too when decoding), no error correction on read.
+# Matrices are lists of rows of bools (True = dark), indexed [y][x].
+
+# Error correction levels by name -> format bits
+QR_EC_LEVELS = {"L": 1, "M": 0, "Q": 3, "H": 2}
+
+# (version, level) -> (EC codewords per block, blocks, data codewords per block)
+_QR_BLOCKS = {
+    (1, "L"): (7, 1, 19), (1, "M"): (10, 1, 16), (1, "Q"): (13, 1, 13), (1, "H"): (17, 1, 9),
+    (2, "L"): (10, 1, 34), (2, "M"): (16, 1, 28), (2, "Q"): (22, 1, 22), (2, "H"): (28, 1, 16),
+    (3, "L"): (15, 1, 55), (3, "M"): (26, 1, 44), (3, "Q"): (18, 2, 17), (3, "H"): (22, 2, 13),
+    (4, "L"): (20, 1, 80), (4, "M"): (18, 2, 32), (4, "Q"): (26, 2, 24), (4, "H"): (16, 4, 9),
+}
+
+_QR_ALPHANUMERIC = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+
+# GF(256) over x^8 + x^4 + x^3 + x^2 + 1: exponentials (doubled) and logarithms
+_GF_EXP = [0] * 512
+_GF_LOG = [0] * 256
+_x = 1
+for _i in range(255):
+    _GF_EXP[_i] = _GF_EXP[_i + 255] = _x
+    _GF_LOG[_x] = _i
+    _x <<= 1
+    if _x & 0x100:
+        _x ^= 0x11D
+del _x, _i
+
+
+def _gf_mul(a: int, b: int) -> int:
+    return 0 if a == 0 or b == 0 else _GF_EXP[_GF_LOG[a] + _GF_LOG[b]]
+
+
+@functools.lru_cache(maxsize=None)
+def _rs_generator(degree: int) -> Tuple[int, ...]:
+    """Reed-Solomon generator polynomial (x - a^0)...(x - a^(degree-1)), leading 1 dropped"""
+    poly = [1]
+    for i in range(degree):
+        poly = [c ^ _gf_mul(n, _GF_EXP[i]) for c, n in zip(poly + [0], [0] + poly)]
+    return tuple(poly[1:])
+
+
+def _rs_remainder(data: bytes, degree: int) -> bytes:
+    """Error correction codewords of a block"""
+    generator = _rs_generator(degree)
+    rem = [0] * degree
+    for byte in data:
+        factor = byte ^ rem.pop(0)
+        rem.append(0)
+        if factor:
+            for i, coef in enumerate(generator):
+                rem[i] ^= _gf_mul(coef, factor)
+    return bytes(rem)
+
+
+def _qr_format_bits(level: str, mask: int) -> int:
+    """15-bit format information (BCH-protected, masked)"""
+    data = QR_EC_LEVELS[level] << 3 | mask
+    rem = data
+    for _ in range(10):
+        rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+    return (data << 10 | rem) ^ 0x5412
+
+
+def _qr_format_positions(size: int) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """(x, y) of format bits 0..14, for the copy around the top-left finder and the split copy"""
+    first = [(8, i) for i in range(6)] + [(8, 7), (8, 8), (7, 8)] + [(14 - i, 8) for i in range(9, 15)]
+    second = [(size - 1 - i, 8) for i in range(8)] + [(8, size - 15 + i) for i in range(8, 15)]
+    return first, second
+
+
+@functools.lru_cache(maxsize=None)
+def _qr_function_map(version: int) -> Tuple[Tuple[bool, ...], ...]:
+    """Modules reserved for finder, timing, alignment and format patterns"""
+    size = 17 + 4 * version
+    reserved = [[False] * size for _ in range(size)]
+    for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+        for y in range(cy - 4, cy + 5):
+            for x in range(cx - 4, cx + 5):
+                if 0 <= x < size and 0 <= y < size:
+                    reserved[y][x] = True
+    for i in range(size):
+        reserved[6][i] = reserved[i][6] = True
+    if version > 1:
+        c = size - 7
+        for y in range(c - 2, c + 3):
+            for x in range(c - 2, c + 3):
+                reserved[y][x] = True
+    for x, y in sum(_qr_format_positions(size), []):
+        reserved[y][x] = True
+    reserved[size - 8][8] = True
+    return tuple(tuple(row) for row in reserved)
+
+
+def _qr_function_patterns(version: int) -> List[List[bool]]:
+    """Dark modules of the finder, timing and alignment patterns and the dark module"""
+    size = 17 + 4 * version
+    modules = [[False] * size for _ in range(size)]
+    for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+        for y in range(cy - 3, cy + 4):
+            for x in range(cx - 3, cx + 4):
+                modules[y][x] = max(abs(x - cx), abs(y - cy)) != 2
+    for i in range(8, size - 8):
+        modules[6][i] = modules[i][6] = i % 2 == 0
+    if version > 1:
+        c = size - 7
+        for y in range(c - 2, c + 3):
+            for x in range(c - 2, c + 3):
+                modules[y][x] = max(abs(x - c), abs(y - c)) != 1
+    modules[size - 8][8] = True
+    return modules
+
+
+def _qr_data_positions(version: int) -> Iterator[Tuple[int, int]]:
+    """(x, y) of the data modules in bit order: column pairs zigzagging up and down from the right"""
+    size = 17 + 4 * version
+    reserved = _qr_function_map(version)
+    right = size - 1
+    while right >= 1:
+        if right == 6:
+            right = 5
+        upward = ((right + 1) & 2) == 0
+        for vert in range(size):
+            y = size - 1 - vert if upward else vert
+            for x in (right, right - 1):
+                if not reserved[y][x]:
+                    yield x, y
+        right -= 2
+
+
+_QR_MASKS: Tuple[Callable[[int, int], bool], ...] = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+
+def _qr_penalty(modules: List[List[bool]]) -> int:
+    """Mask penalty score (runs, 2x2 blocks, finder-like patterns, dark balance)"""
+    size = len(modules)
+    score = 0
+    finder_like = ([True, False, True, True, True, False, True] + [False] * 4,
+                   [False] * 4 + [True, False, True, True, True, False, True])
+    for lines in (modules, list(zip(*modules))):
+        for line in lines:
+            run = 1
+            for i in range(1, size):
+                if line[i] == line[i - 1]:
+                    run += 1
+                else:
+                    score += run - 2 if run >= 5 else 0
+                    run = 1
+            score += run - 2 if run >= 5 else 0
+            line = list(line)
+            for i in range(size - 10):
+                if line[i:i + 11] in finder_like:
+                    score += 40
+    for y in range(size - 1):
+        for x in range(size - 1):
+            if modules[y][x] == modules[y][x + 1] == modules[y + 1][x] == modules[y + 1][x + 1]:
+                score += 3
+    dark = sum(map(sum, modules))
+    score += 10 * (abs(dark * 20 - size * size * 10) // (size * size))
+    return score
+
+
+def _qr_segment_bits(data) -> Tuple[int, List[Tuple[int, int]]]:
+    """(mode, [(value, bit width)...]) of the payload, numeric mode for a str of digits"""
+    if isinstance(data, str):
+        if not data.isdigit() or not data.isascii():
+            raise ValueError("QR text payloads must be digits; encode other text as bytes")
+        fields = [(int(data[i:i + 3]), (4, 7, 10)[len(data[i:i + 3]) - 1]) for i in range(0, len(data), 3)]
+        return 1, fields
+    return 4, [(byte, 8) for byte in data]
+
+
+def qr_encode(data, level: str = "L", version: Optional[int] = None, mask: Optional[int] = None) -> List[List[bool]]:
+    """
+    QR code matrix of a payload (versions 1-4).
+    
+    Args:
+        data: Digits (str, numeric mode) or bytes (byte mode)
+        level: Error correction level, L/M/Q/H
+        version: QR version (default: the smallest that fits)
+        mask: Mask pattern 0-7 (default: lowest penalty)
+        
+    Returns:
+        Square matrix of bools (True = dark), without quiet zone
+        
+    Raises:
+        ValueError: If the payload does not fit in version 4
+    """
+    mode, fields = _qr_segment_bits(data)
+    count_bits = 10 if mode == 1 else 8
+    bits = 4 + count_bits + sum(width for _, width in fields)
+    versions = [version] if version is not None else range(1, 5)
+    for version in versions:
+        ec_len, blocks, data_len = _QR_BLOCKS[(version, level)]
+        if bits <= blocks * data_len * 8 and len(data) < 1 << count_bits:
+            break
+    else:
+        raise ValueError(f"Payload of {len(data)} {'digits' if mode == 1 else 'bytes'} does not fit a version 1-4 QR code")
+    capacity = blocks * data_len * 8
+    
+    # Mode, count, data, terminator, then pad to whole codewords with 0xEC 0x11
+    value, width = mode, 4
+    for v, w in [(len(data), count_bits)] + fields:
+        value, width = value << w | v, width + w
+    tail = min(4, capacity - width)
+    value, width = value << tail, width + tail
+    value, width = value << (-width % 8), width + (-width % 8)
+    codewords = value.to_bytes(width // 8, 'big')
+    codewords += bytes((0xEC, 0x11) * capacity)[:capacity // 8 - len(codewords)]
+    
+    # Blocks, each with its EC codewords, interleaved column by column
+    split = [codewords[i * data_len:(i + 1) * data_len] for i in range(blocks)]
+    ecc = [_rs_remainder(block, ec_len) for block in split]
+    stream = bytes(block[i] for i in range(data_len) for block in split)
+    stream += bytes(block[i] for i in range(ec_len) for block in ecc)
+    
+    size = 17 + 4 * version
+    base = _qr_function_patterns(version)
+    positions = list(_qr_data_positions(version))
+    stream_bits = [(stream[i >> 3] >> (7 - (i & 7))) & 1 for i in range(len(stream) * 8)]
+    
+    def build(pattern: int) -> List[List[bool]]:
+        modules = [row[:] for row in base]
+        masked = _QR_MASKS[pattern]
+        for i, (x, y) in enumerate(positions):
+            bit = stream_bits[i] if i < len(stream_bits) else 0
+            modules[y][x] = bool(bit) != masked(x, y)
+        format_bits = _qr_format_bits(level, pattern)
+        for copy in _qr_format_positions(size):
+            for i, (x, y) in enumerate(copy):
+                modules[y][x] = bool(format_bits >> i & 1)
+        return modules
+    
+    if mask is not None:
+        return build(mask)
+    return min((build(pattern) for pattern in range(8)), key=_qr_penalty)
+
+
+def qr_decode(modules: List[List[bool]]):
+    """
+    Payload of a clean QR code matrix (versions 1-4, no quiet zone).
+    
+    Returns:
+        str for numeric/alphanumeric payloads, bytes for byte mode
+        
+    Raises:
+        ValueError: If the matrix is not a readable, undamaged QR code
+    """
+    size = len(modules)
+    version = (size - 17) // 4
+    if size not in (21, 25, 29, 33) or any(len(row) != size for row in modules):
+        raise ValueError(f"QR matrix must be 21/25/29/33 modules square (versions 1-4), got {size} rows")
+    
+    # Format: nearest valid code of either copy (BCH distance >= 7)
+    read = [
+        sum(modules[y][x] << i for i, (x, y) in enumerate(copy))
+        for copy in _qr_format_positions(size)
+    ]
+    distance, level, mask = min(
+        (bin(_qr_format_bits(lv, m) ^ bits).count("1"), lv, m)
+        for bits in read for lv in QR_EC_LEVELS for m in range(8)
+    )
+    if distance > 3:
+        raise ValueError("QR format information is unreadable")
+    
+    ec_len, blocks, data_len = _QR_BLOCKS[(version, level)]
+    masked = _QR_MASKS[mask]
+    value = 0
+    total = blocks * (data_len + ec_len)
+    for i, (x, y) in enumerate(_qr_data_positions(version)):
+        if i == total * 8:
+            break
+        value = value << 1 | (modules[y][x] != masked(x, y))
+    stream = value.to_bytes(total, 'big')
+    
+    # De-interleave and check every block's syndromes
+    split = [bytearray() for _ in range(blocks)]
+    for i in range(data_len):
+        for b in range(blocks):
+            split[b].append(stream[i * blocks + b])
+    codewords = b"".join(split)
+    for b in range(blocks):
+        ecc = bytes(stream[blocks * data_len + i * blocks + b] for i in range(ec_len))
+        if _rs_remainder(bytes(split[b]), ec_len) != ecc:
+            raise ValueError("QR code is damaged (error correction mismatch)")
+    
+    # Segments until the terminator or the end of the data codewords
+    bits = int.from_bytes(codewords, 'big')
+    width = len(codewords) * 8
+    pos = 0
+    
+    def take(n: int) -> int:
+        nonlocal pos
+        if pos + n > width:
+            raise ValueError("QR segment runs past the data")
+        pos += n
+        return (bits >> (width - pos)) & ((1 << n) - 1)
+    
+    text, raw = [], bytearray()
+    while width - pos >= 4:
+        mode = take(4)
+        if mode == 0:
+            break
+        if mode == 1:
+            count = take(10)
+            for i in range(0, count, 3):
+                n = min(3, count - i)
+                text.append(f"{take((4, 7, 10)[n - 1]):0{n}d}")
+        elif mode == 2:
+            count = take(9)
+            for i in range(0, count, 2):
+                if count - i >= 2:
+                    pair = take(11)
+                    text.append(_QR_ALPHANUMERIC[pair // 45] + _QR_ALPHANUMERIC[pair % 45])
+                else:
+                    text.append(_QR_ALPHANUMERIC[take(6)])
+        elif mode == 4:
+            count = take(8)
+            raw.extend(take(8) for _ in range(count))
+        else:
+            raise ValueError(f"Unsupported QR segment mode {mode}")
+    if text and raw:
+        raise ValueError("QR code mixes text and byte segments")
+    return bytes(raw) if raw else "".join(text)
+
+
+# Characters read as dark / light modules in a matrix file
+_QR_DARK = set("1#█Xx")
+_QR_LIGHT = set("0 ._-")
+
+
+def parse_qr_matrix(text: str) -> List[List[bool]]:
+    """
+    QR matrix from text, one row per line.
+    
+    Accepts 1/0, #/space or █/space rows (the output of qrencode -t ASCII,
+    or of format_qr_matrix). Modules drawn two characters wide are halved
+    and the quiet zone is trimmed.
+    
+    Raises:
+        ValueError: If a character is not a module, or the rows are not square
+    """
+    lines = [line.rstrip("\r\n") for line in text.splitlines()]
+    width = max((len(line) for line in lines), default=0)
+    rows = []
+    for line in lines:
+        unknown = set(line) - _QR_DARK - _QR_LIGHT
+        if unknown:
+            raise ValueError(f"Unexpected character {sorted(unknown)[0]!r} in QR matrix")
+        rows.append([c in _QR_DARK for c in line.ljust(width)])
+    
+    while rows and not any(rows[0]):
+        rows.pop(0)
+    while rows and not any(rows[-1]):
+        rows.pop()
+    if not rows:
+        raise ValueError("Empty QR matrix")
+    left = min(row.index(True) for row in rows if any(row))
+    right = max(len(row) - row[::-1].index(True) for row in rows if any(row))
+    rows = [row[left:right] for row in rows]
+    
+    if len(rows[0]) == 2 * len(rows) and all(row[0::2] == row[1::2] for row in rows):
+        rows = [row[0::2] for row in rows]
+    if any(len(row) != len(rows) for row in rows):
+        raise ValueError(f"QR matrix is not square ({len(rows[0])}x{len(rows)} modules)")
+    return rows
+
+
+def format_qr_matrix(modules: List[List[bool]], border: int = 1) -> str:
+    """Matrix as 1/0 text rows, with a light quiet zone of border modules"""
+    size = len(modules)
+    blank = "0" * (size + 2 * border)
+    rows = [blank] * border
+    rows += ["0" * border + "".join("1" if m else "0" for m in row) + "0" * border for row in modules]
+    rows += [blank] * border
+    return "\n".join(rows) + "\n"
+
+
+def _seedqr_wordlist(mnemonic: str, wordlist: Optional[List[str]]) -> List[str]:
+    """
+    The English wordlist, the only one SeedQR is defined over.
+    
+    Raises:
+        ValueError: If wordlist, or the mnemonic's language, is not English
+    """
+    english = get_wordlist("english")
+    if wordlist is not None and wordlist != english:
+        raise ValueError("SeedQR is defined for the English BIP39 wordlist only")
+    if wordlist is None and detect_language(mnemonic) != "english":
+        raise ValueError("SeedQR is defined for English mnemonics only")
+    return english
+
+
+def seedqr_digits(mnemonic: str, wordlist: Optional[List[str]] = None) -> str:
+    """
+    Standard SeedQR payload: each word's wordlist index as 4 digits.
+    
+    Raises:
+        ValueError: If the mnemonic is invalid or not English
+    """
+    wordlist = _seedqr_wordlist(mnemonic, wordlist)
+    mnemonic_to_entropy(mnemonic, wordlist)
+    return "".join(f"{i:04d}" for i in _word_indices(mnemonic.split(), wordlist))
+
+
+def compact_seedqr_bytes(mnemonic: str, wordlist: Optional[List[str]] = None) -> bytes:
+    """
+    CompactSeedQR payload: the raw entropy (16 bytes for 12 words, 32 for 24).
+    
+    Raises:
+        ValueError: If the mnemonic is invalid, not English or not 12/24 words
+    """
+    entropy = mnemonic_to_entropy(mnemonic, _seedqr_wordlist(mnemonic, wordlist))
+    if len(entropy) not in (16, 32):
+        raise ValueError("CompactSeedQR holds 12 or 24 word mnemonics only")
+    return entropy
+
+
+def seedqr_encode(mnemonic: str, compact: bool = True, wordlist: Optional[List[str]] = None) -> List[List[bool]]:
+    """
+    SeedQR matrix of a mnemonic, at error correction level L.
+    
+    CompactSeedQR fits 12 words in version 1 (21x21) and 24 words in
+    version 2 (25x25); standard SeedQR needs versions 2 and 3.
+    """
+    payload = compact_seedqr_bytes(mnemonic, wordlist) if compact else seedqr_digits(mnemonic, wordlist)
+    return qr_encode(payload, "L")
+
+
+def seedqr_to_mnemonic(payload, wordlist: Optional[List[str]] = None) -> str:
+    """
+    Mnemonic of a decoded SeedQR payload.
+    
+    Digits are a standard SeedQR, 16 or 32 bytes a CompactSeedQR, both
+    over the English wordlist; other bytes are read as the mnemonic itself
+    in UTF-8 text.
+    
+    Args:
+        payload: str or bytes, as returned by qr_decode
+        wordlist: BIP39 wordlist of a text payload (default: detected)
+        
+    Raises:
+        ValueError: If the payload is not a valid mnemonic, or wordlist is
+            not English for a SeedQR payload
+    """
+    if isinstance(payload, str):
+        if not payload.isdigit() or len(payload) // 4 not in (12, 15, 18, 21, 24) or len(payload) % 4:
+            raise ValueError("SeedQR payload must be 4 digits per word (12-24 words)")
+        wordlist = _seedqr_wordlist("", wordlist or get_wordlist("english"))
+        indices = [int(payload[i:i + 4]) for i in range(0, len(payload), 4)]
+        if max(indices) >= len(wordlist):
+            raise ValueError("SeedQR word index out of range")
+        mnemonic = " ".join(wordlist[i] for i in indices)
+    elif len(payload) in (16, 32):
+        return entropy_to_mnemonic(payload, _seedqr_wordlist("", wordlist or get_wordlist("english")))
+    else:
+        try:
+            mnemonic = " ".join(payload.decode("utf-8").split())
+        except UnicodeDecodeError:
+            raise ValueError("QR payload is neither a SeedQR nor a mnemonic") from None
+    mnemonic_to_entropy(mnemonic, wordlist)
+    return mnemonic
+
+
+def load_seedqr_file(path: str, wordlist: Optional[List[str]] = None) -> str:
+    """
+    Mnemonic of a SeedQR matrix file (see parse_qr_matrix for the format).
+    
+    Raises:
+        ValueError: If the file is not a readable SeedQR
+    """
+    with open(path, encoding="utf-8") as f:
+        return seedqr_to_mnemonic(qr_decode(parse_qr_matrix(f.read())), wordlist)
+
+
+# ============================================================================
+# LOCAL SERVICE (newline-delimited JSON over a Unix socket)
+# ============================================================================
+
+# Largest request line accepted by the service, in bytes
+SERVICE_LINE_LIMIT = 1 << 16
+
+# Requests of one connection in flight at once; further lines wait to be read
+SERVICE_PIPELINE_DEPTH = 64
+
+
+def _service_wordlist(params: dict, mnemonic: Optional[str] = None) -> List[str]:
+    """Wordlist named by params["language"], else detected from the mnemonic"""
+    language = params.get("language")
+    if language is None:
+        language = detect_language(mnemonic) if mnemonic else "english"
+    if language not in BIP39_LANGUAGES:
+        raise ValueError(f"Unsupported language {language!r}")
+    return get_wordlist(language)
+
+
+def _service_mnemonic(params: dict) -> str:
+    """The checked params["mnemonic"], NFKD-normalized"""
+    mnemonic = params.get("mnemonic")
+    if not isinstance(mnemonic, str):
+        raise ValueError("Missing mnemonic")
+    mnemonic = " ".join(_nfkd(mnemonic).split())
+    mnemonic_to_entropy(mnemonic, _service_wordlist(params, mnemonic))
+    return mnemonic
+
+
+def _service_wallets(mnemonic: str, params: dict) -> List[dict]:
+    """Addresses of params["chains"] (default: WALLET_SPECS), with the optional passphrase"""
+    chains = params.get("chains")
+    if chains is not None and not (isinstance(chains, list) and all(isinstance(c, str) for c in chains)):
+        raise ValueError("chains must be a list of chain names, e.g. [\"btc\", \"eth\"]")
+    passphrase = params.get("passphrase", "")
+    if not isinstance(passphrase, str):
+        raise ValueError("passphrase must be a string")
+    specs = chain_specs(chains)
+    seed = mnemonic_to_seed(mnemonic, passphrase)
+    return [wallet.__dict__ for wallet in wallets_from_seed(seed, specs)]
+
+
+def _service_generate(params: dict) -> dict:
+    """New random mnemonic and its addresses"""
+    words = params.get("words", 12)
+    if words not in (12, 15, 18, 21, 24):
+        raise ValueError("words must be 12/15/18/21/24")
+    entropy = random_entropy(get_entropy_bytes_for_words(words))
+    mnemonic = entropy_to_mnemonic(entropy, _service_wordlist(params))
+    return {
+        "mnemonic": mnemonic,
+        "entropy_hex": entropy.hex(),
+        "wallets": _service_wallets(mnemonic, params),
+    }
+
+
+def _service_validate(params: dict) -> dict:
+    """Checksum and language of a mnemonic; an invalid phrase is a result, not an error"""
+    try:
+        mnemonic = _service_mnemonic(params)
+    except ValueError as e:
+        return {"valid": False, "reason": str(e)}
+    return {"valid": True, "language": params.get("language") or detect_language(mnemonic)}
+
+
+def _service_derive(params: dict) -> dict:
+    """Addresses of an existing mnemonic"""
+    return {"wallets": _service_wallets(_service_mnemonic(params), params)}
+
+
+def _service_recover(params: dict) -> dict:
+    """
+    Full phrase from typed words, as on the resurrection screen.
+    
+    Words may be abbreviated to their unique prefix. A complete phrase
+    gives its mnemonic and entropy; a phrase one word short gives every
+    valid final word.
+    """
+    tokens = _nfkd(str(params.get("words", ""))).lower().split()
+    if not tokens:
+        raise ValueError("Missing words")
+    wordlist = _service_wordlist(params)
+    completer = WordCompleter(wordlist)
+    words = []
+    for token in tokens:
+        word = completer.resolve(token)
+        if word is None:
+            raise ValueError(f"Unknown or ambiguous word {token!r}")
+        words.append(word)
+    
+    if len(words) + 1 in (12, 15, 18, 21, 24):
+        return {"words": words, "final_words": valid_final_words(words, wordlist)}
+    mnemonic = " ".join(words)
+    entropy = mnemonic_to_entropy(mnemonic, wordlist)
+    return {"mnemonic": mnemonic, "entropy_hex": entropy.hex()}
+
+
+# Method -> (handler, runs in the process pool)
+SERVICE_METHODS: Dict[str, Tuple[Callable[[dict], dict], bool]] = {
+    "generate": (_service_generate, True),
+    "validate": (_service_validate, False),
+    "derive": (_service_derive, True),
+    "recover": (_service_recover, False),
+}
+
+
+def _service_call(method: str, params: dict) -> dict:
+    """Run a service method (also the entry point of pool workers)"""
+    return SERVICE_METHODS[method][0](params)
+
+
+def _service_warmup() -> None:
+    """Pool worker start-up: load the English wordlist and its index"""
+    wordlist_index(get_wordlist("english"))
+
+
+@dataclass
+class ServiceStats:
+    """Counters of a running WalletService"""
+    connections: int = 0
+    requests: int = 0
+    errors: int = 0
+
+
+class WalletService:
+    """
+    The core API (generate, validate, derive, recover) on a Unix socket.
+    
+    Each line a client writes is one JSON request
+    {"id": ..., "method": ..., "params": {...}} and gets one JSON line back,
+    {"id": ..., "result": {...}} or {"id": ..., "error": "..."}. Requests of a
+    connection run concurrently, so clients can pipeline them; responses
+    come back in completion order and are matched by id. PBKDF2 and EC
+    work (generate, derive) runs in a process pool, started once for the
+    service's lifetime; cheap checks run on the event loop.
+    
+    The socket file is created with mode 0600 and there is no TCP listener.
+    """
+    
+    def __init__(self, path: str, workers: Optional[int] = None):
+        self.path = path
+        self.workers = workers or os.cpu_count() or 1
+        self.stats = ServiceStats()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+    
+    async def start(self) -> None:
+        """
+        Start the worker processes and listen on the socket.
+        
+        Raises:
+            ValueError: If another service already answers on the socket
+        """
+        await self._remove_stale_socket()
+        self._pool = ProcessPoolExecutor(
+            self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_service_warmup,
+        )
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._serve_connection, self.path, limit=SERVICE_LINE_LIMIT,
+            )
+        except BaseException:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            raise
+        finally:
+            os.umask(umask)
+    
+    async def _remove_stale_socket(self) -> None:
+        """Unlink a socket file nobody listens on (start_unix_server would take over a live one)"""
+        try:
+            if not stat.S_ISSOCK(os.stat(self.path).st_mode):
+                return
+        except FileNotFoundError:
+            return
+        try:
+            _, writer = await asyncio.open_unix_connection(self.path)
+        except ConnectionRefusedError:
+            os.unlink(self.path)
+            return
+        writer.close()
+        await writer.wait_closed()
+        raise ValueError(f"A service is already listening on {self.path}")
+    
+    async def close(self) -> None:
+        """Stop listening, stop the workers and remove the socket file"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        # Open connections see end of input and finish their requests
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+    
+    async def __aenter__(self) -> "WalletService":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+    
+    async def handle(self, request: dict) -> dict:
+        """Response to one decoded request"""
+        request_id = request.get("id") if isinstance(request, dict) else None
+        self.stats.requests += 1
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            method = request.get("method")
+            params = request.get("params") or {}
+            if method not in SERVICE_METHODS:
+                raise ValueError(f"Unknown method {method!r}, expected one of {', '.join(SERVICE_METHODS)}")
+            if not isinstance(params, dict):
+                raise ValueError("params must be a JSON object")
+            if SERVICE_METHODS[method][1]:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._pool, _service_call, method, params)
+            else:
+                result = _service_call(method, params)
+        except (ValueError, TypeError) as e:
+            self.stats.errors += 1
+            return {"id": request_id, "error": str(e)}
+        except Exception as e:
+            # e.g. a worker process died: report it and keep serving
+            self.stats.errors += 1
+            return {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+        return {"id": request_id, "result": result}
+    
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read request lines, answering each as soon as it completes"""
+        self.stats.connections += 1
+        connection = asyncio.current_task()
+        self._connections[connection] = writer
+        slots = asyncio.Semaphore(SERVICE_PIPELINE_DEPTH)
+        write_lock = asyncio.Lock()
+        pending = set()
+        
+        async def answer(line: bytes) -> None:
+            try:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    self.stats.requests += 1
+                    self.stats.errors += 1
+                    response = {"id": None, "error": "Invalid JSON"}
+                else:
+                    response = await self.handle(request)
+                async with write_lock:
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                slots.release()
+        
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"id": null, "error": "Request line too long"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    slots.release()
+                    continue
+                task = asyncio.create_task(answer(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[connection]
+            for task in pending:
+                task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
 
 
 # ============================================================================
@@ -9,14 +9,28 @@ Application terminal thématique RPG pour générer des phrases mnémoniques BIP
 
 UTILISATION :
     python dw_app.py
+    python dw_app.py vanity --chain btc --prefix 1abc   (recherche sans interface, sortie JSON)
+    python dw_app.py batch 1000 -o coffres.jsonl         (génération en masse)
+    python dw_app.py watch xpub6... --chain btc          (adresses depuis une clé de guet)
+    python dw_app.py verify preuves_de_possession.jsonl  (vérification de signatures en masse)
+    python dw_app.py audit coffres.jsonl --derive btc    (vérification en masse de phrases archivées)
+    python dw_app.py seedqr decode matrice.txt           (phrase d'une matrice SeedQR / CompactSeedQR)
+    python dw_app.py backends                            (moteurs cryptographiques retenus)
+    python dw_app.py dice-sim --scheme 3d6               (jets attendus par configuration de dés)
+    python dw_app.py bench-ui                            (latence de l'interface, sans terminal)
+    python dw_app.py serve --socket dw.sock              (service JSON local sur socket Unix)
 
 PRÉREQUIS :
     pip install textual rich
+    pip install coincurve pycryptodome   (optionnel, accélère secp256k1 / Keccak)
 
 MODES :
     🎲 Rituel des Dés (Recommandé) - Génère l'entropie à partir de lancers D20 + d100
     ✨ Rituel Aléatoire - Utilise le générateur cryptographique du système
     🧪 Rituel Hex - Fournis ta propre entropie hex de 32 caractères
+    🔱 Rituel du Sceau - Cherche une phrase dont l'adresse commence/finit par un motif
+    🗝️ Rituel du Dernier Mot - Calcule le mot de contrôle après 11 ou 23 mots tirés aux dés
+    📜 Rituel de la Résurrection - Restaure une phrase existante pour voir ses coffres
 
 SÉCURITÉ :
     - Exécute HORS LIGNE pour une sécurité maximale
@@ -30,26 +44,39 @@ Licence : MIT
 
 import os
 import sys
+import json
+import math
+import time
+import asyncio
+import signal
+import argparse
+import functools
+import unicodedata
+from contextlib import redirect_stderr
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import (
     Button, Static, Input, Label, Header, Footer, 
-    ProgressBar, RichLog, Placeholder
+    ProgressBar, Placeholder, Select, DataTable
 )
 from textual.screen import Screen
+from textual.widget import Widget
 from textual.binding import Binding
 from textual.validation import Validator, ValidationResult
-from textual import events
+from textual.suggester import Suggester
+from textual import events, work
 from textual.reactive import reactive
 from textual.message import Message
 
 from rich.panel import Panel
+from rich.columns import Columns
 from rich.text import Text
-from rich.console import Console, Group
+from rich.console import Console
 from rich.table import Table
 from rich.align import Align
 from rich.style import Style
@@ -64,15 +91,59 @@ except ImportError:
 
 # Import core module
 from core import (
-    load_wordlist,
+    get_wordlist,
+    detect_language,
+    BIP39_LANGUAGES,
     entropy_to_mnemonic,
-    random_entropy,
-    hex_to_entropy,
     validate_hex_input,
-    DiceEntropyCollector,
-    derive_wallet_info,
+    EntropyImportResult,
+    mnemonic_to_entropy,
+    valid_final_words,
+    wordlist_index,
+    WordCompleter,
+    MnemonicBuilder,
+    DiceSource,
+    RandomSource,
+    HexSource,
+    FileSource,
+    collect_entropy,
+    lane_share,
+    parse_roll_pairs,
+    DICE_SCHEMES,
+    HAS_NUMPY,
+    parse_dice_scheme,
+    simulate_dice_scheme,
+    reference_scheme_agrees,
     mask_mnemonic,
     WalletInfo,
+    VanitySearch,
+    VANITY_CHAINS,
+    normalize_vanity_pattern,
+    vanity_difficulty,
+    generate_wallet_batch,
+    mnemonic_to_seed,
+    derive_account_keys,
+    wallets_from_seed,
+    derive_paths,
+    account_path,
+    AddressPager,
+    Ed25519Pager,
+    CHAIN_REGISTRY,
+    derive_watch_only_wallets,
+    AccountKey,
+    CHAIN_ALIASES,
+    backend_report,
+    SignedMessage,
+    VerifyStats,
+    sign_wallet_message,
+    verify_message_file,
+    seedqr_encode,
+    format_qr_matrix,
+    load_seedqr_file,
+    AuditIssue,
+    audit_mnemonic_file,
+    WalletService,
+    SERVICE_METHODS,
 )
 
 # ============================================================================
@@ -191,6 +262,183 @@ class HexValidator(Validator):
         return self.failure(error)
 
 
+class WordSuggester(Suggester):
+    """Complete the word being typed (the last one) from a word list"""
+    
+    def __init__(self, words: List[str]):
+        super().__init__(use_cache=True, case_sensitive=False)
+        self.completer = WordCompleter(words)
+    
+    async def get_suggestion(self, value: str) -> Optional[str]:
+        if not value or value.endswith(" "):
+            return None
+        prefix = value.rsplit(" ", 1)[-1]
+        found = self.completer.matches(prefix, 1)
+        if found and found[0] != prefix:
+            return value + found[0][len(prefix):]
+        return None
+
+
+# ============================================================================
+# PRE-RENDERED TEXT
+# ============================================================================
+
+# Static blocks shown on several screens, by name
+STATIC_BLOCKS = {
+    "banner": lambda: ASCII_BANNER,
+    "why-dice": lambda: Panel(WHY_DICE_TEXT, title="🎯 Paroles du Maître du Donjon", border_style="yellow"),
+    "security-warning": lambda: Panel(SECURITY_WARNING, title="⚔️ L'AVERTISSEMENT DU GARDIEN", border_style="red"),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def prerendered(block: str, width: int) -> Text:
+    """A STATIC_BLOCKS entry laid out by Rich once per width (memoized)"""
+    console = Console(width=width, force_terminal=True, color_system="truecolor")
+    lines = console.render_lines(STATIC_BLOCKS[block](), console.options.update_width(width), pad=False)
+    text = Text(no_wrap=True, overflow="crop")
+    for i, line in enumerate(lines):
+        if i:
+            text.append("\n")
+        for segment in line:
+            text.append(segment.text, segment.style)
+    return text
+
+
+class StaticBlock(Static):
+    """A STATIC_BLOCKS entry, swapped for its pre-rendered text at the widget's width"""
+    
+    # Last width seen per block, so a new instance starts pre-rendered
+    _last_width: dict = {}
+    
+    def __init__(self, block: str, **kwargs):
+        width = self._last_width.get(block)
+        super().__init__(prerendered(block, width) if width else STATIC_BLOCKS[block](), **kwargs)
+        self.block = block
+        self._width = width
+    
+    def on_resize(self, event: events.Resize) -> None:
+        width = self.content_size.width
+        if width and width != self._width:
+            self._width = self._last_width[self.block] = width
+            self.update(prerendered(self.block, width))
+
+
+# ============================================================================
+# ROLL LOG
+# ============================================================================
+
+# Rolls kept for display; the full session is in the collector's roll record
+ROLL_LOG_CAPACITY = 64
+
+
+class RollLog(Widget):
+    """
+    The latest dice rolls, newest at the bottom.
+    
+    Rows are plain tuples in a capped ring buffer; render() only formats
+    the rows that fit in the widget, and any number of add_rolls() calls
+    between two frames cost a single repaint.
+    """
+    
+    def __init__(self, capacity: int = ROLL_LOG_CAPACITY, **kwargs):
+        super().__init__(**kwargs)
+        self._rows: deque = deque(maxlen=capacity)
+    
+    def add_rolls(self, rolls: List[Tuple[int, int, int, bool]], label: str = "") -> None:
+        """
+        Append rolls as returned by DiceEntropyCollector.recent_rolls().
+        
+        Args:
+            rolls: (roll number, d20, d100, accepted) tuples
+            label: Prefix for these rows (e.g. the operator of a ceremony lane)
+        """
+        self._rows.extend((label, *roll) for roll in rolls)
+        self.refresh()
+    
+    def render(self) -> Text:
+        visible = self.content_size.height or len(self._rows)
+        start = max(0, len(self._rows) - visible)
+        text = Text()
+        for i in range(start, len(self._rows)):
+            label, number, d20, d100, accepted = self._rows[i]
+            if i > start:
+                text.append("\n")
+            roll = f"{label}jet #{number}" if label else f"Jet #{number}"
+            n_value = (d20 - 1) * 100 + d100
+            if accepted:
+                text.append(f"✅ {roll}: D20={d20}, d100={d100} → N={n_value} [LES DIEUX ACCEPTENT !]", style="green")
+            else:
+                text.append(f"❌ {roll}: D20={d20}, d100={d100} → N={n_value} [MAUDIT ! Relance !]", style="red")
+        return text
+
+
+# ============================================================================
+# QR CODES
+# ============================================================================
+
+@functools.lru_cache(maxsize=256)
+def ascii_qr(data: str) -> str:
+    """ASCII QR code of data (memoized, the address browser re-renders often)"""
+    try:
+        qr = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=1,
+            border=1,
+        )
+        qr.add_data(data)
+        qr.make(fit=True)
+        
+        # Generate ASCII art
+        lines = []
+        lines.append("\n📱 Rune d'Invocation (scanne pour recevoir des tributs) :")
+        matrix = qr.get_matrix()
+        for row in matrix:
+            line = ""
+            for cell in row:
+                line += "██" if cell else "  "
+            lines.append(line)
+        return "\n".join(lines)
+    except Exception:
+        return "\n📱 Échec de la génération de la rune"
+
+
+# Half-block glyph of (top module dark, bottom module dark), two cells per module
+_HALF_BLOCKS = {(True, True): "██", (True, False): "▀▀", (False, True): "▄▄", (False, False): "  "}
+
+
+def qr_half_blocks(modules: List[List[bool]], border: int = 1) -> str:
+    """QR matrix drawn two module rows per text line, so it takes half the height of ascii_qr"""
+    size = len(modules) + 2 * border
+    padded = [[False] * size for _ in range(border)]
+    padded += [[False] * border + list(row) + [False] * border for row in modules]
+    padded += [[False] * size for _ in range(border + (size % 2))]
+    return "\n".join(
+        "".join(_HALF_BLOCKS[top, bottom] for top, bottom in zip(padded[y], padded[y + 1]))
+        for y in range(0, len(padded) - 1, 2)
+    )
+
+
+# ============================================================================
+# SECRET SCREENS
+# ============================================================================
+
+class SecretScreen(Screen):
+    """
+    A screen holding key material (entropy, mnemonic, seed...).
+    
+    Never installed: it is built for one use and removed when popped, and
+    the attributes named in SECRETS are dropped on unmount.
+    """
+    
+    SECRETS: Tuple[str, ...] = ()
+    
+    def on_unmount(self) -> None:
+        for name in self.SECRETS:
+            setattr(self, name, None)
+
+
 # ============================================================================
 # TITLE SCREEN
 # ============================================================================
@@ -205,7 +453,7 @@ class TitleScreen(Screen):
     
     def compose(self) -> ComposeResult:
         yield Container(
-            Static(ASCII_BANNER, id="banner", classes="banner"),
+            StaticBlock("banner", id="banner", classes="banner"),
             Static("", classes="spacer"),
             Container(
                 Button("⚔️  Entrer dans le Donjon", id="btn-begin", variant="primary", classes="menu-button"),
@@ -226,14 +474,14 @@ class TitleScreen(Screen):
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-begin":
-            self.app.push_screen(ModeSelectScreen())
+            self.app.push_screen("modes")
         elif event.button.id == "btn-help":
-            self.app.push_screen(HelpScreen())
+            self.app.push_screen("help")
         elif event.button.id == "btn-quit":
             self.app.exit()
     
     def action_begin(self) -> None:
-        self.app.push_screen(ModeSelectScreen())
+        self.app.push_screen("modes")
     
     def action_quit(self) -> None:
         self.app.exit()
@@ -268,6 +516,8 @@ contenant toute la magie nécessaire pour invoquer ton portefeuille crypto.
 Ces incantations suivent l'ancien standard BIP39, reconnu par :
   • Le Royaume Bitcoin (BTC)
   • Les Royaumes Ethereum (ETH)  
+  • Le Royaume Solana (SOL)
+  • Les Royaumes Litecoin (LTC), Dogecoin (DOGE) et Bitcoin Cash (BCH)
   • Tous les coffres majeurs (Ledger, Trezor, MetaMask...)
 
 [bold yellow]📖 CHAPITRE II : Les Trois Rituels Sacrés[/bold yellow]
@@ -327,6 +577,9 @@ class ModeSelectScreen(Screen):
         Binding("1", "select_dice", "Dés"),
         Binding("2", "select_random", "Aléatoire"),
         Binding("3", "select_hex", "Hex"),
+        Binding("4", "select_vanity", "Sceau"),
+        Binding("5", "select_final_word", "Dernier Mot"),
+        Binding("6", "select_restore", "Résurrection"),
     ]
     
     def compose(self) -> ComposeResult:
@@ -351,14 +604,28 @@ class ModeSelectScreen(Screen):
                     variant="default",
                     classes="ritual-button",
                 ),
+                Button(
+                    "🔱  Le Rituel du Sceau  [VOIE DU VANITEUX]\n    Cherche un coffre au sceau choisi",
+                    id="btn-vanity",
+                    variant="default",
+                    classes="ritual-button",
+                ),
+                Button(
+                    "🗝️  Le Rituel du Dernier Mot  [VOIE DU DÉLIVRÉ]\n    Complète 11 ou 23 mots par le mot de contrôle",
+                    id="btn-final-word",
+                    variant="default",
+                    classes="ritual-button",
+                ),
+                Button(
+                    "📜  Le Rituel de la Résurrection  [VOIE DU REVENANT]\n    Restaure une phrase existante et ses coffres",
+                    id="btn-restore",
+                    variant="default",
+                    classes="ritual-button",
+                ),
                 id="ritual-buttons",
                 classes="ritual-container",
             ),
-            Static(Panel(
-                WHY_DICE_TEXT,
-                title="🎯 Paroles du Maître du Donjon",
-                border_style="yellow",
-            ), id="why-dice"),
+            StaticBlock("why-dice", id="why-dice"),
             Button("🔙 Retourner à l'Entrée", id="btn-back", variant="warning"),
             id="mode-container",
             classes="screen-container",
@@ -371,6 +638,12 @@ class ModeSelectScreen(Screen):
             self.app.push_screen(RandomRitualScreen())
         elif event.button.id == "btn-hex":
             self.app.push_screen(HexRitualScreen())
+        elif event.button.id == "btn-vanity":
+            self.app.push_screen(VanityRitualScreen())
+        elif event.button.id == "btn-final-word":
+            self.app.push_screen(FinalWordScreen())
+        elif event.button.id == "btn-restore":
+            self.app.push_screen(RestoreScreen())
         elif event.button.id == "btn-back":
             self.app.pop_screen()
     
@@ -385,22 +658,33 @@ class ModeSelectScreen(Screen):
     
     def action_select_hex(self) -> None:
         self.app.push_screen(HexRitualScreen())
+    
+    def action_select_vanity(self) -> None:
+        self.app.push_screen(VanityRitualScreen())
+    
+    def action_select_final_word(self) -> None:
+        self.app.push_screen(FinalWordScreen())
+    
+    def action_select_restore(self) -> None:
+        self.app.push_screen(RestoreScreen())
 
 
 # ============================================================================
 # DICE RITUAL SCREEN
 # ============================================================================
 
-class DiceRitualScreen(Screen):
+class DiceRitualScreen(SecretScreen):
     """Dice roll entropy collection - Screen 2A"""
     
+    SECRETS = ("source",)
+    
     BINDINGS = [
         Binding("escape", "back", "Retour"),
     ]
     
     def __init__(self):
         super().__init__()
-        self.collector = DiceEntropyCollector(bytes_needed=16)
+        self.source = DiceSource(bytes_needed=16)
         self.wordlist = None
     
     def compose(self) -> ComposeResult:
@@ -421,16 +705,26 @@ class DiceRitualScreen(Screen):
                 Button("🎲 Offrir le Jet !", id="btn-roll", variant="primary"),
                 id="dice-inputs",
             ),
+            Horizontal(
+                Input(placeholder="⚡ Salve rapide : 17 42, 3 88, 20 05 ...", id="input-fast"),
+                Button("⚡ Offrir la Salve", id="btn-fast", variant="primary"),
+                id="fast-entry",
+            ),
             Horizontal(
                 Static("", id="roll-status", classes="status-text"),
-                Static("Bénis : 0/16 | Maudits : 0 | Lancés : 0", id="roll-stats"),
-                ProgressBar(total=16, show_eta=False, id="progress"),
+                Static(f"Bénis : 0/{self.source.collector.bytes_needed} | Maudits : 0 | Lancés : 0", id="roll-stats"),
+                ProgressBar(total=self.source.collector.bytes_needed, show_eta=False, id="progress"),
                 id="stats-section",
             ),
-            RichLog(id="roll-log", max_lines=50, highlight=True, markup=True, auto_scroll=True),
+            RollLog(id="roll-log"),
             Horizontal(
                 Button("🔙 Abandonner le Rituel", id="btn-back", variant="warning"),
                 Button("📥 Import Ancien", id="btn-bulk", variant="default"),
+                Select(
+                    [(f"👥 {n} opérateurs", n) for n in range(2, CEREMONY_MAX_LANES + 1)],
+                    value=2, allow_blank=False, id="select-operators",
+                ),
+                Button("🕯️ Cérémonie", id="btn-ceremony", variant="default"),
                 id="bottom-buttons",
             ),
             id="dice-container",
@@ -440,36 +734,122 @@ class DiceRitualScreen(Screen):
     def on_mount(self) -> None:
         """Load wordlist on mount"""
         try:
-            self.wordlist = load_wordlist(WORDLIST_PATH)
+            self.wordlist = get_wordlist()
         except Exception as e:
             self.notify(f"Erreur de chargement : {e}", severity="error")
         
+        # Widgets read or refreshed on every roll or salvo
+        self._d20_input = self.query_one("#input-d20", Input)
+        self._d100_input = self.query_one("#input-d100", Input)
+        self._roll_log = self.query_one("#roll-log", RollLog)
+        self._roll_status = self.query_one("#roll-status", Static)
+        self._roll_stats = self.query_one("#roll-stats", Static)
+        self._progress = self.query_one("#progress", ProgressBar)
+        
         # Focus on first input
-        self.query_one("#input-d20", Input).focus()
+        self._d20_input.focus()
+        self._await_entropy()
+    
+    @work(exclusive=True, group="entropy")
+    async def _await_entropy(self) -> None:
+        """Wait for the rolls (typed here or bulk-imported) to fill the entropy"""
+        try:
+            entropy = await collect_entropy([self.source], self.source.collector.bytes_needed)
+        except ValueError:
+            return
+        self._complete_ritual(entropy)
+    
+    def on_unmount(self) -> None:
+        self.source.close()
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-roll":
             self._process_roll()
         elif event.button.id == "btn-back":
             self.app.pop_screen()
+        elif event.button.id == "btn-fast":
+            self._process_salvo()
         elif event.button.id == "btn-bulk":
-            self.app.push_screen(BulkImportScreen(self.collector, self.wordlist))
+            rolls_before = self.source.stats.total_rolls
+            self.app.push_screen(
+                BulkImportScreen(self.source, self.wordlist),
+                lambda _: self._bulk_imported(rolls_before),
+            )
+        elif event.button.id == "btn-ceremony":
+            lanes = self.query_one("#select-operators", Select).value
+            self.app.switch_screen(CeremonyDiceScreen(lanes))
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in inputs"""
         if event.input.id == "input-d20":
-            self.query_one("#input-d100", Input).focus()
+            self._d100_input.focus()
         elif event.input.id == "input-d100":
             self._process_roll()
+        elif event.input.id == "input-fast":
+            self._process_salvo()
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Preview the salvo while it is typed"""
+        if event.input.id != "input-fast" or not event.value.strip():
+            return
+        try:
+            pairs = parse_roll_pairs(event.value, partial=True)
+        except ValueError as e:
+            self._roll_status.update(f"[yellow]⚠️ {e}[/yellow]", layout=False)
+            return
+        self._roll_status.update(f"⚡ {len(pairs)} jets prêts" if pairs else "", layout=False)
+    
+    def _process_salvo(self) -> None:
+        """Offer every roll of the fast-entry line at once"""
+        if self.source.is_complete:
+            return
+        fast_input = self.query_one("#input-fast", Input)
+        try:
+            pairs = parse_roll_pairs(fast_input.value)
+        except ValueError as e:
+            self.notify(f"Salve invalide : {e}", severity="error")
+            return
+        if not pairs:
+            return
+        
+        results = self.source.add_rolls(pairs)
+        self._roll_log.add_rolls(self.source.collector.recent_rolls(len(results)))
+        
+        accepted = sum(r.accepted for r in results)
+        status = f"[green]⚡ Salve de {len(results)} jets : {accepted} bénis, {len(results) - accepted} maudits[/green]"
+        if len(results) < len(pairs):
+            status += f" [dim]({len(pairs) - len(results)} jets superflus ignorés)[/dim]"
+        self._roll_status.update(status, layout=False)
+        self._refresh_stats()
+        fast_input.value = ""
+    
+    def _bulk_imported(self, rolls_before: int) -> None:
+        """Show the values offered on the bulk import screen, which fed the same source"""
+        if self.source is None:
+            return
+        imported = self.source.stats.total_rolls - rolls_before
+        if imported:
+            self._roll_log.add_rolls(self.source.collector.recent_rolls(imported), label="📥")
+            self._roll_status.update(f"[green]📥 {imported} offrandes importées[/green]", layout=False)
+        self._refresh_stats()
+    
+    def _refresh_stats(self) -> None:
+        stats = self.source.stats
+        self._roll_stats.update(
+            f"Bénis : {stats.accepted_rolls}/{stats.bytes_needed}  |  "
+            f"Maudits : {stats.rejected_rolls}  |  "
+            f"Lancés : {stats.total_rolls}",
+            layout=False,
+        )
+        self._progress.update(progress=stats.accepted_rolls)
     
     def _process_roll(self) -> None:
         """Process a dice roll"""
-        if self.collector.is_complete:
+        if self.source.is_complete:
             return
         
-        d20_input = self.query_one("#input-d20", Input)
-        d100_input = self.query_one("#input-d100", Input)
-        roll_log = self.query_one("#roll-log", RichLog)
+        d20_input = self._d20_input
+        d100_input = self._d100_input
         
         # Check for empty inputs
         d20_val = d20_input.value.strip()
@@ -495,47 +875,32 @@ class DiceRitualScreen(Screen):
                 self.notify("Le d100 ne parle que de 0 à 99 !", severity="warning")
                 return
             
-            result = self.collector.add_roll(d20, d100)
-            stats = self.collector.stats
+            result = self.source.add_roll(d20, d100)
+            self._roll_log.add_rolls(self.source.collector.recent_rolls(1))
             
-            # Update log
             n_value = result.roll_value
             if result.accepted:
-                roll_log.write(f"[green]✅ Jet #{stats.total_rolls}: D20={d20}, d100={d100} → N={n_value} [LES DIEUX ACCEPTENT !][/green]")
                 status_text = f"[green]✅ Béni ! N={n_value} < 1792[/green]"
             else:
-                roll_log.write(f"[red]❌ Jet #{stats.total_rolls}: D20={d20}, d100={d100} → N={n_value} [MAUDIT ! Relance !][/red]")
                 status_text = f"[red]❌ Maudit ! N={n_value} ≥ 1792, les Dieux en demandent un autre ![/red]"
             
-            # Update status
-            self.query_one("#roll-status", Static).update(status_text)
-            self.query_one("#roll-stats", Static).update(
-                f"Bénis : {stats.accepted_rolls}/16  |  "
-                f"Maudits : {stats.rejected_rolls}  |  "
-                f"Lancés : {stats.total_rolls}"
-            )
-            
-            # Update progress
-            self.query_one("#progress", ProgressBar).update(progress=stats.accepted_rolls)
+            # Update status, stats and progress
+            self._roll_status.update(status_text, layout=False)
+            self._refresh_stats()
             
             # Clear inputs and refocus
             d20_input.value = ""
             d100_input.value = ""
             d20_input.focus()
-            
-            # Check if complete
-            if self.collector.is_complete:
-                self._complete_ritual()
                 
         except ValueError as e:
             self.notify(f"Entrée invalide : {e}", severity="error")
     
-    def _complete_ritual(self) -> None:
+    def _complete_ritual(self, entropy: bytes) -> None:
         """Complete the ritual and show reveal screen"""
         try:
-            entropy = self.collector.get_entropy()
             mnemonic = entropy_to_mnemonic(entropy, self.wordlist)
-            stats = self.collector.stats
+            stats = self.source.stats
             
             self.app.push_screen(RevealScreen(
                 mnemonic=mnemonic,
@@ -561,9 +926,9 @@ class BulkImportScreen(Screen):
         Binding("escape", "back", "Retour"),
     ]
     
-    def __init__(self, collector: DiceEntropyCollector, wordlist: List[str]):
+    def __init__(self, source: DiceSource, wordlist: List[str]):
         super().__init__()
-        self.collector = collector
+        self.source = source
         self.wordlist = wordlist
     
     def compose(self) -> ComposeResult:
@@ -599,7 +964,7 @@ Tu as besoin de 16 offrandes bénies pour compléter le rituel.""",
         if event.button.id == "btn-import":
             self._process_import()
         elif event.button.id == "btn-back":
-            self.app.pop_screen()
+            self.dismiss()
     
     def _process_import(self) -> None:
         """Process bulk import"""
@@ -614,10 +979,10 @@ Tu as besoin de 16 offrandes bénies pour compléter le rituel.""",
             rejected = 0
             
             for n in values:
-                if self.collector.is_complete:
+                if self.source.is_complete:
                     break
                 try:
-                    result = self.collector.add_n_value(n)
+                    result = self.source.add_n_value(n)
                     if result.accepted:
                         accepted += 1
                     else:
@@ -625,33 +990,164 @@ Tu as besoin de 16 offrandes bénies pour compléter le rituel.""",
                 except ValueError:
                     rejected += 1
             
-            stats = self.collector.stats
+            stats = self.source.stats
             result_display.update(
                 f"[green]Offrandes reçues : {accepted} bénies, {rejected} maudites. "
-                f"Entropie collectée : {stats.bytes_collected}/16 octets[/green]"
+                f"Entropie collectée : {stats.bytes_collected}/{stats.bytes_needed} octets[/green]"
             )
             
-            if self.collector.is_complete:
-                self._complete_ritual()
+            # The dice screen awaits the same source and reveals the phrase
+            if self.source.is_complete:
+                self.dismiss()
                 
         except Exception as e:
             result_display.update(f"[red]Les Dieux rejettent ces offrandes : {e}[/red]")
     
-    def _complete_ritual(self) -> None:
-        """Complete the ritual"""
+    def action_back(self) -> None:
+        self.dismiss()
+
+
+# ============================================================================
+# DICE CEREMONY SCREEN
+# ============================================================================
+
+CEREMONY_MAX_LANES = 4
+
+
+class CeremonyDiceScreen(SecretScreen):
+    """Several operators roll at once, one lane each, merged by hash"""
+    
+    SECRETS = ("sources",)
+    
+    BINDINGS = [
+        Binding("escape", "back", "Retour"),
+    ]
+    
+    def __init__(self, lanes: int = 2, length: int = 16):
+        super().__init__()
+        self.length = length
+        self.share = lane_share(length, lanes)
+        # One independent source per operator; each rolls only its share
+        self.sources = [DiceSource(bytes_needed=self.share) for _ in range(lanes)]
+        self.wordlist = None
+    
+    def compose(self) -> ComposeResult:
+        lanes = []
+        for i in range(len(self.sources)):
+            lanes.append(Vertical(
+                Label(f"🧙 Opérateur {i + 1}", classes="lane-title"),
+                Input(placeholder="D20 (1-20)", id=f"lane-{i}-d20"),
+                Input(placeholder="d100 (0-99)", id=f"lane-{i}-d100"),
+                Button("🎲 Offrir", id=f"lane-{i}-roll", variant="primary"),
+                Static(f"Bénis : 0/{self.share} | Maudits : 0", id=f"lane-{i}-stats"),
+                ProgressBar(total=self.share, show_eta=False, id=f"lane-{i}-progress"),
+                classes="ceremony-lane",
+            ))
+        yield Container(
+            Static("🕯️ LA CÉRÉMONIE DES OS SACRÉS", classes="screen-title"),
+            Static(
+                f"{len(self.sources)} opérateurs lancent en même temps, {self.share} jets bénis chacun. "
+                "Leurs offrandes sont fondues par HKDF-SHA256 : aucun ne contrôle seul le destin.",
+                classes="compact-instructions",
+            ),
+            Horizontal(*lanes, id="ceremony-lanes"),
+            RollLog(id="roll-log"),
+            Horizontal(
+                Button("🔙 Abandonner la Cérémonie", id="btn-back", variant="warning"),
+                id="bottom-buttons",
+            ),
+            id="dice-container",
+            classes="screen-container",
+        )
+    
+    def on_mount(self) -> None:
         try:
-            entropy = self.collector.get_entropy()
-            mnemonic = entropy_to_mnemonic(entropy, self.wordlist)
-            stats = self.collector.stats
-            
-            # Pop bulk screen first
+            self.wordlist = get_wordlist()
+        except Exception as e:
+            self.notify(f"Erreur de chargement : {e}", severity="error")
+        self.query_one("#lane-0-d20", Input).focus()
+        self._await_entropy()
+    
+    @work(exclusive=True, group="entropy")
+    async def _await_entropy(self) -> None:
+        """Wait for every lane to roll its share, then merge them"""
+        try:
+            entropy = await collect_entropy(self.sources, self.length, share=self.share)
+        except ValueError:
+            return
+        self._complete_ritual(entropy)
+    
+    def on_unmount(self) -> None:
+        for source in self.sources:
+            source.close()
+    
+    @staticmethod
+    def _lane_of(widget_id: str) -> Tuple[int, str]:
+        """Lane index and field of a lane widget id ("lane-2-d20" -> (2, "d20"))"""
+        _, lane, field = widget_id.split("-", 2)
+        return int(lane), field
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-back":
             self.app.pop_screen()
-            # Then push reveal screen
+        elif event.button.id.startswith("lane-"):
+            self._process_roll(self._lane_of(event.button.id)[0])
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        lane, field = self._lane_of(event.input.id)
+        if field == "d20":
+            self.query_one(f"#lane-{lane}-d100", Input).focus()
+        else:
+            self._process_roll(lane)
+    
+    def _process_roll(self, lane: int) -> None:
+        """Process a roll from one operator's lane"""
+        source = self.sources[lane]
+        d20_input = self.query_one(f"#lane-{lane}-d20", Input)
+        d100_input = self.query_one(f"#lane-{lane}-d100", Input)
+        if source.is_complete:
+            self.notify(f"L'opérateur {lane + 1} a déjà offert sa part.", severity="information")
+            return
+        
+        try:
+            d20 = int(d20_input.value.strip())
+            d100 = int(d100_input.value.strip())
+        except ValueError:
+            self.notify(f"Opérateur {lane + 1} : D20 (1-20) et d100 (0-99) attendus !", severity="warning")
+            d20_input.focus()
+            return
+        if not (1 <= d20 <= 20 and 0 <= d100 <= 99):
+            self.notify(f"Opérateur {lane + 1} : D20 (1-20) et d100 (0-99) attendus !", severity="warning")
+            return
+        
+        source.add_roll(d20, d100)
+        stats = source.stats
+        self.query_one("#roll-log", RollLog).add_rolls(
+            source.collector.recent_rolls(1), label=f"Opérateur {lane + 1}, "
+        )
+        self.query_one(f"#lane-{lane}-stats", Static).update(
+            f"Bénis : {stats.accepted_rolls}/{self.share} | Maudits : {stats.rejected_rolls}"
+        )
+        self.query_one(f"#lane-{lane}-progress", ProgressBar).update(progress=stats.accepted_rolls)
+        d20_input.value = ""
+        d100_input.value = ""
+        if source.is_complete:
+            d20_input.disabled = d100_input.disabled = True
+            self.query_one(f"#lane-{lane}-roll", Button).disabled = True
+        else:
+            d20_input.focus()
+    
+    def _complete_ritual(self, entropy: bytes) -> None:
+        """All lanes are done: show the merged phrase"""
+        try:
+            mnemonic = entropy_to_mnemonic(entropy, self.wordlist)
+            total = sum(source.stats.total_rolls for source in self.sources)
+            rejected = sum(source.stats.rejected_rolls for source in self.sources)
             self.app.push_screen(RevealScreen(
                 mnemonic=mnemonic,
                 entropy_hex=entropy.hex(),
-                method="Import Parchemin Ancien",
-                stats_info=f"Offrandes : {stats.total_rolls} | Bénies : {stats.accepted_rolls}"
+                method=f"Cérémonie des Dés ({len(self.sources)} opérateurs)",
+                stats_info=f"Lancés : {total} | Maudits : {rejected} | Fusion HKDF-SHA256",
             ))
         except Exception as e:
             self.notify(f"Le rituel a échoué : {e}", severity="error")
@@ -710,20 +1206,20 @@ pour révéler tes 12 Mots de Pouvoir.""",
     
     def on_mount(self) -> None:
         try:
-            self.wordlist = load_wordlist(WORDLIST_PATH)
+            self.wordlist = get_wordlist()
         except Exception as e:
             self.notify(f"Erreur de chargement : {e}", severity="error")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-generate":
-            self._generate()
+            self.run_worker(self._generate(), exclusive=True)
         elif event.button.id == "btn-back":
             self.app.pop_screen()
     
-    def _generate(self) -> None:
+    async def _generate(self) -> None:
         """Generate random mnemonic"""
         try:
-            entropy = random_entropy(16)
+            entropy = await collect_entropy([RandomSource(16)])
             mnemonic = entropy_to_mnemonic(entropy, self.wordlist)
             
             self.app.push_screen(RevealScreen(
@@ -788,13 +1284,35 @@ Le préfixe "0x" est optionnel.""",
                 Button("🔙 Retraite", id="btn-back", variant="warning"),
                 classes="button-row",
             ),
+            Container(
+                Label("Ou importe un parchemin d'entropie (RNG matériel, lancers de dés) :"),
+                Horizontal(
+                    Input(placeholder="Chemin du fichier (binaire, hex, ou valeurs N)...", id="input-entropy-file"),
+                    Select(
+                        [("Conditionneur HKDF", "condition"), ("Valeurs N (rejet)", "dice")],
+                        value="condition",
+                        allow_blank=False,
+                        id="select-import-mode",
+                    ),
+                    Select(
+                        [("12 mots", 16), ("24 mots", 32)],
+                        value=16,
+                        allow_blank=False,
+                        id="select-import-words",
+                    ),
+                    Button("📂 Importer", id="btn-import-file", variant="default"),
+                    id="import-controls",
+                ),
+                Static("", id="import-status"),
+                classes="input-group",
+            ),
             id="hex-container",
             classes="screen-container",
         )
     
     def on_mount(self) -> None:
         try:
-            self.wordlist = load_wordlist(WORDLIST_PATH)
+            self.wordlist = get_wordlist()
         except Exception as e:
             self.notify(f"Erreur de chargement : {e}", severity="error")
         
@@ -818,15 +1336,75 @@ Le préfixe "0x" est optionnel.""",
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-generate":
-            self._generate()
+            self.run_worker(self._generate(), exclusive=True)
+        elif event.button.id == "btn-import-file":
+            self._start_import()
         elif event.button.id == "btn-back":
             self.app.pop_screen()
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "input-hex":
-            self._generate()
+            self.run_worker(self._generate(), exclusive=True)
+        elif event.input.id == "input-entropy-file":
+            self._start_import()
+    
+    def _start_import(self) -> None:
+        path = self.query_one("#input-entropy-file", Input).value.strip()
+        if not path:
+            self.notify("Indique le chemin du parchemin d'entropie.", severity="warning")
+            return
+        self.query_one("#btn-import-file", Button).disabled = True
+        self.query_one("#import-status", Static).update("⏳ L'Archimage distille le parchemin...")
+        self._import_file(
+            os.path.expanduser(path),
+            self.query_one("#select-import-mode", Select).value,
+            self.query_one("#select-import-words", Select).value,
+        )
     
-    def _generate(self) -> None:
+    @work(exclusive=True, group="import")
+    async def _import_file(self, path: str, mode: str, length: int) -> None:
+        status = self.query_one("#import-status", Static)
+        
+        def progress(done: int, total: int) -> None:
+            # Called from the import thread
+            self.app.call_from_thread(
+                status.update, f"⏳ L'Archimage distille le parchemin... {done * 100 // total}%"
+            )
+        
+        source = FileSource(path, length, mode=mode, progress=progress)
+        try:
+            await collect_entropy([source], length)
+        except (OSError, ValueError) as e:
+            self._import_failed(str(e))
+            return
+        self._import_done(source.result)
+    
+    def _import_failed(self, error: str) -> None:
+        self.query_one("#btn-import-file", Button).disabled = False
+        self.query_one("#import-status", Static).update(f"[red]❌ Le parchemin résiste : {error}[/red]")
+    
+    def _import_done(self, result: EntropyImportResult) -> None:
+        self.query_one("#btn-import-file", Button).disabled = False
+        unit = "valeur N" if result.mode == "dice" else "octet"
+        summary = (
+            f"{result.bytes_processed:,} octets ({result.fmt}) à {result.rate / 1e6:.1f} Mo/s | "
+            f"min-entropie estimée {result.min_entropy:.2f} bits/{unit}"
+        )
+        if result.mode == "dice":
+            summary += f" | {result.symbols} valeurs, {result.rolls_rejected} maudites"
+        self.query_one("#import-status", Static).update(f"[green]✅ {summary}[/green]")
+        try:
+            mnemonic = entropy_to_mnemonic(result.entropy, self.wordlist)
+            self.app.push_screen(RevealScreen(
+                mnemonic=mnemonic,
+                entropy_hex=result.entropy.hex(),
+                method="Parchemin d'Entropie" + (" (dés)" if result.mode == "dice" else " (HKDF)"),
+                stats_info=summary,
+            ))
+        except Exception as e:
+            self.notify(f"Le sort a échoué : {e}", severity="error")
+    
+    async def _generate(self) -> None:
         """Generate mnemonic from hex"""
         hex_input = self.query_one("#input-hex", Input)
         
@@ -836,7 +1414,7 @@ Le préfixe "0x" est optionnel.""",
             return
         
         try:
-            entropy = hex_to_entropy(hex_input.value)
+            entropy = await collect_entropy([HexSource(hex_input.value)])
             mnemonic = entropy_to_mnemonic(entropy, self.wordlist)
             
             self.app.push_screen(RevealScreen(
@@ -853,99 +1431,624 @@ Le préfixe "0x" est optionnel.""",
 
 
 # ============================================================================
-# REVEAL SCREEN
+# VANITY RITUAL SCREEN
 # ============================================================================
 
-class RevealScreen(Screen):
-    """Reveal mnemonic with safety warnings - Screen 3"""
+def format_attempts(n: float) -> str:
+    """Human-readable attempt count (1.2k, 3.4M...)"""
+    for unit, scale in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if n >= scale:
+            return f"{n / scale:.1f}{unit}"
+    return f"{n:.0f}"
+
+
+class VanityRitualScreen(Screen):
+    """Vanity address search over random mnemonics - Screen 2D"""
     
     BINDINGS = [
         Binding("escape", "back", "Retour"),
     ]
     
-    revealed = reactive(False)
-    
-    def __init__(
-        self,
-        mnemonic: str,
-        entropy_hex: str,
-        method: str,
-        stats_info: str,
-    ):
+    def __init__(self):
         super().__init__()
-        self.mnemonic = mnemonic
-        self.entropy_hex = entropy_hex
-        self.method = method
-        self.stats_info = stats_info
+        self.wordlist = None
+        self.search: Optional[VanitySearch] = None
+        self._timer = None
     
     def compose(self) -> ComposeResult:
         yield Container(
-            Static("📜 LE PARCHEMIN SACRÉ ATTEND", classes="screen-title"),
+            Static("🔱 LA FORGE DES SCEAUX", classes="screen-title"),
             Static(Panel(
-                SECURITY_WARNING,
-                title="⚔️ L'AVERTISSEMENT DU GARDIEN",
-                border_style="red",
-            ), id="warning-panel"),
-            Container(
-                Static("[italic]Les Mots de Pouvoir sont cachés. Prononce 'REVELER' pour briser le sceau.[/italic]", id="reveal-prompt"),
-                Input(
-                    placeholder="Murmure REVELER pour dévoiler les mots sacrés...",
-                    id="input-reveal",
-                    password=True,
+                """[italic]"Tu veux un coffre dont le sceau porte ton nom..."[/italic]
+
+Les esprits invoquent des phrases aléatoires jusqu'à ce que le sceau
+du coffre commence (ou finisse) par les runes choisies.
+Majuscules et minuscules sont confondues.
+
+• Bitcoin : le sceau commence toujours par 1 (ex. 1abc)
+• Ethereum : runes hexadécimales 0-9 a-f (ex. 0xcafe)
+
+Chaque rune supplémentaire multiplie l'attente par 16 à 58 !""",
+                title="🧙 Le Grimoire des Sceaux",
+                border_style="magenta",
+            ), id="vanity-info"),
+            Horizontal(
+                Select(
+                    [(name, key) for key, name in VANITY_CHAINS.items()],
+                    value="btc",
+                    allow_blank=False,
+                    id="select-chain",
                 ),
-                id="reveal-input-section",
-            ),
-            Container(
-                Static(self._get_masked_panel(), id="mnemonic-display"),
-                id="mnemonic-section",
+                Input(placeholder="Début du sceau...", id="input-prefix"),
+                Input(placeholder="Fin du sceau...", id="input-suffix"),
+                id="vanity-inputs",
             ),
-            Static(f"Rituel: {self.method} | {self.stats_info}", id="method-info", classes="dim-text"),
+            Static("", id="vanity-difficulty", classes="dim-text"),
+            Static("", id="vanity-progress", classes="dim-text"),
             Container(
-                Button("✅ Quête Accomplie", id="btn-done", variant="primary"),
-                Button("💼 Voir Tes Coffres", id="btn-export", variant="success"),
-                Button("⚠️ Exporter sur Parchemin", id="btn-export-mnemonic", variant="warning", disabled=True),
-                id="action-buttons",
+                Button("🔮 Forger le Sceau !", id="btn-start", variant="primary"),
+                Button("✋ Interrompre", id="btn-cancel", variant="error", disabled=True),
+                Button("🔙 Retraite", id="btn-back", variant="warning"),
                 classes="button-row",
             ),
-            id="reveal-container",
+            id="vanity-container",
             classes="screen-container",
         )
     
-    def _get_masked_panel(self) -> Panel:
-        """Get masked mnemonic panel"""
-        masked = mask_mnemonic(self.mnemonic)
-        return Panel(
-            masked,
-            title="🔒 Les Mots de Pouvoir (Scellés)",
-            border_style="dim",
-        )
-    
-    def _get_revealed_panel(self) -> Panel:
-        """Get revealed mnemonic panel"""
-        words = self.mnemonic.split()
-        
-        # Format words in numbered grid
-        lines = []
-        for i in range(0, len(words), 4):
-            row = []
-            for j, word in enumerate(words[i:i+4]):
-                num = i + j + 1
-                row.append(f"{num:2d}. {word:<12}")
-            lines.append("  ".join(row))
-        
-        formatted = "\n".join(lines)
+    def on_mount(self) -> None:
+        try:
+            self.wordlist = get_wordlist()
+        except Exception as e:
+            self.notify(f"Erreur de chargement : {e}", severity="error")
         
-        return Panel(
-            formatted,
-            title="🔓 LES MOTS DE POUVOIR - INSCRIS SUR PARCHEMIN, PUIS DÉTRUIS CE ROULEAU",
-            border_style="green",
-        )
+        self.query_one("#input-prefix", Input).focus()
+    
+    def on_unmount(self) -> None:
+        self._stop_search()
+    
+    def _pattern(self) -> tuple:
+        chain = self.query_one("#select-chain", Select).value
+        prefix = self.query_one("#input-prefix", Input).value
+        suffix = self.query_one("#input-suffix", Input).value
+        return chain, prefix, suffix
+    
+    def _update_difficulty(self) -> None:
+        display = self.query_one("#vanity-difficulty", Static)
+        chain, prefix, suffix = self._pattern()
+        if not prefix.strip() and not suffix.strip():
+            display.update("")
+            return
+        try:
+            difficulty = vanity_difficulty(chain, prefix, suffix)
+            display.update(f"🎯 Difficulté estimée : ~{format_attempts(difficulty)} invocations")
+        except ValueError as e:
+            display.update(f"[yellow]⚠️ {e}[/yellow]")
     
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Check for REVELER input"""
-        if event.input.id == "input-reveal":
-            if event.value.upper() == "REVELER":
-                self._reveal_mnemonic()
+        if event.input.id in ("input-prefix", "input-suffix"):
+            self._update_difficulty()
+    
+    def on_select_changed(self, event: Select.Changed) -> None:
+        self._update_difficulty()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id in ("input-prefix", "input-suffix"):
+            self._start()
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-start":
+            self._start()
+        elif event.button.id == "btn-cancel":
+            self._cancel()
+            self.query_one("#vanity-progress", Static).update("[yellow]✋ Forge interrompue.[/yellow]")
+        elif event.button.id == "btn-back":
+            self.app.pop_screen()
+    
+    def _start(self) -> None:
+        """Start the worker processes"""
+        if self.search is not None and self.search.is_running:
+            return
+        
+        chain, prefix, suffix = self._pattern()
+        try:
+            normalize_vanity_pattern(chain, prefix, suffix)
+            # Textual captures stderr; multiprocessing needs a real descriptor
+            with redirect_stderr(sys.__stderr__):
+                self.search = VanitySearch(self.wordlist, chain=chain, prefix=prefix, suffix=suffix)
+                self.search.start()
+        except Exception as e:
+            self.notify(f"La forge refuse : {e}", severity="error")
+            return
+        
+        self.query_one("#btn-start", Button).disabled = True
+        self.query_one("#btn-cancel", Button).disabled = False
+        self._timer = self.set_interval(0.5, self._poll)
+    
+    def _poll(self) -> None:
+        """Refresh attempts/sec and check for a winning mnemonic"""
+        if self.search is None:
+            return
+        
+        result = self.search.poll()
+        search = self.search
+        eta = (search.difficulty - search.attempts) / search.rate if search.rate else 0
+        self.query_one("#vanity-progress", Static).update(
+            f"⚒️ Invocations : {format_attempts(search.attempts)} | "
+            f"{search.rate:.0f}/s sur {search.workers} cœurs | "
+            f"Temps restant estimé : {max(eta, 0):.0f}s"
+        )
+        
+        if result is not None:
+            self._cancel()
+            self.app.push_screen(RevealScreen(
+                mnemonic=result.mnemonic,
+                entropy_hex=result.entropy_hex,
+                method="Rituel du Sceau",
+                stats_info=(
+                    f"Sceau : {result.wallet.address} | "
+                    f"Invocations : {result.attempts} en {result.elapsed:.1f}s"
+                ),
+            ))
+    
+    def _stop_search(self) -> None:
+        """Stop the timer and the worker processes"""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self.search is not None:
+            self.search.cancel()
+    
+    def _cancel(self) -> None:
+        """Stop the search and re-arm the buttons"""
+        self._stop_search()
+        self.query_one("#btn-start", Button).disabled = False
+        self.query_one("#btn-cancel", Button).disabled = True
+    
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+
+# ============================================================================
+# FINAL WORD SCREEN
+# ============================================================================
+
+class FinalWordScreen(Screen):
+    """Checksum word calculator for dice-rolled words - Screen 2E"""
+    
+    BINDINGS = [
+        Binding("escape", "back", "Retour"),
+    ]
+    
+    def __init__(self):
+        super().__init__()
+        self.wordlist: Optional[List[str]] = None
+        self.finals: List[str] = []
+        self._partial: List[str] = []
+    
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("🗝️ LE SANCTUAIRE DU DERNIER MOT", classes="screen-title"),
+            Static(Panel(
+                """[italic]"Tes dés ont parlé... mais le dernier mot appartient aux Dieux."[/italic]
+
+Inscris les 11 (ou 23) premiers mots tirés aux dés.
+Le dernier mot porte le sceau de contrôle : seuls 128 mots
+(ou 8 pour 24 mots) complètent une phrase valide.
+
+→ complète le mot en cours, Entrée choisit le mot final.""",
+                title="📖 Le Mot de Contrôle",
+                border_style="cyan",
+            ), id="final-info"),
+            Input(placeholder="abandon ability able ...", id="input-partial"),
+            Static("", id="partial-status"),
+            ScrollableContainer(Static("", id="final-words"), id="final-scroll"),
+            Horizontal(
+                Input(placeholder="Choisis le dernier mot...", id="input-final"),
+                Button("🔐 Sceller la Phrase", id="btn-seal", variant="primary", disabled=True),
+                Button("🔙 Retraite", id="btn-back", variant="warning"),
+                id="final-controls",
+            ),
+            id="final-container",
+            classes="screen-container",
+        )
+    
+    def on_mount(self) -> None:
+        try:
+            self.wordlist = get_wordlist()
+        except Exception as e:
+            self.notify(f"Erreur de chargement : {e}", severity="error")
+            return
+        self.query_one("#input-partial", Input).suggester = WordSuggester(self.wordlist)
+        self.query_one("#input-partial", Input).focus()
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "input-partial" and self.wordlist:
+            self._update_partial(event.value)
+        elif event.input.id == "input-final":
+            self.query_one("#btn-seal", Button).disabled = event.value.strip().lower() not in self.finals
+    
+    def _update_partial(self, value: str) -> None:
+        """Check the words typed so far and list the valid final words"""
+        status = self.query_one("#partial-status", Static)
+        words = value.lower().split()
+        # The word being typed is only checked once followed by a space
+        complete = words if value.endswith(" ") else words[:-1]
+        index = wordlist_index(self.wordlist)
+        unknown = [w for w in complete if w not in index]
+        
+        finals: List[str] = []
+        if unknown:
+            status.update(f"[red]❌ Mot inconnu du grimoire : {unknown[0]}[/red]")
+        elif len(words) + 1 in (12, 15, 18, 21, 24) and words[-1] in index:
+            finals = valid_final_words(words, self.wordlist)
+            status.update(
+                f"[green]✅ {len(words)} mots : {len(finals)} derniers mots possibles "
+                f"pour une phrase de {len(words) + 1} mots[/green]"
+            )
+        else:
+            status.update(f"[dim]{len(words)} mots inscrits (11, 14, 17, 20 ou 23 attendus)[/dim]")
+        
+        self.finals = finals
+        self._partial = words if finals else []
+        self.query_one("#final-words", Static).update(
+            Columns(finals, padding=(0, 2), equal=True) if finals else ""
+        )
+        final_input = self.query_one("#input-final", Input)
+        final_input.suggester = WordSuggester(finals) if finals else None
+        self.query_one("#btn-seal", Button).disabled = final_input.value.strip().lower() not in finals
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-seal":
+            self._seal()
+        elif event.button.id == "btn-back":
+            self.app.pop_screen()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "input-partial" and self.finals:
+            self.query_one("#input-final", Input).focus()
+        elif event.input.id == "input-final":
+            self._seal()
+    
+    def _seal(self) -> None:
+        """Complete the phrase with the chosen final word"""
+        final = self.query_one("#input-final", Input).value.strip().lower()
+        if final not in self.finals:
+            self.notify("Ce mot ne scelle pas la phrase. Choisis-en un de la liste.", severity="warning")
+            return
+        
+        try:
+            mnemonic = " ".join(self._partial + [final])
+            entropy = mnemonic_to_entropy(mnemonic, self.wordlist)
+            self.app.push_screen(RevealScreen(
+                mnemonic=mnemonic,
+                entropy_hex=entropy.hex(),
+                method="Rituel du Dernier Mot",
+                stats_info=f"Mot de contrôle choisi parmi {len(self.finals)}",
+            ))
+        except Exception as e:
+            self.notify(f"Le sceau a échoué : {e}", severity="error")
+    
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+
+# ============================================================================
+# RESTORE SCREEN
+# ============================================================================
+
+class RestoreScreen(SecretScreen):
+    """Restore an existing mnemonic to view its vaults - Screen 2F"""
+    
+    SECRETS = ("_vault", "builder")
+    
+    BINDINGS = [
+        Binding("escape", "back", "Retour"),
+    ]
+    
+    def __init__(self):
+        super().__init__()
+        self.wordlist: Optional[List[str]] = None
+        self.completer: Optional[WordCompleter] = None
+        self.builder: Optional[MnemonicBuilder] = None
+        self.language = "english"
+        # (mnemonic, vault) derived in the background once the checksum matches
+        self._vault: Optional[tuple] = None
+    
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("📜 LE RITUEL DE LA RÉSURRECTION", classes="screen-title"),
+            Static(Panel(
+                """[italic]"Les mots anciens se souviennent de leurs coffres..."[/italic]
+
+Inscris ta phrase de 12 à 24 mots, dans l'une des 10 langues
+du grimoire BIP39 (reconnue d'elle-même). En anglais, les 4
+premières lettres suffisent : le mot est complété dès l'espace.
+→ accepte la suggestion en cours.
+
+⚠️ Fais-le HORS LIGNE : cette phrase ouvre tous tes coffres.""",
+                title="🕯️ L'Invocation des Mots Perdus",
+                border_style="magenta",
+            ), id="restore-info"),
+            Input(placeholder="Inscris tes Mots de Pouvoir...", id="input-restore"),
+            Static("", id="restore-words"),
+            Static("", id="restore-status"),
+            Horizontal(
+                Input(placeholder="...ou le chemin d'une matrice SeedQR (1/0, # ou █)", id="input-seedqr"),
+                Button("🔳 Lire le SeedQR", id="btn-seedqr", variant="default"),
+                id="seedqr-controls",
+            ),
+            Container(
+                Button("💼 Ouvrir les Coffres", id="btn-open", variant="success", disabled=True),
+                Button("🔙 Retraite", id="btn-back", variant="warning"),
+                classes="button-row",
+            ),
+            id="restore-container",
+            classes="screen-container",
+        )
+    
+    def on_mount(self) -> None:
+        try:
+            self._set_language("english")
+        except Exception as e:
+            self.notify(f"Erreur de chargement : {e}", severity="error")
+            return
+        self.query_one("#input-restore", Input).focus()
+    
+    def _set_language(self, language: str) -> None:
+        """Switch the autocomplete and checksum to another wordlist"""
+        self.language = language
+        self.wordlist = get_wordlist(language)
+        self.completer = WordCompleter(self.wordlist)
+        self.builder = MnemonicBuilder(self.wordlist)
+        self.query_one("#input-restore", Input).suggester = WordSuggester(self.wordlist)
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id != "input-restore" or self.builder is None:
+            return
+        
+        # Wordlists are NFKD: accented words typed in NFC still match
+        value = unicodedata.normalize("NFKD", event.value.lower())
+        tokens = value.split()
+        typing = tokens[-1] if tokens and not value[-1:].isspace() else None
+        complete = tokens[:-1] if typing is not None else tokens
+        
+        resolved: List[str] = []
+        unknown = None
+        for token in complete:
+            word = self.completer.resolve(token)
+            if word is None:
+                unknown = token
+                break
+            resolved.append(word)
+        
+        # A word unknown in this language may belong to another wordlist
+        if unknown is not None:
+            try:
+                language = detect_language(" ".join(complete))
+            except ValueError:
+                language = self.language
+            if language != self.language:
+                self._set_language(language)
+                self.on_input_changed(event)
+                return
+        
+        # Expand abbreviated words in place once the space is typed
+        if unknown is None and resolved != complete and event.input.cursor_position == len(event.value):
+            separator = "\u3000" if self.language == "japanese" else " "
+            expanded = separator.join(resolved + ([typing] if typing is not None else []))
+            expanded += "" if typing else separator
+            event.input.value = expanded
+            event.input.cursor_position = len(expanded)
+            return
+        
+        # A fully typed last word counts without its trailing space
+        if unknown is None and typing is not None and self.completer.resolve(typing) == typing:
+            resolved.append(typing)
+        self.builder.set_words(resolved)
+        self._update_status(unknown)
+    
+    def _update_status(self, unknown: Optional[str]) -> None:
+        """Show the recognized words and the checksum state"""
+        words = self.builder.words
+        self.query_one("#restore-words", Static).update(Columns(
+            [f"[dim]{i:>2}.[/dim] {word}" for i, word in enumerate(words, 1)],
+            padding=(0, 2),
+            equal=True,
+        ))
+        status = self.query_one("#restore-status", Static)
+        open_button = self.query_one("#btn-open", Button)
+        open_button.disabled = True
+        self._vault = None
+        
+        valid = self.builder.checksum_valid
+        if unknown is not None:
+            status.update(f"[red]❌ Mot inconnu du grimoire : {unknown}[/red]")
+        elif valid is None:
+            status.update(
+                f"[dim]{len(words)} mots reconnus en {self.language} (12, 15, 18, 21 ou 24 attendus)[/dim]"
+            )
+        elif not valid:
+            status.update(f"[red]❌ {len(words)} mots, mais le sceau de contrôle est brisé (checksum invalide)[/red]")
+        else:
+            status.update(f"[green]✅ Phrase de {len(words)} mots valide[/green] — ⏳ Les esprits ouvrent tes coffres...")
+            self._derive_vault(self.builder.mnemonic)
+    
+    @work(thread=True, exclusive=True, group="restore")
+    def _derive_vault(self, mnemonic: str) -> None:
+        try:
+            vault = ExportPublicScreen.derive_vault(mnemonic)
+        except Exception as e:
+            self.app.call_from_thread(self.notify, f"Les esprits ont échoué à révéler : {e}", severity="error")
+            return
+        self.app.call_from_thread(self._vault_ready, mnemonic, vault)
+    
+    def _vault_ready(self, mnemonic: str, vault: dict) -> None:
+        """Keep the derived vault unless the phrase changed meanwhile"""
+        if mnemonic != self.builder.mnemonic or not self.builder.checksum_valid:
+            return
+        self._vault = (mnemonic, vault)
+        self.query_one("#btn-open", Button).disabled = False
+        self.query_one("#restore-status", Static).update(
+            f"[green]✅ Phrase de {len(self.builder.words)} mots valide — tes coffres sont prêts ![/green]"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-open":
+            self._open()
+        elif event.button.id == "btn-seedqr":
+            self._read_seedqr()
+        elif event.button.id == "btn-back":
+            self.app.pop_screen()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "input-restore":
+            self._open()
+        elif event.input.id == "input-seedqr":
+            self._read_seedqr()
+    
+    def _read_seedqr(self) -> None:
+        """Fill the phrase from a SeedQR / CompactSeedQR matrix file"""
+        path = self.query_one("#input-seedqr", Input).value.strip()
+        if not path:
+            self.notify("Indique le chemin de la matrice SeedQR.", severity="warning")
+            return
+        try:
+            mnemonic = load_seedqr_file(os.path.expanduser(path))
+        except (OSError, ValueError) as e:
+            self.query_one("#restore-status", Static).update(f"[red]❌ SeedQR illisible : {e}[/red]")
+            return
+        if self.language != "english":
+            self._set_language("english")
+        restore_input = self.query_one("#input-restore", Input)
+        restore_input.value = mnemonic
+        restore_input.cursor_position = len(mnemonic)
+        restore_input.focus()
+    
+    def _open(self) -> None:
+        if self._vault is None:
+            self.notify("Les coffres ne sont pas encore ouverts.", severity="warning")
+            return
+        mnemonic, vault = self._vault
+        self.app.push_screen(ExportPublicScreen(mnemonic, vault=vault))
+    
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+
+# ============================================================================
+# REVEAL SCREEN
+# ============================================================================
+
+class RevealScreen(SecretScreen):
+    """Reveal mnemonic with safety warnings - Screen 3"""
+    
+    SECRETS = ("mnemonic", "entropy_hex")
+    
+    BINDINGS = [
+        Binding("escape", "back", "Retour"),
+    ]
+    
+    revealed = reactive(False)
+    
+    # What the revealed panel shows, cycled by the SeedQR button
+    VIEWS = ("words", "compact", "standard")
+    
+    def __init__(
+        self,
+        mnemonic: str,
+        entropy_hex: str,
+        method: str,
+        stats_info: str,
+    ):
+        super().__init__()
+        self.mnemonic = mnemonic
+        self.entropy_hex = entropy_hex
+        self.method = method
+        self.stats_info = stats_info
+        self._view = 0
+    
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("📜 LE PARCHEMIN SACRÉ ATTEND", classes="screen-title"),
+            StaticBlock("security-warning", id="warning-panel"),
+            Container(
+                Static("[italic]Les Mots de Pouvoir sont cachés. Prononce 'REVELER' pour briser le sceau.[/italic]", id="reveal-prompt"),
+                Input(
+                    placeholder="Murmure REVELER pour dévoiler les mots sacrés...",
+                    id="input-reveal",
+                    password=True,
+                ),
+                id="reveal-input-section",
+            ),
+            Container(
+                Static(self._get_masked_panel(), id="mnemonic-display"),
+                id="mnemonic-section",
+            ),
+            Static(f"Rituel: {self.method} | {self.stats_info}", id="method-info", classes="dim-text"),
+            Container(
+                Button("✅ Quête Accomplie", id="btn-done", variant="primary"),
+                Button("💼 Voir Tes Coffres", id="btn-export", variant="success"),
+                Button("🔳 SeedQR", id="btn-seedqr", variant="default", disabled=True),
+                Button("⚠️ Exporter sur Parchemin", id="btn-export-mnemonic", variant="warning", disabled=True),
+                id="action-buttons",
+                classes="button-row",
+            ),
+            id="reveal-container",
+            classes="screen-container",
+        )
+    
+    def _get_masked_panel(self) -> Panel:
+        """Get masked mnemonic panel"""
+        masked = mask_mnemonic(self.mnemonic)
+        return Panel(
+            masked,
+            title="🔒 Les Mots de Pouvoir (Scellés)",
+            border_style="dim",
+        )
+    
+    def _get_revealed_panel(self) -> Panel:
+        """Get revealed mnemonic panel"""
+        words = self.mnemonic.split()
+        
+        # Format words in numbered grid
+        lines = []
+        for i in range(0, len(words), 4):
+            row = []
+            for j, word in enumerate(words[i:i+4]):
+                num = i + j + 1
+                row.append(f"{num:2d}. {word:<12}")
+            lines.append("  ".join(row))
+        
+        formatted = "\n".join(lines)
+        
+        return Panel(
+            formatted,
+            title="🔓 LES MOTS DE POUVOIR - INSCRIS SUR PARCHEMIN, PUIS DÉTRUIS CE ROULEAU",
+            border_style="green",
+        )
+    
+    def _get_seedqr_panel(self, compact: bool) -> Panel:
+        """
+        SeedQR of the mnemonic, to scan into a signing device.
+        
+        CompactSeedQR holds the raw entropy: 12 words fit a version 1 code
+        (21x21) instead of version 2 for the word indices of SeedQR.
+        """
+        modules = seedqr_encode(self.mnemonic, compact=compact)
+        size = len(modules)
+        name = "CompactSeedQR" if compact else "SeedQR"
+        return Panel(
+            Align.center(qr_half_blocks(modules)),
+            title=f"🔳 {name} - version {(size - 17) // 4} ({size}×{size}) - NE LE PHOTOGRAPHIE JAMAIS",
+            subtitle="🔳 encore : " + ("SeedQR standard" if compact else "retour aux mots"),
+            border_style="green",
+        )
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Check for REVELER input"""
+        if event.input.id == "input-reveal":
+            if event.value.upper() == "REVELER":
+                self._reveal_mnemonic()
     
     def _reveal_mnemonic(self) -> None:
         """Reveal the mnemonic"""
@@ -962,6 +2065,8 @@ class RevealScreen(Screen):
         # Enable export mnemonic button
         export_btn = self.query_one("#btn-export-mnemonic", Button)
         export_btn.disabled = False
+        # SeedQR is defined over the English wordlist only
+        self.query_one("#btn-seedqr", Button).disabled = detect_language(self.mnemonic) != "english"
         
         self.notify("⚔️ Le sceau est brisé ! Inscris ces mots et garde-les précieusement !", severity="warning")
     
@@ -972,11 +2077,20 @@ class RevealScreen(Screen):
             self.app.push_screen(ExportPublicScreen(self.mnemonic))
         elif event.button.id == "btn-export-mnemonic":
             self.app.push_screen(ExportMnemonicScreen(self.mnemonic, self.entropy_hex))
+        elif event.button.id == "btn-seedqr":
+            self._cycle_view()
+    
+    def _cycle_view(self) -> None:
+        """Words -> CompactSeedQR -> SeedQR -> words"""
+        self._view = (self._view + 1) % len(self.VIEWS)
+        view = self.VIEWS[self._view]
+        self.query_one("#mnemonic-display", Static).update(
+            self._get_revealed_panel() if view == "words" else self._get_seedqr_panel(view == "compact")
+        )
     
     def _return_to_title(self) -> None:
         """Return to title screen, clearing history"""
-        # Switch to a fresh TitleScreen (replaces entire screen stack)
-        self.app.switch_screen(TitleScreen())
+        self.app.return_to_title()
     
     def action_back(self) -> None:
         self.app.pop_screen()
@@ -986,17 +2100,35 @@ class RevealScreen(Screen):
 # EXPORT PUBLIC INFO SCREEN
 # ============================================================================
 
-class ExportPublicScreen(Screen):
+class ExportPublicScreen(SecretScreen):
     """Export public wallet information - Screen 4"""
     
+    SECRETS = ("mnemonic", "_vault", "_seed", "account_keys", "_pagers")
+    
     BINDINGS = [
         Binding("escape", "back", "Retour"),
+        Binding("n", "next_page", "Page suivante"),
+        Binding("p", "prev_page", "Page précédente"),
     ]
     
-    def __init__(self, mnemonic: str):
+    PAGE_SIZE = 50
+    
+    def __init__(self, mnemonic: str, vault: Optional[dict] = None):
         super().__init__()
         self.mnemonic = mnemonic
+        self._vault = vault
         self.wallets: List[WalletInfo] = []
+        self.account_keys: List[AccountKey] = []
+        self._pagers: dict = {}
+        # Every registered chain, with its icon and realm for display
+        self._specs = list(CHAIN_REGISTRY.values())
+        self._spec_of = {spec.chain: spec for spec in self._specs}
+        self._alias = self._specs[0].alias
+        self._page = 0
+        self._rows: List[WalletInfo] = []
+        self._pending_row = 0
+        self._seed: Optional[bytes] = None
+        self._current: Optional[WalletInfo] = None
     
     def compose(self) -> ComposeResult:
         yield Container(
@@ -1008,12 +2140,29 @@ class ExportPublicScreen(Screen):
                 title="🔓 Public Runes (Safe to Share)",
                 border_style="blue",
             ), id="export-info"),
-            ScrollableContainer(
-                Static("", id="wallet-display"),
-                id="wallet-scroll",
+            Horizontal(
+                Select(
+                    [(f"{spec.icon} {spec.chain}", spec.alias) for spec in self._specs],
+                    value=self._alias,
+                    allow_blank=False,
+                    id="select-wallet-chain",
+                ),
+                Input(placeholder="Aller à l'index...", id="input-goto", type="integer"),
+                Static("", id="page-info", classes="dim-text"),
+                id="browser-controls",
+            ),
+            Horizontal(
+                DataTable(id="wallet-table", cursor_type="row", zebra_stripes=True),
+                ScrollableContainer(
+                    Static("", id="wallet-display"),
+                    id="wallet-scroll",
+                ),
+                id="wallet-browser",
             ),
             Container(
                 Button("💾 Inscribe to Scroll", id="btn-save", variant="primary"),
+                Button("🗝️ Clés de Guet (xpub)", id="btn-save-xpub", variant="default"),
+                Button("✍️ Sceau de Possession", id="btn-sign", variant="default"),
                 Button("🔙 Return", id="btn-back", variant="warning"),
                 classes="button-row",
             ),
@@ -1024,72 +2173,207 @@ class ExportPublicScreen(Screen):
     
     def on_mount(self) -> None:
         """Derive wallet addresses"""
+        table = self.query_one("#wallet-table", DataTable)
+        table.add_columns("Index", "Chemin Ancestral", "Sceau du Coffre")
+        
         try:
-            self.wallets = derive_wallet_info(self.mnemonic)
-            self._display_wallets()
+            vault = self._vault or self.derive_vault(self.mnemonic, self._specs)
+            self._seed = vault["seed"]
+            self.wallets = vault["wallets"]
+            self.account_keys = vault["account_keys"]
+            self._pagers = vault["pagers"]
+            self._show_page(0)
+            table.focus()
         except Exception as e:
             self.notify(f"Les esprits ont échoué à révéler : {e}", severity="error")
     
-    def _display_wallets(self) -> None:
-        """Display wallet information with QR codes"""
+    @classmethod
+    def derive_vault(cls, mnemonic: str, specs: Optional[list] = None) -> dict:
+        """
+        Seed, first addresses, xpubs and address pagers of a mnemonic.
+        
+        Thread-safe, so a previous screen can derive the vault in a worker
+        and hand it over.
+        """
+        specs = list(CHAIN_REGISTRY.values()) if specs is None else specs
+        # One PBKDF2 and one master node for every address type and xpub
+        seed = mnemonic_to_seed(mnemonic)
+        cache = {}
+        wallets = wallets_from_seed(seed, specs, cache)
+        account_keys = derive_account_keys(seed, cache, specs)
+        
+        # secp256k1 pagers keep only the public account nodes; ed25519
+        # is hardened-only, so its pager keeps the coin-level node
+        pagers = {}
+        secp = [spec for spec in specs if spec.curve == "secp256k1"]
+        paths = [account_path(spec.path) for spec in secp]
+        for spec, node in zip(secp, derive_paths(cache[()], paths, cache)):
+            pagers[spec.alias] = AddressPager(node, spec, page_size=cls.PAGE_SIZE)
+        for spec in specs:
+            if spec.curve == "ed25519":
+                pagers[spec.alias] = Ed25519Pager(
+                    seed, spec, page_size=cls.PAGE_SIZE, cache=cache.get("ed25519"),
+                )
+        return {"seed": seed, "wallets": wallets, "account_keys": account_keys, "pagers": pagers}
+    
+    # ------------------------------------------------------------------
+    # Lazy address browser
+    # ------------------------------------------------------------------
+    
+    def _show_page(self, page: int, row: int = 0) -> None:
+        """Show a page from the pager cache, or derive it in a worker"""
+        pager = self._pagers[self._alias]
+        if not (0 <= page < pager.page_count):
+            return
+        
+        self._page = page
+        self._pending_row = row
+        rows = pager.cached(page)
+        if rows is not None:
+            self._page_loaded(self._alias, page, rows)
+        else:
+            self.query_one("#page-info", Static).update("⏳ Les esprits dérivent les sceaux...")
+            self._load_page(self._alias, page)
+    
+    @work(thread=True, exclusive=True, group="pager")
+    def _load_page(self, alias: str, page: int) -> None:
+        rows = self._pagers[alias].page(page)
+        self.app.call_from_thread(self._page_loaded, alias, page, rows)
+    
+    @work(thread=True, group="prefetch")
+    def _prefetch_page(self, alias: str, page: int) -> None:
+        pager = self._pagers[alias]
+        if page < pager.page_count:
+            pager.page(page)
+    
+    def _page_loaded(self, alias: str, page: int, rows: List[WalletInfo]) -> None:
+        """Fill the table with a derived page (ignoring stale results)"""
+        if (alias, page) != (self._alias, self._page):
+            return
+        
+        self._rows = rows
+        table = self.query_one("#wallet-table", DataTable)
+        table.clear()
+        first = page * self.PAGE_SIZE
+        for i, wallet in enumerate(rows):
+            table.add_row(str(first + i), wallet.path, wallet.address, key=str(first + i))
+        table.move_cursor(row=self._pending_row)
+        
+        self.query_one("#page-info", Static).update(
+            f"Page {page + 1} · index {first}-{first + len(rows) - 1} · [bold]n[/bold]/[bold]p[/bold] pour tourner les pages"
+        )
+        self._display_wallet(rows[self._pending_row])
+        self._prefetch_page(alias, page + 1)
+    
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        if 0 <= event.cursor_row < len(self._rows):
+            self._display_wallet(self._rows[event.cursor_row])
+    
+    def on_select_changed(self, event: Select.Changed) -> None:
+        if event.select.id == "select-wallet-chain" and event.value != self._alias:
+            self._alias = event.value
+            self._show_page(0)
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "input-goto":
+            try:
+                index = int(event.value)
+                if not (0 <= index <= AddressPager.MAX_INDEX):
+                    raise ValueError
+            except ValueError:
+                self.notify("L'index doit être entre 0 et 2147483647", severity="warning")
+                return
+            self._show_page(index // self.PAGE_SIZE, index % self.PAGE_SIZE)
+            self.query_one("#wallet-table", DataTable).focus()
+    
+    def action_next_page(self) -> None:
+        self._show_page(self._page + 1)
+    
+    def action_prev_page(self) -> None:
+        if self._page > 0:
+            self._show_page(self._page - 1, self.PAGE_SIZE - 1)
+    
+    def _display_wallet(self, wallet: WalletInfo) -> None:
+        """Display the highlighted address with its QR code"""
         display = self.query_one("#wallet-display", Static)
+        self._current = wallet
         
-        panels = []
-        for wallet in self.wallets:
-            icon = "🔷" if wallet.chain == "Ethereum" else "🟠"
-            realm = "Royaume Ethereum" if wallet.chain == "Ethereum" else "Royaume Bitcoin"
-            
-            # Generate QR code if available
-            qr_text = ""
-            if HAS_QRCODE:
-                qr_text = self._generate_ascii_qr(wallet.address)
-            else:
-                qr_url = f"https://api.qrserver.com/v1/create-qr-code/?size=200x200&data={wallet.address}"
-                qr_text = f"\n📱 Rune d'Invocation : {qr_url}"
-            
-            panel_content = f"""{icon} {realm.upper()}
+        xpubs = {key.chain: key for key in self.account_keys}
+        spec = self._spec_of[wallet.chain]
+        icon, realm = spec.icon, spec.realm
+        
+        # Generate QR code if available
+        qr_text = ""
+        if HAS_QRCODE:
+            qr_text = self._generate_ascii_qr(wallet.address)
+        else:
+            qr_url = f"https://api.qrserver.com/v1/create-qr-code/?size=200x200&data={wallet.address}"
+            qr_text = f"\n📱 Rune d'Invocation : {qr_url}"
+        
+        account = xpubs.get(wallet.chain)
+        xpub_text = f"\nClé de Guet ({account.path}) : {account.xpub}\n" if account else ""
+        
+        panel_content = f"""{icon} {realm.upper()}
 
 Sceau du Coffre : {wallet.address}
 Chemin Ancestral : {wallet.path}
-
+{xpub_text}
 Portail de Divination : {wallet.explorer_url}
 {qr_text}
 """
-            panels.append(Panel(panel_content, title=f"💼 Coffre {realm}", border_style="cyan"))
-        
-        display.update(Group(*panels))
+        display.update(Panel(panel_content, title=f"💼 Coffre {realm} — {wallet.chain}", border_style="cyan"))
     
     def _generate_ascii_qr(self, data: str) -> str:
         """Generate ASCII QR code"""
-        try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=1,
-                border=1,
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-            
-            # Generate ASCII art
-            lines = []
-            lines.append("\n📱 Rune d'Invocation (scanne pour recevoir des tributs) :")
-            matrix = qr.get_matrix()
-            for row in matrix:
-                line = ""
-                for cell in row:
-                    line += "██" if cell else "  "
-                lines.append(line)
-            return "\n".join(lines)
-        except Exception:
-            return "\n📱 Échec de la génération de la rune"
+        return ascii_qr(data)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-save":
             self._save_to_file()
+        elif event.button.id == "btn-save-xpub":
+            self._save_account_keys()
+        elif event.button.id == "btn-sign":
+            if self._seed is not None and self._current is not None:
+                self.app.push_screen(SignMessageScreen(self._seed, self._current))
         elif event.button.id == "btn-back":
             self.app.pop_screen()
     
+    def _save_account_keys(self) -> None:
+        """Save account-level xpubs for watch-only use"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"cles_de_guet_{timestamp}.txt"
+        
+        try:
+            content = [
+                "=" * 60,
+                "🗝️ DONJON & WALLETS - Clés de Guet (lecture seule) 🗝️",
+                f"Inscrit le : {datetime.now().isoformat()}",
+                "=" * 60,
+                "",
+                "✅ Ces clés publiques étendues permettent de dériver les sceaux",
+                "   de réception sans la phrase secrète :",
+                "   python dw_app.py watch <xpub> --chain btc --count 20",
+                "⚠️ Elles révèlent tout l'historique du coffre : partage-les avec prudence.",
+                "",
+            ]
+            for key in self.account_keys:
+                content.extend([
+                    f"{key.chain} ({key.path})",
+                    key.xpub,
+                    "",
+                ])
+            
+            filepath = Path.cwd() / filename
+            with open(filepath, "w") as f:
+                f.write("\n".join(content))
+            
+            status = self.query_one("#save-status", Static)
+            status.update(f"[green]✅ Clés de guet inscrites dans {filename}[/green]")
+            self.notify(f"Clés de guet inscrites : {filename}", severity="information")
+            
+        except Exception as e:
+            self.notify(f"L'inscription a échoué : {e}", severity="error")
+    
     def _save_to_file(self) -> None:
         """Save public info to file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1107,17 +2391,21 @@ Portail de Divination : {wallet.explorer_url}
                 "",
             ]
             
+            xpubs = {key.chain: key for key in self.account_keys}
             for wallet in self.wallets:
-                realm = "Royaume Ethereum" if wallet.chain == "Ethereum" else "Royaume Bitcoin"
+                realm = self._spec_of[wallet.chain].realm
                 content.extend([
                     "-" * 40,
-                    f"COFFRE {realm.upper()}",
+                    f"COFFRE {realm.upper()} — {wallet.chain}",
                     "-" * 40,
                     f"Sceau du Coffre : {wallet.address}",
                     f"Chemin Ancestral : {wallet.path}",
                     f"Portail de Divination : {wallet.explorer_url}",
-                    "",
                 ])
+                if wallet.chain in xpubs:
+                    account = xpubs[wallet.chain]
+                    content.append(f"Clé de Guet ({account.path}) : {account.xpub}")
+                content.append("")
             
             filepath = Path.cwd() / filename
             with open(filepath, "w") as f:
@@ -1134,13 +2422,177 @@ Portail de Divination : {wallet.explorer_url}
         self.app.pop_screen()
 
 
+# ============================================================================
+# PROOF OF OWNERSHIP SCREEN
+# ============================================================================
+
+PROOF_FILENAME = "preuves_de_possession.jsonl"
+
+
+class SignMessageScreen(SecretScreen):
+    """Sign a message with a vault key and verify signature scrolls - Screen 4B"""
+    
+    SECRETS = ("seed", "signed")
+    
+    BINDINGS = [
+        Binding("escape", "back", "Retour"),
+    ]
+    
+    def __init__(self, seed: bytes, wallet: WalletInfo):
+        super().__init__()
+        self.seed = seed
+        self.wallet = wallet
+        self.signed: Optional[SignedMessage] = None
+    
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("✍️ LE SCEAU DE POSSESSION", classes="screen-title"),
+            Static(Panel(
+                f"""[italic]"Prouve que ce coffre t'appartient, sans jamais l'ouvrir..."[/italic]
+
+Coffre : {self.wallet.chain}
+Sceau du Coffre : {self.wallet.address}
+Chemin Ancestral : {self.wallet.path}
+
+La signature (BIP-137 pour Bitcoin, EIP-191 pour Ethereum) prouve
+la possession de la clé sans la révéler.""",
+                title="🧙 Preuve de Possession",
+                border_style="magenta",
+            ), id="sign-info"),
+            Input(placeholder="Message à sceller...", id="input-message"),
+            Container(
+                Button("✍️ Sceller", id="btn-sign-message", variant="primary"),
+                Button("💾 Inscrire la Preuve", id="btn-save-proof", variant="default", disabled=True),
+                Button("🔙 Retour", id="btn-back", variant="warning"),
+                classes="button-row",
+            ),
+            Static("", id="signature-display"),
+            Horizontal(
+                Input(placeholder=f"Parchemin de preuves à vérifier ({PROOF_FILENAME})...", id="input-verify-file"),
+                Button("🔍 Vérifier", id="btn-verify", variant="default"),
+                id="verify-controls",
+            ),
+            Static("", id="verify-status", classes="dim-text"),
+            id="sign-container",
+            classes="screen-container",
+        )
+    
+    def on_mount(self) -> None:
+        self.query_one("#input-message", Input).focus()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "input-message":
+            self._sign()
+        elif event.input.id == "input-verify-file":
+            self._start_verify()
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-sign-message":
+            self._sign()
+        elif event.button.id == "btn-save-proof":
+            self._save_proof()
+        elif event.button.id == "btn-verify":
+            self._start_verify()
+        elif event.button.id == "btn-back":
+            self.app.pop_screen()
+    
+    def _sign(self) -> None:
+        message = self.query_one("#input-message", Input).value
+        if not message:
+            self.notify("Écris d'abord le message à sceller", severity="warning")
+            return
+        try:
+            self.signed = sign_wallet_message(self.seed, self.wallet, message)
+        except ValueError as e:
+            self.notify(f"Le sceau a échoué : {e}", severity="error")
+            return
+        
+        self.query_one("#signature-display", Static).update(Panel(
+            f"Message : {self.signed.message}\n"
+            f"Sceau du Coffre : {self.signed.address}\n\n"
+            f"Signature :\n{self.signed.signature}",
+            title="✍️ Message Scellé",
+            border_style="green",
+        ))
+        self.query_one("#btn-save-proof", Button).disabled = False
+    
+    def _save_proof(self) -> None:
+        """Append the signed message to the proof scroll (JSON Lines)"""
+        if self.signed is None:
+            return
+        record = {
+            "chain": self.signed.chain,
+            "address": self.signed.address,
+            "path": self.wallet.path,
+            "message": self.signed.message,
+            "signature": self.signed.signature,
+        }
+        try:
+            with open(Path.cwd() / PROOF_FILENAME, "a") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.query_one("#verify-status", Static).update(
+                f"[green]✅ Preuve inscrite dans {PROOF_FILENAME}[/green]"
+            )
+            self.notify(f"Preuve inscrite : {PROOF_FILENAME}", severity="information")
+        except Exception as e:
+            self.notify(f"L'inscription a échoué : {e}", severity="error")
+    
+    def _start_verify(self) -> None:
+        path = Path(self.query_one("#input-verify-file", Input).value.strip() or PROOF_FILENAME)
+        if not path.is_file():
+            self.notify(f"Parchemin introuvable : {path}", severity="warning")
+            return
+        self.query_one("#btn-verify", Button).disabled = True
+        self.query_one("#verify-status", Static).update("⏳ Les esprits examinent les sceaux...")
+        self._verify_file(path)
+    
+    @work(thread=True, exclusive=True, group="verify")
+    def _verify_file(self, path: Path) -> None:
+        def progress(stats: VerifyStats) -> None:
+            self.app.call_from_thread(
+                self.query_one("#verify-status", Static).update,
+                f"⏳ {stats.checked} sceaux examinés ({stats.rate:.0f}/s)...",
+            )
+        
+        try:
+            # Textual captures stderr; multiprocessing needs a real descriptor
+            with open(path) as f, redirect_stderr(sys.__stderr__):
+                results, stats = verify_message_file(f, progress=progress)
+        except Exception as e:
+            self.app.call_from_thread(self._verify_done, None, str(e))
+            return
+        self.app.call_from_thread(self._verify_done, (results, stats), "")
+    
+    def _verify_done(self, outcome, error: str) -> None:
+        self.query_one("#btn-verify", Button).disabled = False
+        status = self.query_one("#verify-status", Static)
+        if outcome is None:
+            status.update(f"[red]❌ Vérification impossible : {error}[/red]")
+            return
+        
+        results, stats = outcome
+        bad = [str(r.line) for r in results if not r.valid][:10]
+        summary = (
+            f"✅ {stats.valid} valides · ❌ {stats.invalid} invalides · "
+            f"⚠️ {stats.errors} illisibles — {stats.checked} sceaux en {stats.elapsed:.1f}s"
+        )
+        if bad:
+            summary += f"\nLignes en cause : {', '.join(bad)}{'...' if stats.invalid + stats.errors > len(bad) else ''}"
+        status.update(summary)
+    
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+
 # ============================================================================
 # EXPORT MNEMONIC SCREEN
 # ============================================================================
 
-class ExportMnemonicScreen(Screen):
+class ExportMnemonicScreen(SecretScreen):
     """Export mnemonic with extra confirmation - DANGEROUS"""
     
+    SECRETS = ("mnemonic", "entropy_hex")
+    
     BINDINGS = [
         Binding("escape", "back", "Retour"),
     ]
@@ -1420,16 +2872,56 @@ class DungeonWalletsApp(App):
     }
     
     #roll-stats {
-        width: auto;
+        width: 48;
         color: $text-muted;
         margin-right: 2;
     }
     
+    /* Fixed boxes: per-roll updates repaint without a relayout */
+    #roll-status {
+        width: 1fr;
+        height: 3;
+    }
+    
     #progress {
         width: 30;
     }
     
     /* Log section */
+    #fast-entry {
+        height: 3;
+        align: center middle;
+    }
+    
+    #input-fast {
+        width: 60;
+    }
+    
+    #ceremony-lanes {
+        height: auto;
+    }
+    
+    .ceremony-lane {
+        width: 1fr;
+        height: auto;
+        margin: 0 1;
+        padding: 0 1;
+        border: round $secondary;
+    }
+    
+    .ceremony-lane Input, .ceremony-lane Button {
+        width: 100%;
+    }
+    
+    .lane-title {
+        text-style: bold;
+        color: $warning;
+    }
+    
+    #select-operators {
+        width: 24;
+    }
+    
     #roll-log {
         height: 1fr;
         margin: 1 0;
@@ -1459,6 +2951,41 @@ class DungeonWalletsApp(App):
         border: solid $primary;
     }
     
+    /* Address browser */
+    #browser-controls {
+        height: 3;
+        align: left middle;
+    }
+    
+    #browser-controls Select {
+        width: 30;
+    }
+    
+    #input-goto {
+        width: 24;
+    }
+    
+    #page-info {
+        width: 1fr;
+        margin: 1 2;
+        text-align: left;
+    }
+    
+    #wallet-browser {
+        height: 1fr;
+    }
+    
+    #wallet-table {
+        width: 1fr;
+        height: 1fr;
+        margin: 1 1 1 0;
+        border: solid $secondary;
+    }
+    
+    #wallet-browser #wallet-scroll {
+        width: 1fr;
+    }
+    
     /* Dim text */
     .dim-text {
         color: $text-muted;
@@ -1515,6 +3042,97 @@ class DungeonWalletsApp(App):
         margin: 1 0;
     }
     
+    /* Vanity inputs */
+    #vanity-inputs {
+        height: 3;
+        align: center middle;
+    }
+    
+    #vanity-inputs Select {
+        width: 20;
+    }
+    
+    #vanity-inputs Input {
+        width: 30;
+    }
+    
+    /* Entropy file import */
+    #import-controls {
+        height: 3;
+    }
+    
+    #input-entropy-file {
+        width: 1fr;
+    }
+    
+    #import-controls Select {
+        width: 26;
+    }
+    
+    #import-status {
+        margin: 0 1;
+    }
+    
+    /* Final word */
+    #input-partial {
+        margin: 1 0 0 0;
+    }
+    
+    #partial-status {
+        margin: 0 1;
+    }
+    
+    #final-scroll {
+        height: 1fr;
+        border: round $primary;
+    }
+    
+    #final-controls {
+        height: 3;
+    }
+    
+    #input-final {
+        width: 1fr;
+    }
+    
+    /* Restore */
+    #input-restore {
+        margin: 1 0;
+    }
+    
+    #restore-words {
+        height: auto;
+        min-height: 3;
+        border: round $primary;
+        padding: 0 1;
+    }
+    
+    #restore-status {
+        margin: 1;
+    }
+    
+    #seedqr-controls {
+        height: 3;
+    }
+    
+    #input-seedqr {
+        width: 1fr;
+    }
+    
+    /* Proof of ownership */
+    #input-message {
+        margin: 1 0;
+    }
+    
+    #verify-controls {
+        height: 3;
+        margin-top: 1;
+    }
+    
+    #input-verify-file {
+        width: 1fr;
+    }
+    
     /* Validation display */
     #hex-validation {
         text-align: center;
@@ -1537,26 +3155,581 @@ class DungeonWalletsApp(App):
     ]
     
     def on_mount(self) -> None:
-        """Start with title screen"""
-        self.push_screen(TitleScreen())
+        """Install the stateless screens once, and start with the title screen"""
+        self.install_screen(TitleScreen(), "title")
+        self.install_screen(ModeSelectScreen(), "modes")
+        self.install_screen(HelpScreen(), "help")
+        self.push_screen("title")
+    
+    def return_to_title(self) -> None:
+        """Unwind the screen stack to the title; ritual screens are removed with their secrets"""
+        title = self.get_screen("title")
+        while self.screen is not title and len(self.screen_stack) > 1:
+            self.pop_screen()
     
     def action_quit(self) -> None:
         """Quit the application"""
         self.exit()
 
 
+# ============================================================================
+# UI LATENCY BENCHMARK
+# ============================================================================
+
+UI_BASELINE_PATH = Path(__file__).parent / "ui_latency_baseline.json"
+
+
+class UiLatencyProbe:
+    """
+    Drive a headless DungeonWalletsApp and time each input until it is painted.
+    
+    Pilot.press() waits for CPU idleness after every key (60-90 ms per key by
+    itself), which would swamp the app's own latency. The probe posts the key
+    event directly and waits only until every message queue of the app and
+    the current screen is drained and the screen has been refreshed.
+    """
+    
+    def __init__(self, pilot):
+        self.pilot = pilot
+        self.app = pilot.app
+        self.samples: dict = {}
+    
+    def _busy(self) -> bool:
+        nodes = (self.app, *self.app.screen.walk_children(with_self=True))
+        return any(node._message_queue.qsize() for node in nodes)
+    
+    async def settle(self, screen_type: Optional[type] = None, timeout: float = 10.0) -> None:
+        deadline = time.perf_counter() + timeout
+        while True:
+            await self.pilot.pause(0)
+            if (screen_type is None or isinstance(self.app.screen, screen_type)) and not self._busy():
+                return
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"UI did not settle on {screen_type and screen_type.__name__}")
+    
+    def _record(self, metric: str, start: float) -> None:
+        self.samples.setdefault(metric, []).append((time.perf_counter() - start) * 1000)
+    
+    async def key(self, key: str, metric: str = "keystroke", screen_type: Optional[type] = None) -> None:
+        """Send one key and record its latency under metric"""
+        char = key if len(key) == 1 else {"enter": "\r", "escape": "\x1b"}.get(key)
+        start = time.perf_counter()
+        self.app.post_message(events.Key(key, char))
+        await self.settle(screen_type)
+        self._record(metric, start)
+    
+    async def type(self, text: str) -> None:
+        for char in text:
+            await self.key(char)
+    
+    def _transition_metric(self, screen_type: type) -> str:
+        return f"transition:{type(self.app.screen).__name__}->{screen_type.__name__}"
+    
+    async def press_button(self, selector: str, screen_type: type) -> None:
+        """Press a button and record the transition to screen_type"""
+        metric = self._transition_metric(screen_type)
+        start = time.perf_counter()
+        self.app.screen.query_one(selector, Button).press()
+        await self.settle(screen_type)
+        self._record(metric, start)
+    
+    async def transition(self, key: str, screen_type: type) -> None:
+        """Send a key that switches to screen_type and record the transition"""
+        await self.key(key, self._transition_metric(screen_type), screen_type)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * q) - 1)]
+
+
+def summarize_latencies(samples: dict) -> dict:
+    """p50/p99/max in ms and sample count per metric"""
+    return {
+        metric: {
+            "count": len(values),
+            "p50": round(_percentile(values, 0.50), 3),
+            "p99": round(_percentile(values, 0.99), 3),
+            "max": round(max(values), 3),
+        }
+        for metric, values in sorted(samples.items())
+    }
+
+
+async def benchmark_ui(rolls: int = 100, sessions: int = 3, size: Tuple[int, int] = (140, 50)) -> dict:
+    """
+    Script full dice sessions in a headless app and collect latencies.
+    
+    Each session goes title -> mode select -> dice ritual, types rolls
+    keystroke by keystroke (rolls - 16 cursed ones, then 16 blessed), reveals
+    the phrase, opens the vaults screen and goes back to the title.
+    
+    Args:
+        rolls: Dice rolls typed per session (at least 16)
+        sessions: Sessions to run in the same app
+        size: Terminal size
+        
+    Returns:
+        Latency samples in ms by metric: "keystroke", "roll" (the Enter that
+        offers a roll) and "transition:<From>-><To>" per screen change
+    """
+    if rolls < 16:
+        raise ValueError("A dice session needs at least 16 rolls")
+    app = DungeonWalletsApp()
+    async with app.run_test(size=size) as pilot:
+        probe = UiLatencyProbe(pilot)
+        await probe.settle(TitleScreen)
+        for _ in range(sessions):
+            await probe.transition("enter", ModeSelectScreen)
+            await probe.transition("1", DiceRitualScreen)
+            for i in range(rolls):
+                if i < rolls - 16:
+                    d20, d100 = 19 + i % 2, i % 100          # N >= 1800: cursed
+                else:
+                    d20, d100 = 1 + i % 17, (7 * i) % 100    # N < 1700: blessed
+                await probe.type(str(d20))
+                await probe.key("enter")
+                await probe.type(str(d100))
+                if i < rolls - 1:
+                    await probe.key("enter", "roll")
+                else:
+                    await probe.transition("enter", RevealScreen)
+            await probe.type("REVELER")
+            await probe.press_button("#btn-export", ExportPublicScreen)
+            await probe.transition("escape", RevealScreen)
+            await probe.press_button("#btn-done", TitleScreen)
+    return probe.samples
+
+
+def compare_latencies(summary: dict, baseline: dict, tolerance: float = 0.5) -> List[str]:
+    """Regressions: metrics whose p50 or p99 exceeds the baseline by more than tolerance"""
+    regressions = []
+    for metric, stats in summary.items():
+        base = baseline.get(metric)
+        if base is None:
+            continue
+        for key in ("p50", "p99"):
+            if stats[key] > base[key] * (1 + tolerance):
+                regressions.append(f"{metric} {key} {stats[key]:.1f} ms > baseline {base[key]:.1f} ms")
+    return regressions
+
+
 # ============================================================================
 # ENTRY POINT
 # ============================================================================
 
+def run_vanity_headless(args: argparse.Namespace) -> int:
+    """Vanity search without the TUI, printing the result as JSON"""
+    wordlist = get_wordlist()
+    search = VanitySearch(
+        wordlist,
+        chain=args.chain,
+        prefix=args.prefix,
+        suffix=args.suffix,
+        entropy_bytes=32 if args.words == 24 else 16,
+        workers=args.workers,
+    )
+    print(
+        f"Searching {args.chain.upper()} prefix={search.prefix!r} suffix={search.suffix!r} "
+        f"on {search.workers} workers, ~{search.difficulty:.0f} attempts expected",
+        file=sys.stderr,
+    )
+    
+    search.start()
+    try:
+        while search.wait(timeout=2.0) is None and search.is_running:
+            print(f"  {search.attempts} attempts, {search.rate:.0f}/s", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("Cancelled.", file=sys.stderr)
+        return 130
+    finally:
+        search.cancel()
+    
+    result = search.result
+    if result is None:
+        return 1
+    
+    print(json.dumps({
+        "chain": result.wallet.chain,
+        "address": result.wallet.address,
+        "path": result.wallet.path,
+        "explorer_url": result.wallet.explorer_url,
+        "mnemonic": result.mnemonic,
+        "entropy_hex": result.entropy_hex,
+        "attempts": result.attempts,
+        "elapsed_seconds": round(result.elapsed, 3),
+        "attempts_per_second": round(result.rate, 1),
+        "difficulty": search.difficulty,
+    }, indent=2))
+    return 0
+
+
+def run_batch_headless(args: argparse.Namespace) -> int:
+    """Stream a batch of independent wallets to a JSON Lines or CSV file"""
+    wordlist = get_wordlist(args.language)
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    
+    def progress(done: int, elapsed: float) -> None:
+        rate = done / elapsed if elapsed > 0 else 0.0
+        print(f"\r  {done}/{args.count} wallets, {rate:.1f}/s", end="", file=sys.stderr)
+    
+    with open(args.output, "w", encoding="utf-8", newline="") as out:
+        stats = generate_wallet_batch(
+            args.count,
+            out,
+            wordlist,
+            fmt=fmt,
+            public_only=args.public_only,
+            entropy_bytes=32 if args.words == 24 else 16,
+            workers=args.workers,
+            progress=progress,
+        )
+    
+    print(
+        f"\n{stats.wallets} wallets written to {args.output} in {stats.elapsed:.1f}s "
+        f"({stats.rate:.1f} wallets/s on {stats.workers} workers)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def run_watch_headless(args: argparse.Namespace) -> int:
+    """Derive addresses from an account xpub, without mnemonic or PBKDF2"""
+    wallets = derive_watch_only_wallets(
+        args.xpub,
+        args.chain,
+        start=args.start,
+        count=args.count,
+        change=1 if args.change else 0,
+    )
+    if args.json:
+        print(json.dumps([wallet.__dict__ for wallet in wallets], indent=2))
+    else:
+        for wallet in wallets:
+            print(f"{wallet.path}\t{wallet.address}")
+    return 0
+
+
+def run_verify_headless(args: argparse.Namespace) -> int:
+    """Verify a JSON Lines file of signed messages; exit 1 if any fails"""
+    with open(args.file) as f:
+        results, stats = verify_message_file(f, workers=args.workers)
+    
+    if args.json:
+        print(json.dumps({
+            "results": [result.__dict__ for result in results],
+            "stats": {**stats.__dict__, "rate": stats.rate},
+        }, indent=2))
+    else:
+        for result in results:
+            if result.error:
+                print(f"line {result.line}: error: {result.error}")
+            elif not result.valid:
+                print(f"line {result.line}: INVALID {result.address}")
+        print(
+            f"{stats.valid} valid, {stats.invalid} invalid, {stats.errors} errors "
+            f"({stats.checked} checked in {stats.elapsed:.1f}s, {stats.rate:.0f}/s)",
+            file=sys.stderr,
+        )
+    return 0 if stats.valid == stats.checked else 1
+
+
+def run_audit_headless(args: argparse.Namespace) -> int:
+    """Stream-audit a file of mnemonics; exit 1 if any line fails"""
+    report = open(args.report, "w", encoding="utf-8") if args.report else None
+    
+    def on_issue(issue: AuditIssue) -> None:
+        if report is not None:
+            report.write(json.dumps(issue.__dict__) + "\n")
+        elif not args.json:
+            # Clear the progress line first when stdout and stderr share the terminal
+            print("\r\033[K", end="", file=sys.stderr, flush=True)
+            print(f"line {issue.line}: {issue.kind}: {issue.message}", flush=True)
+    
+    def progress(stats) -> None:
+        print(f"\r  {stats.checked} lines, {stats.rate:.0f}/s", end="", file=sys.stderr, flush=True)
+    
+    try:
+        with open(args.file, encoding="utf-8") as f:
+            stats = audit_mnemonic_file(
+                f,
+                chain=args.derive,
+                derive_every=args.every,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                on_issue=on_issue,
+                progress=None if args.json else progress,
+            )
+    finally:
+        if report is not None:
+            report.close()
+    
+    if args.json:
+        print(json.dumps({**stats.__dict__, "invalid": stats.invalid, "rate": stats.rate}, indent=2))
+    else:
+        languages = ", ".join(f"{language} {count}" for language, count in stats.languages.items())
+        issues = ", ".join(f"{kind} {count}" for kind, count in stats.issues.items())
+        print(
+            f"\n{stats.valid} valid, {stats.invalid} invalid ({issues or 'no issues'}); "
+            f"{stats.checked} lines in {stats.elapsed:.1f}s ({stats.rate:.0f}/s)"
+            + (f"; languages: {languages}" if languages else "")
+            + (f"; {stats.derived} addresses derived" if args.derive else "")
+            + (f"; issues written to {args.report}" if args.report else ""),
+            file=sys.stderr,
+        )
+    return 0 if stats.invalid == 0 else 1
+
+
+def run_seedqr(args: argparse.Namespace) -> int:
+    """Encode a mnemonic read from stdin as a SeedQR matrix, or decode a matrix file"""
+    if args.action == "decode":
+        if not args.file:
+            raise ValueError("decode needs a matrix file")
+        print(load_seedqr_file(args.file))
+        return 0
+    
+    mnemonic = " ".join(sys.stdin.read().split())
+    modules = seedqr_encode(mnemonic, compact=not args.standard)
+    matrix = format_qr_matrix(modules)
+    if args.file:
+        with open(args.file, "w", encoding="utf-8") as f:
+            f.write(matrix)
+    else:
+        sys.stdout.write(matrix)
+    size = len(modules)
+    print(
+        f"{'SeedQR' if args.standard else 'CompactSeedQR'} version {(size - 17) // 4} ({size}x{size})"
+        + (f" written to {args.file}" if args.file else ""),
+        file=sys.stderr,
+    )
+    return 0
+
+
+def run_backends_report(args: argparse.Namespace) -> int:
+    """Show the crypto backend picked for each operation in this process"""
+    report = backend_report()
+    if args.json:
+        print(json.dumps([choice.__dict__ for choice in report], indent=2))
+        return 0
+    for choice in report:
+        others = ", ".join(
+            f"{name} {'failed' if t is None else f'{t * 1e6:.1f}µs'}"
+            for name, t in choice.candidates.items()
+        )
+        print(f"{choice.operation:<18} {choice.backend:<13} ({others})")
+    return 0
+
+
+def run_dice_simulation(args: argparse.Namespace) -> int:
+    """Compare dice setups by simulated rolls per ceremony; exit 1 if theory disagrees"""
+    schemes = [DICE_SCHEMES.get(spec) or parse_dice_scheme(spec) for spec in args.scheme or DICE_SCHEMES]
+    sessions = args.sessions or (1_000_000 if HAS_NUMPY else 20_000)
+    reference_ok = reference_scheme_agrees()
+    results = [
+        simulate_dice_scheme(scheme, entropy_bytes, sessions, seed=args.seed)
+        for scheme in schemes
+        for entropy_bytes in args.bytes
+    ]
+    ok = reference_ok and all(result.acceptance_ok for result in results)
+    
+    if args.json:
+        print(json.dumps({
+            "reference_scheme_agrees": reference_ok,
+            "results": [{**result.__dict__, "rate": result.rate, "acceptance_ok": result.acceptance_ok}
+                        for result in results],
+        }, indent=2))
+        return 0 if ok else 1
+    
+    print(f"{'scheme':<10} {'bytes':>5} {'bits':>4} {'accept':>15} {'mean':>14} "
+          f"{'p95':>7} {'p99':>7} {'dice/session':>12}")
+    for r in results:
+        print(
+            f"{r.scheme:<10} {r.entropy_bytes:>5} {r.bits:>4} "
+            f"{r.acceptance:>6.4f}/{r.expected_acceptance:.4f}{'' if r.acceptance_ok else '!'} "
+            f"{r.mean_rolls:>6.2f}/{r.expected_mean:<7.2f} "
+            f"{r.p95_rolls:>3}/{r.expected_p95:<3} {r.p99_rolls:>3}/{r.expected_p99:<3} "
+            f"{r.mean_rolls * r.dice:>12.1f}"
+        )
+    elapsed = sum(r.elapsed for r in results)
+    print(
+        f"simulated/theory; {sessions} sessions per row on {results[0].backend} "
+        f"({len(results) * sessions / elapsed:,.0f} sessions/s); "
+        f"d20+d100 matches process_dice_roll: {'yes' if reference_ok else 'NO'}",
+        file=sys.stderr,
+    )
+    return 0 if ok else 1
+
+
+def run_ui_benchmark(args: argparse.Namespace) -> int:
+    """Headless UI latency benchmark; exit 1 on a regression against the baseline"""
+    samples = asyncio.run(benchmark_ui(rolls=args.rolls, sessions=args.sessions))
+    summary = summarize_latencies(samples)
+    
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        import textual
+        baseline_path.write_text(json.dumps({
+            "textual": textual.__version__,
+            "rolls": args.rolls,
+            "sessions": args.sessions,
+            "metrics": summary,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline saved to {baseline_path}", file=sys.stderr)
+        regressions = []
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["metrics"]
+        regressions = compare_latencies(summary, baseline, args.tolerance)
+    else:
+        baseline = {}
+        regressions = []
+    
+    if args.json:
+        print(json.dumps({"metrics": summary, "regressions": regressions}, indent=2))
+    else:
+        for metric, stats in summary.items():
+            base = {} if args.save_baseline else baseline.get(metric, {})
+            against = f"  (baseline {base['p50']:.1f} / {base['p99']:.1f})" if base else ""
+            print(f"{metric:<46} n={stats['count']:<5} p50 {stats['p50']:7.1f} ms  "
+                  f"p99 {stats['p99']:7.1f} ms{against}")
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def run_service(args: argparse.Namespace) -> int:
+    """Serve the core API on a Unix socket until SIGINT/SIGTERM"""
+    async def serve() -> WalletService:
+        service = WalletService(args.socket, workers=args.workers)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        async with service:
+            print(
+                f"Serving {', '.join(SERVICE_METHODS)} on {args.socket} "
+                f"with {service.workers} workers (Ctrl+C to stop)",
+                file=sys.stderr,
+            )
+            await stop.wait()
+        return service
+    
+    stats = asyncio.run(serve()).stats
+    print(
+        f"Stopped: {stats.requests} requests ({stats.errors} errors) "
+        f"over {stats.connections} connections",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line parser; no subcommand starts the TUI"""
+    parser = argparse.ArgumentParser(description="Dungeon & Wallets - BIP39 mnemonic generator")
+    commands = parser.add_subparsers(dest="command")
+    
+    vanity = commands.add_parser("vanity", help="Headless vanity address search (JSON output)")
+    vanity.add_argument("--chain", choices=sorted(VANITY_CHAINS), default="btc")
+    vanity.add_argument("--prefix", default="", help="Wanted address prefix (case-insensitive)")
+    vanity.add_argument("--suffix", default="", help="Wanted address suffix (case-insensitive)")
+    vanity.add_argument("--words", type=int, choices=(12, 24), default=12)
+    vanity.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    vanity.set_defaults(handler=run_vanity_headless)
+    
+    batch = commands.add_parser("batch", help="Generate many wallets, streamed to JSON Lines or CSV")
+    batch.add_argument("count", type=int, help="Number of wallets")
+    batch.add_argument("-o", "--output", required=True, help="Output file (.jsonl or .csv)")
+    batch.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                       help="Output format (default: from the file extension)")
+    batch.add_argument("--public-only", action="store_true", help="Omit mnemonics and entropy")
+    batch.add_argument("--words", type=int, choices=(12, 24), default=12)
+    batch.add_argument("--language", choices=BIP39_LANGUAGES, default="english",
+                       help="Mnemonic wordlist language")
+    batch.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    batch.set_defaults(handler=run_batch_headless)
+    
+    watch = commands.add_parser("watch", help="Derive addresses from an account xpub (watch-only)")
+    watch.add_argument("xpub", help="Account extended public key (xpub/ypub/zpub)")
+    watch.add_argument("--chain", choices=sorted(CHAIN_ALIASES), default="btc")
+    watch.add_argument("--start", type=int, default=0, help="First address index")
+    watch.add_argument("--count", type=int, default=10, help="Number of addresses")
+    watch.add_argument("--change", action="store_true", help="Change addresses instead of receive")
+    watch.add_argument("--json", action="store_true", help="JSON output")
+    watch.set_defaults(handler=run_watch_headless)
+    
+    verify = commands.add_parser("verify", help="Verify signed messages (JSON Lines: address, message, signature)")
+    verify.add_argument("file", help="Signature file, e.g. preuves_de_possession.jsonl")
+    verify.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    verify.add_argument("--json", action="store_true", help="JSON output")
+    verify.set_defaults(handler=run_verify_headless)
+    
+    audit = commands.add_parser("audit", help="Re-verify a file of mnemonics (one per line, or batch JSON Lines)")
+    audit.add_argument("file", help="Mnemonic archive, e.g. coffres.jsonl")
+    audit.add_argument("--report", default=None, help="Write failing lines to this JSON Lines file")
+    audit.add_argument("--derive", choices=sorted(CHAIN_ALIASES), default=None,
+                       help="Also derive the first address of this chain (checked against batch records)")
+    audit.add_argument("--every", type=int, default=1, help="With --derive, only derive on every Nth line")
+    audit.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    audit.add_argument("--chunk-size", type=int, default=256, help="Lines per worker message")
+    audit.add_argument("--json", action="store_true", help="JSON summary (failing lines only go to --report)")
+    audit.set_defaults(handler=run_audit_headless)
+    
+    seedqr = commands.add_parser("seedqr", help="SeedQR matrix of a mnemonic (stdin), or mnemonic of a matrix file")
+    seedqr.add_argument("action", choices=("encode", "decode"))
+    seedqr.add_argument("file", nargs="?", default=None,
+                        help="Matrix file to decode, or to write when encoding (default: stdout)")
+    seedqr.add_argument("--standard", action="store_true",
+                        help="Standard SeedQR (4 digits per word) instead of CompactSeedQR (raw entropy)")
+    seedqr.set_defaults(handler=run_seedqr)
+    
+    backends = commands.add_parser("backends", help="Show the crypto backend selected for each operation")
+    backends.add_argument("--json", action="store_true", help="JSON output")
+    backends.set_defaults(handler=run_backends_report)
+    
+    dice_sim = commands.add_parser("dice-sim", help="Monte Carlo rolls per ceremony for dice setups")
+    dice_sim.add_argument("--scheme", action="append",
+                          help=f"Dice setup, e.g. 3d6, d10x4 (repeatable; default: {', '.join(DICE_SCHEMES)})")
+    dice_sim.add_argument("--bytes", type=int, nargs="+", default=[16, 32], help="Entropy sizes (16, 32)")
+    dice_sim.add_argument("--sessions", type=int, default=None,
+                          help="Sessions per setup (default: 1000000 with NumPy, 20000 without)")
+    dice_sim.add_argument("--seed", type=int, default=None, help="RNG seed for reproducible runs")
+    dice_sim.add_argument("--json", action="store_true", help="JSON output")
+    dice_sim.set_defaults(handler=run_dice_simulation)
+    
+    bench_ui = commands.add_parser("bench-ui", help="Headless UI latency benchmark (p50/p99 per key and screen)")
+    bench_ui.add_argument("--rolls", type=int, default=100, help="Dice rolls typed per session")
+    bench_ui.add_argument("--sessions", type=int, default=3, help="Full sessions to script")
+    bench_ui.add_argument("--baseline", default=str(UI_BASELINE_PATH), help="Baseline JSON file")
+    bench_ui.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    bench_ui.add_argument("--tolerance", type=float, default=0.5,
+                          help="Allowed slowdown over the baseline (0.5 = +50%%)")
+    bench_ui.add_argument("--json", action="store_true", help="JSON output")
+    bench_ui.set_defaults(handler=run_ui_benchmark)
+    
+    serve = commands.add_parser("serve", help="Serve generate/validate/derive/recover as JSON lines on a Unix socket")
+    serve.add_argument("--socket", default="dw.sock", help="Unix socket path (created with mode 0600)")
+    serve.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    serve.set_defaults(handler=run_service)
+    
+    return parser
+
+
 def main():
     """Main entry point"""
     # Check for required files
     if not WORDLIST_PATH.exists():
         print(f"❌ Error: Wordlist file not found at {WORDLIST_PATH}")
-        print("   Please ensure 'english.txt' is in the same directory.")
+        print("   Please ensure the BIP39 wordlists (english.txt, ...) are in the same directory.")
         sys.exit(1)
     
+    args = build_parser().parse_args()
+    if args.command is not None:
+        try:
+            sys.exit(args.handler(args))
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(2)
+    
     app = DungeonWalletsApp()
     app.run()
 
@@ -0,0 +1,20 @@
+"""Reference addresses of the "abandon ... about" mnemonic (BIP44/49/84/86)"""
+
+import pytest
+
+from core import derive_wallet_info
+
+ABANDON = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+
+@pytest.mark.parametrize("chain, path, address", [
+    ("btc", "m/44'/0'/0'/0/0", "1LqBGSKuX5yYUonjxT5qGfpUsXKYYWeabA"),
+    ("btc-p2sh", "m/49'/0'/0'/0/0", "37VucYSaXLCAsxYyAPfbSi9eh4iEcbShgf"),
+    ("btc-segwit", "m/84'/0'/0'/0/0", "bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu"),
+    ("btc-taproot", "m/86'/0'/0'/0/0", "bc1p5cyxnuxmeuwuvkwfem96lqzszd02n6xdcjrs20cac6yqjjwudpxqkedrcr"),
+    ("eth", "m/44'/60'/0'/0/0", "0x9858EfFD232B4033E47d90003D41EC34EcaEda94"),
+])
+def test_reference_addresses(chain, path, address):
+    (wallet,) = derive_wallet_info(ABANDON, [chain])
+    assert wallet.path == path
+    assert wallet.address == address
@@ -0,0 +1,39 @@
+"""Streaming mnemonic audit"""
+
+import json
+
+from core import audit_mnemonic_file
+
+ABANDON = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+
+def _audit(lines, **kwargs):
+    issues = []
+    stats = audit_mnemonic_file(lines, workers=1, on_issue=issues.append, **kwargs)
+    return stats, [(issue.line, issue.kind) for issue in issues]
+
+
+def test_issue_kinds():
+    lines = [
+        ABANDON,
+        ABANDON.replace("about", "abandon"),
+        ABANDON.replace("about", "dragonfly"),
+        json.dumps({"mnemonic": None}),
+        json.dumps({"mnemonic": 5}),
+        "",
+        json.dumps({"mnemonic": ABANDON}),
+    ]
+    stats, issues = _audit(lines)
+    assert issues == [(2, "checksum"), (3, "unknown_word"), (4, "format"), (5, "format")]
+    assert (stats.checked, stats.valid, stats.invalid) == (6, 2, 4)
+    assert stats.languages == {"english": 2}
+
+
+def test_derive_address_mismatch():
+    lines = [
+        json.dumps({"mnemonic": ABANDON, "btc_segwit_address": "bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu"}),
+        json.dumps({"mnemonic": ABANDON, "btc_segwit_address": "bc1qnjg0jd8228aq7egyzacy8cys3knf9xvrerkf9g"}),
+    ]
+    stats, issues = _audit(lines, chain="btc-segwit")
+    assert issues == [(2, "address_mismatch")]
+    assert (stats.valid, stats.derived) == (1, 2)
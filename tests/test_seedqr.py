@@ -0,0 +1,88 @@
+"""SeedQR / CompactSeedQR and the QR codec behind them"""
+
+import pytest
+
+from core import (
+    compact_seedqr_bytes,
+    entropy_to_mnemonic,
+    format_qr_matrix,
+    get_wordlist,
+    parse_qr_matrix,
+    qr_decode,
+    seedqr_digits,
+    seedqr_encode,
+    seedqr_to_mnemonic,
+)
+
+ABANDON = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+
+@pytest.mark.parametrize("entropy", [bytes(16), bytes(range(32)), bytes([0xFF] * 16)])
+@pytest.mark.parametrize("compact", [True, False])
+def test_round_trip(entropy, compact):
+    mnemonic = entropy_to_mnemonic(entropy, get_wordlist("english"))
+    modules = seedqr_encode(mnemonic, compact=compact)
+    text = format_qr_matrix(modules)
+    assert seedqr_to_mnemonic(qr_decode(parse_qr_matrix(text))) == mnemonic
+
+
+def test_compact_versions():
+    assert len(seedqr_encode(ABANDON, compact=True)) == 21
+    assert len(seedqr_encode(ABANDON, compact=False)) == 25
+
+
+def test_non_english_rejected():
+    spanish = entropy_to_mnemonic(bytes(range(16)), get_wordlist("spanish"))
+    with pytest.raises(ValueError):
+        seedqr_digits(spanish)
+    with pytest.raises(ValueError):
+        compact_seedqr_bytes(spanish)
+    with pytest.raises(ValueError):
+        seedqr_encode(spanish)
+    with pytest.raises(ValueError):
+        seedqr_digits(ABANDON, get_wordlist("french"))
+    with pytest.raises(ValueError):
+        seedqr_to_mnemonic(compact_seedqr_bytes(ABANDON), get_wordlist("spanish"))
+
+
+def test_seedsigner_vector():
+    # SeedQR specification example (12 words)
+    mnemonic = "forum undo fragile fade shy sign arrest garment culture tube off merit"
+    digits = "073318950739065415961602009907670428187212261116"
+    assert seedqr_digits(mnemonic) == digits
+    assert seedqr_to_mnemonic(digits) == mnemonic
+    assert seedqr_to_mnemonic(qr_decode(seedqr_encode(mnemonic, compact=False))) == mnemonic
+    assert seedqr_to_mnemonic(compact_seedqr_bytes(mnemonic)) == mnemonic
+
+
+def _reference_matrix(qrcode, data, mode, level, mask):
+    qr = qrcode.QRCode(error_correction=level, border=0, mask_pattern=mask)
+    qr.add_data(qrcode.util.QRData(data, mode=mode))
+    qr.make(fit=True)
+    return qr.version, qr.get_matrix()
+
+
+@pytest.mark.parametrize("level", ["L", "M", "Q", "H"])
+@pytest.mark.parametrize("mask", range(8))
+def test_decodes_qrcode_package_matrices(level, mask):
+    qrcode = pytest.importorskip("qrcode")
+    levels = {
+        "L": qrcode.constants.ERROR_CORRECT_L,
+        "M": qrcode.constants.ERROR_CORRECT_M,
+        "Q": qrcode.constants.ERROR_CORRECT_Q,
+        "H": qrcode.constants.ERROR_CORRECT_H,
+    }
+    digits = seedqr_digits(ABANDON)
+    payloads = [
+        (digits, qrcode.util.MODE_NUMBER, digits),
+        (compact_seedqr_bytes(ABANDON), qrcode.util.MODE_8BIT_BYTE, compact_seedqr_bytes(ABANDON)),
+        (b"dungeon", qrcode.util.MODE_8BIT_BYTE, b"dungeon"),
+    ]
+    decoded = 0
+    for data, mode, expected in payloads:
+        version, matrix = _reference_matrix(qrcode, data, mode, levels[level], mask)
+        if version > 4:
+            continue
+        assert qr_decode(matrix) == expected
+        decoded += 1
+    assert decoded
@@ -0,0 +1,76 @@
+"""ECDSA signing (RFC 6979), BIP-137 / EIP-191 messages and batch verification"""
+
+import base64
+import hashlib
+import json
+
+import pytest
+
+from core import (
+    ecdsa_sign,
+    ecdsa_verify,
+    private_key_to_public_key,
+    recover_public_key,
+    sign_message,
+    verify_message,
+    verify_message_file,
+)
+
+KEY = bytes.fromhex("e8f32e723decf4051aefac8e2c93c9c5b214313817cdb01a1494b917c8436b35")
+MESSAGE = "Dungeon & Wallets proof of ownership"
+
+
+def test_rfc6979_vector():
+    # Private key 1, SHA-256("Satoshi Nakamoto"), low-S
+    r, s, recid = ecdsa_sign((1).to_bytes(32, 'big'), hashlib.sha256(b"Satoshi Nakamoto").digest())
+    assert r == 0x934b1ea10a4b3c1757e2b0c017d0b6143ce3c9a7e6a4a49860d7a6ab210ee3d8
+    assert s == 0x2442ce9d2b916064108014783e923ec36b49743e2ffa1c4496f01a512aafd9e5
+    assert recover_public_key(
+        hashlib.sha256(b"Satoshi Nakamoto").digest(), r, s, recid
+    ) == private_key_to_public_key((1).to_bytes(32, 'big'))
+
+
+def test_ecdsa_verify():
+    digest = hashlib.sha256(MESSAGE.encode()).digest()
+    r, s, _ = ecdsa_sign(KEY, digest)
+    public_key = private_key_to_public_key(KEY)
+    assert ecdsa_verify(public_key, digest, r, s)
+    assert not ecdsa_verify(public_key, hashlib.sha256(b"other").digest(), r, s)
+
+
+@pytest.mark.parametrize("chain, headers", [
+    ("btc", range(31, 35)),
+    ("btc-p2sh", range(35, 39)),
+    ("btc-segwit", range(39, 43)),
+    ("eth", None),
+])
+def test_sign_verify_round_trip(chain, headers):
+    signed = sign_message(KEY, MESSAGE, chain)
+    if headers is not None:
+        assert base64.b64decode(signed.signature)[0] in headers
+    assert verify_message(signed.address, MESSAGE, signed.signature)
+    assert not verify_message(signed.address, MESSAGE + ".", signed.signature)
+
+
+def test_eth_address_of_key_one():
+    signed = sign_message((1).to_bytes(32, 'big'), MESSAGE, "eth")
+    assert signed.address == "0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf"
+
+
+def test_verify_file_reports_malformed_lines():
+    signed = sign_message(KEY, MESSAGE, "btc-segwit")
+    good = {"address": signed.address, "message": MESSAGE, "signature": signed.signature}
+    lines = [
+        json.dumps(good),
+        json.dumps({**good, "message": MESSAGE + "!"}),
+        json.dumps({**good, "address": 123}),
+        json.dumps({**good, "message": None}),
+        json.dumps({**good, "signature": "not base64"}),
+        "not json",
+        "",
+        json.dumps({"address": signed.address}),
+    ]
+    results, stats = verify_message_file(lines, workers=1)
+    assert [r.line for r in results] == [1, 2, 3, 4, 5, 6, 8]
+    assert [r.valid for r in results] == [True] + [False] * 6
+    assert (stats.checked, stats.valid, stats.invalid, stats.errors) == (7, 1, 1, 5)